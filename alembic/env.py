@@ -55,6 +55,16 @@ def get_url():
     return url
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave schema the models don't map out of autogenerate"""
+    # Full-text search vectors and their GIN indexes (src/models/content.py)
+    # and user name trigram indexes (src/models/user.py)
+    if reflected and compare_to is None and name:
+        if "search_vector" in name or name.endswith("_trgm"):
+            return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -75,6 +85,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -103,6 +114,7 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            include_object=include_object,
         )
 
         with context.begin_transaction():
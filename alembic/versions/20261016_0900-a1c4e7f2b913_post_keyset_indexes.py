@@ -0,0 +1,45 @@
+"""post_keyset_indexes
+
+Revision ID: a1c4e7f2b913
+Revises: 2963c4558295
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c4e7f2b913'
+down_revision: Union[str, Sequence[str], None] = '2963c4558295'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, leading columns, sort column) for PostService keyset pagination
+POST_KEYSET_INDEXES = [
+    ("idx_posts_status_created_at_id", ["status"], "created_at"),
+    ("idx_posts_status_like_count_id", ["status"], "like_count"),
+    ("idx_posts_status_last_activity_id", ["status"], "last_activity_at"),
+    ("idx_posts_status_comment_count_id", ["status"], "comment_count"),
+    ("idx_posts_channel_status_created_at_id", ["channel_id", "status"], "created_at"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, leading, sort_column in POST_KEYSET_INDEXES:
+        op.create_index(
+            name,
+            "posts",
+            [*leading, sa.text(f"{sort_column} DESC"), sa.text("id DESC")],
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, _, _ in POST_KEYSET_INDEXES:
+        op.drop_index(name, table_name="posts", if_exists=True)
@@ -0,0 +1,47 @@
+"""post_hot_score
+
+Revision ID: 5d8e2b6c4a17
+Revises: a1c4e7f2b913
+Create Date: 2026-10-16 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e2b6c4a17'
+down_revision: Union[str, Sequence[str], None] = 'a1c4e7f2b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "posts",
+        sa.Column("hot_score", sa.Float(), nullable=False, server_default="0"),
+    )
+    # Seed scores with the same formula as src.core.ranking (default settings);
+    # the background refresh converges them to the configured values.
+    op.execute(
+        """
+        UPDATE posts
+        SET hot_score = (like_count + 2.0 * comment_count + 1)
+            / power(extract(epoch FROM (now() at time zone 'utc') - created_at) / 3600 + 2, 1.8)
+        """
+    )
+    op.create_index(
+        "idx_posts_status_hot_score_id",
+        "posts",
+        ["status", sa.text("hot_score DESC"), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_posts_status_hot_score_id", table_name="posts", if_exists=True)
+    op.drop_column("posts", "hot_score")
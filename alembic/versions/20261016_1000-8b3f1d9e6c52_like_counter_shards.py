@@ -0,0 +1,36 @@
+"""like_counter_shards
+
+Revision ID: 8b3f1d9e6c52
+Revises: 5d8e2b6c4a17
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b3f1d9e6c52'
+down_revision: Union[str, Sequence[str], None] = '5d8e2b6c4a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "like_counter_shards",
+        sa.Column("target_type", sa.String(length=10), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=False),
+        sa.Column("slot", sa.Integer(), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("target_type", "target_id", "slot"),
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("like_counter_shards", if_exists=True)
@@ -0,0 +1,67 @@
+"""user_contribution_stats
+
+Revision ID: e7a3c5d9b142
+Revises: c4e9a7b2d815
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3c5d9b142'
+down_revision: Union[str, Sequence[str], None] = 'c4e9a7b2d815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user_contribution_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("post_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("contribution_score", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_user_contribution_stats_score",
+        "user_contribution_stats",
+        [sa.text("contribution_score DESC"), "user_id"],
+        if_not_exists=True,
+    )
+
+    # Backfill from the content tables, counting posts and comments separately
+    op.execute(
+        """
+        INSERT INTO user_contribution_stats
+            (user_id, post_count, comment_count, contribution_score, updated_at)
+        SELECT user_id, SUM(posts), SUM(comments), SUM(posts) + SUM(comments), CURRENT_TIMESTAMP
+        FROM (
+            SELECT user_id, COUNT(*) AS posts, 0 AS comments
+            FROM posts WHERE status != 'DELETED' GROUP BY user_id
+            UNION ALL
+            SELECT user_id, 0 AS posts, COUNT(*) AS comments
+            FROM comments WHERE status != 'DELETED' GROUP BY user_id
+        ) AS contributions
+        GROUP BY user_id
+        ON CONFLICT (user_id) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "idx_user_contribution_stats_score",
+        table_name="user_contribution_stats",
+        if_exists=True,
+    )
+    op.drop_table("user_contribution_stats", if_exists=True)
@@ -0,0 +1,53 @@
+"""user point totals
+
+Revision ID: f2b8d4e6a319
+Revises: e7a3c5d9b142
+Create Date: 2026-10-16 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4e6a319'
+down_revision: Union[str, Sequence[str], None] = 'e7a3c5d9b142'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in ("total_earned", "total_spent", "tx_count"):
+        op.add_column(
+            "users",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+            if_not_exists=True,
+        )
+
+    # Backfill from the ledger in one grouped scan
+    op.execute(
+        """
+        UPDATE users
+        SET total_earned = totals.earned,
+            total_spent = totals.spent,
+            tx_count = totals.tx_count
+        FROM (
+            SELECT user_id,
+                   COALESCE(SUM(amount) FILTER (WHERE amount > 0), 0) AS earned,
+                   COALESCE(-SUM(amount) FILTER (WHERE amount < 0), 0) AS spent,
+                   COUNT(*) AS tx_count
+            FROM transactions
+            GROUP BY user_id
+        ) AS totals
+        WHERE users.id = totals.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ("tx_count", "total_spent", "total_earned"):
+        op.drop_column("users", column, if_exists=True)
@@ -0,0 +1,149 @@
+"""partition transactions by month
+
+Revision ID: a9d2f6c8e415
+Revises: f2b8d4e6a319
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d2f6c8e415'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d4e6a319'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COLUMNS = (
+    "id, user_id, amount, transaction_type, description, reference_type, reference_id, "
+    "balance_after, blockchain_tx_hash, bnb_amount, created_at"
+)
+
+# Indexes created on the parent cascade to every partition
+INDEXES = [
+    ("ix_transactions_user_id", "user_id"),
+    ("ix_transactions_transaction_type", "transaction_type"),
+    ("ix_transactions_created_at", "created_at"),
+    ("idx_transactions_user_id_created_at", "user_id, created_at DESC"),
+    ("idx_transactions_type_created_at", "transaction_type, created_at"),
+]
+
+# Months created ahead of now; later ones are added by the app
+# (src/core/ledger_partitions.py)
+MONTHS_AHEAD = 3
+
+
+def _create_table(name: str, partitioned: bool) -> None:
+    primary_key = "id, created_at" if partitioned else "id"
+    op.execute(
+        f"""
+        CREATE TABLE {name} (
+            id INTEGER NOT NULL DEFAULT nextval('transactions_id_seq'),
+            user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            amount INTEGER NOT NULL,
+            transaction_type transactiontype NOT NULL,
+            description VARCHAR(500) NOT NULL,
+            reference_type VARCHAR(50),
+            reference_id INTEGER,
+            balance_after INTEGER NOT NULL,
+            blockchain_tx_hash VARCHAR(100),
+            bnb_amount NUMERIC(20, 18),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            PRIMARY KEY ({primary_key})
+        ){" PARTITION BY RANGE (created_at)" if partitioned else ""}
+        """
+    )
+
+
+def _swap_tables(partitioned: bool) -> None:
+    """Rebuild transactions with the given layout, keeping rows and ids"""
+    # Free the constraint and index names for the new table
+    op.execute("ALTER TABLE transactions RENAME TO transactions_old")
+    op.execute(
+        "ALTER TABLE transactions_old RENAME CONSTRAINT transactions_pkey TO transactions_old_pkey"
+    )
+    op.execute(
+        "ALTER TABLE transactions_old "
+        "RENAME CONSTRAINT transactions_user_id_fkey TO transactions_old_user_id_fkey"
+    )
+    for name, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+
+    _create_table("transactions", partitioned)
+    op.execute("ALTER SEQUENCE transactions_id_seq OWNED BY transactions.id")
+
+    if partitioned:
+        # One partition per month from the oldest row to MONTHS_AHEAD from
+        # now, and a default partition for anything outside them
+        op.execute(
+            f"""
+            DO $$
+            DECLARE
+                month DATE := date_trunc(
+                    'month', COALESCE((SELECT MIN(created_at) FROM transactions_old), now())
+                );
+                last_month DATE := date_trunc('month', now()) + INTERVAL '{MONTHS_AHEAD} months';
+            BEGIN
+                WHILE month <= last_month LOOP
+                    EXECUTE format(
+                        'CREATE TABLE IF NOT EXISTS %I PARTITION OF transactions '
+                        'FOR VALUES FROM (%L) TO (%L)',
+                        'transactions_y' || to_char(month, 'YYYY') || 'm' || to_char(month, 'MM'),
+                        month,
+                        month + INTERVAL '1 month'
+                    );
+                    month := month + INTERVAL '1 month';
+                END LOOP;
+            END
+            $$
+            """
+        )
+        op.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_old")
+    op.execute("DROP TABLE transactions_old")
+
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON transactions ({columns})")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "transaction_archives",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("partition_name", sa.String(length=63), nullable=False),
+        sa.Column("range_start", sa.DateTime(), nullable=False),
+        sa.Column("range_end", sa.DateTime(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("file_path", sa.String(length=500), nullable=False),
+        sa.Column("archived_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("partition_name"),
+        if_not_exists=True,
+    )
+    op.create_table(
+        "archived_point_totals",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("total_earned", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_spent", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("tx_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+        if_not_exists=True,
+    )
+
+    _swap_tables(partitioned=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Archived months stay on disk; their rows are not restored
+    _swap_tables(partitioned=False)
+
+    op.drop_table("archived_point_totals", if_exists=True)
+    op.drop_table("transaction_archives", if_exists=True)
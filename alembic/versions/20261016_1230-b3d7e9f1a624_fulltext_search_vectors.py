@@ -0,0 +1,64 @@
+"""full-text search vectors on posts and comments
+
+Revision ID: b3d7e9f1a624
+Revises: a9d2f6c8e415
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d7e9f1a624'
+down_revision: Union[str, Sequence[str], None] = 'a9d2f6c8e415'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match SEARCH_VECTORS in src/models/content.py
+SEARCH_VECTORS = {
+    "posts": (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(body, '')), 'B')"
+    ),
+    "comments": "to_tsvector('english', coalesce(body, ''))",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites the table under an exclusive
+    # lock; the indexes are then built without blocking writes
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.create_index(
+                f"idx_{table}_search_vector",
+                table,
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.drop_index(
+                f"idx_{table}_search_vector",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    for table in SEARCH_VECTORS:
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,52 @@
+"""trigram indexes on user names
+
+Revision ID: d6a1c3e8b247
+Revises: b3d7e9f1a624
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6a1c3e8b247'
+down_revision: Union[str, Sequence[str], None] = 'b3d7e9f1a624'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match USER_TRIGRAM_COLUMNS in src/models/user.py
+USER_TRIGRAM_COLUMNS = ("username", "display_name")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Built without blocking sign-ups and profile edits
+    with op.get_context().autocommit_block():
+        for column in USER_TRIGRAM_COLUMNS:
+            op.create_index(
+                f"idx_users_{column}_trgm",
+                "users",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The extension is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        for column in USER_TRIGRAM_COLUMNS:
+            op.drop_index(
+                f"idx_users_{column}_trgm",
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
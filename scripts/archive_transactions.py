@@ -0,0 +1,72 @@
+"""Archive cold months of the point ledger
+
+Creates upcoming monthly partitions of ``transactions``, then exports every
+month older than the retention window to ``{archive_dir}/{partition}.csv.gz``
+and drops it from the database. Per-user totals of archived months are kept
+in ``archived_point_totals`` so ledger reconciliation still adds up.
+
+Usage:
+    python scripts/archive_transactions.py [--keep-months 12] [--dir ./archives/transactions]
+    python scripts/archive_transactions.py --dry-run
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+
+Requires PostgreSQL with the partitioned ledger (alembic upgrade head).
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import config  # noqa: E402
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.ledger_partitions import (  # noqa: E402
+    archive_partition,
+    cold_partitions,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+)
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--keep-months", type=int, default=config.ledger.archive_after_months)
+    parser.add_argument("--dir", type=Path, default=Path(config.ledger.archive_dir))
+    parser.add_argument("--dry-run", action="store_true", help="Only list months to archive")
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        if not await is_partitioned(db):
+            print("❌ transactions is not partitioned; run alembic upgrade head on PostgreSQL")
+            return 1
+
+        for name in await ensure_partitions(db):
+            print(f"📅 Created partition {name}")
+
+        cold = cold_partitions(await list_partitions(db), keep_months=args.keep_months)
+        if not cold:
+            print(f"✅ Nothing older than {args.keep_months} months to archive")
+            return 0
+
+        for name in cold:
+            if args.dry_run:
+                print(f"   would archive {name}")
+                continue
+            print(f"📦 Archiving {name}...")
+            archive = await archive_partition(db, name, args.dir)
+            print(f"   {archive.row_count} rows -> {archive.file_path}")
+
+    print("✅ Done")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,151 @@
+"""Like throughput benchmark on a single hot post
+
+Creates one post and N liker accounts, then has every liker like the post
+concurrently through LikeService.like_post, each on its own database
+session. Reports likes/sec and checks that like_count, the likes table and
+the point ledger all agree (no lost updates). Once the post crosses
+counters.like_shard_rate_threshold, likes go to sharded counter slots.
+
+Usage:
+    python scripts/benchmark_likes.py [--likers 500] [--concurrency 50] [--keep]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+
+Run against PostgreSQL; with APP_ENVIRONMENT != production the engine uses
+NullPool, so every like also pays for a new connection.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import delete, func, select
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.like_counter import fold_like_shards  # noqa: E402
+from src.models.content import ContentStatus, Like, Post  # noqa: E402
+from src.models.points import Transaction  # noqa: E402
+from src.models.user import User, UserLevelEnum  # noqa: E402
+from src.services.like_service import LikeService  # noqa: E402
+from src.services.point_service import PointService  # noqa: E402
+
+
+async def create_fixtures(likers: int) -> tuple[int, list[int]]:
+    """Create the hot post and its likers"""
+    run_id = uuid.uuid4().hex[:8]
+
+    async with AsyncSessionLocal() as db:
+        await PointService(db).get_economy_config()
+
+        users = [
+            User(
+                email=f"bench_{run_id}_{i}@example.com",
+                username=f"bench_{run_id}_{i}",
+                points=1000,
+                level=UserLevelEnum.NEW_USER,
+                is_active=True,
+                created_at=datetime.utcnow(),
+            )
+            for i in range(likers + 1)
+        ]
+        db.add_all(users)
+        await db.flush()
+
+        post = Post(
+            user_id=users[0].id,
+            title=f"Benchmark post {run_id}",
+            body="Hot post used by the like benchmark",
+            body_html="Hot post used by the like benchmark",
+            status=ContentStatus.ACTIVE,
+        )
+        db.add(post)
+        await db.commit()
+
+        return post.id, [user.id for user in users]
+
+
+async def run(post_id: int, liker_ids: list[int], concurrency: int) -> tuple[float, int]:
+    """Like the post once per liker, at most `concurrency` at a time"""
+    semaphore = asyncio.Semaphore(concurrency)
+    errors = 0
+
+    async def like(user_id: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                try:
+                    await LikeService(db).like_post(post_id, user_id)
+                except Exception as e:
+                    errors += 1
+                    print(f"   like by {user_id} failed: {e}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(like(user_id) for user_id in liker_ids))
+    return time.perf_counter() - start, errors
+
+
+async def verify(post_id: int, likers: int) -> bool:
+    """Check counters, rows and ledger agree"""
+    async with AsyncSessionLocal() as db:
+        # Likes past the shard threshold sit in counter slots until folded
+        await fold_like_shards(db)
+        like_count = await db.scalar(select(Post.like_count).where(Post.id == post_id))
+        like_rows = await db.scalar(
+            select(func.count()).select_from(Like).where(Like.post_id == post_id)
+        )
+        ledger_rows = await db.scalar(
+            select(func.count())
+            .select_from(Transaction)
+            .where(Transaction.reference_type == "post", Transaction.reference_id == post_id)
+        )
+
+    print(f"   like_count={like_count} like rows={like_rows} ledger rows={ledger_rows}")
+    return like_count == like_rows == likers and ledger_rows == 2 * likers
+
+
+async def cleanup(post_id: int, user_ids: list[int]) -> None:
+    """Remove everything the benchmark created"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Like).where(Like.post_id == post_id))
+        await db.execute(delete(Transaction).where(Transaction.user_id.in_(user_ids)))
+        await db.execute(delete(Post).where(Post.id == post_id))
+        await db.execute(delete(User).where(User.id.in_(user_ids)))
+        await db.commit()
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--likers", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark rows")
+    args = parser.parse_args()
+
+    print(f"🔥 Creating hot post and {args.likers} likers...")
+    post_id, user_ids = await create_fixtures(args.likers)
+
+    try:
+        print(f"🚀 Liking post {post_id} with concurrency {args.concurrency}...")
+        elapsed, errors = await run(post_id, user_ids[1:], args.concurrency)
+        succeeded = args.likers - errors
+        print(f"   {succeeded} likes in {elapsed:.2f}s = {succeeded / elapsed:.1f} likes/sec")
+
+        consistent = await verify(post_id, succeeded)
+        print("✅ Consistent" if consistent else "❌ Lost or duplicated updates")
+        return 0 if consistent and not errors else 1
+    finally:
+        if not args.keep:
+            await cleanup(post_id, user_ids)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,172 @@
+"""Point ledger concurrency benchmark
+
+Creates a handful of accounts and fires many concurrent
+PointService.create_transaction calls at them, each on its own database
+session, with a mix of credits and debits large enough to hit the
+no-overdraft guard. Reports transactions/sec and checks, per account, that
+no update was lost:
+
+    points == starting balance + sum(ledger amounts)
+    points >= 0
+    latest ledger balance_after == points
+
+Usage:
+    python scripts/benchmark_points.py [--users 5] [--transactions 5000] [--concurrency 100]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+
+Run against PostgreSQL; SQLite serialises writers and hides row-lock contention.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import delete, desc, func, select
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.exceptions import InsufficientBalanceError  # noqa: E402
+from src.models.points import Transaction, TransactionType  # noqa: E402
+from src.models.user import User, UserLevelEnum  # noqa: E402
+from src.services.point_service import PointService  # noqa: E402
+
+STARTING_POINTS = 100
+
+
+async def create_users(count: int) -> list[int]:
+    """Create the accounts under test"""
+    run_id = uuid.uuid4().hex[:8]
+
+    async with AsyncSessionLocal() as db:
+        users = [
+            User(
+                email=f"bench_points_{run_id}_{i}@example.com",
+                username=f"bench_points_{run_id}_{i}",
+                points=STARTING_POINTS,
+                level=UserLevelEnum.NEW_USER,
+                is_active=True,
+                created_at=datetime.utcnow(),
+            )
+            for i in range(count)
+        ]
+        db.add_all(users)
+        await db.commit()
+
+        return [user.id for user in users]
+
+
+async def run(user_ids: list[int], transactions: int, concurrency: int) -> tuple[float, int, int]:
+    """Fire random credits/debits, at most `concurrency` at a time"""
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+    errors = 0
+
+    async def transact(user_id: int, amount: int) -> None:
+        nonlocal rejected, errors
+        async with semaphore:
+            async with AsyncSessionLocal() as db:
+                try:
+                    await PointService(db).create_transaction(
+                        user_id=user_id,
+                        amount=amount,
+                        transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                        description="Ledger benchmark",
+                    )
+                except InsufficientBalanceError:
+                    rejected += 1
+                except Exception as e:
+                    errors += 1
+                    print(f"   transaction for {user_id} failed: {e}")
+
+    # Debits outweigh credits so balances regularly reach zero
+    work = [
+        (random.choice(user_ids), random.choice((-30, -20, -10, 5, 10, 25)))
+        for _ in range(transactions)
+    ]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(transact(user_id, amount) for user_id, amount in work))
+    return time.perf_counter() - start, rejected, errors
+
+
+async def verify(user_ids: list[int]) -> bool:
+    """Check every balance against its ledger"""
+    consistent = True
+
+    async with AsyncSessionLocal() as db:
+        for user_id in user_ids:
+            points = await db.scalar(select(User.points).where(User.id == user_id))
+            ledger_sum = await db.scalar(
+                select(func.coalesce(func.sum(Transaction.amount), 0)).where(
+                    Transaction.user_id == user_id
+                )
+            )
+            last_balance = await db.scalar(
+                select(Transaction.balance_after)
+                .where(Transaction.user_id == user_id)
+                .order_by(desc(Transaction.id))
+                .limit(1)
+            )
+
+            ok = (
+                points == STARTING_POINTS + ledger_sum
+                and points >= 0
+                and last_balance in (None, points)
+            )
+            consistent = consistent and ok
+            print(
+                f"   user {user_id}: points={points} ledger={STARTING_POINTS}{ledger_sum:+d} "
+                f"last balance_after={last_balance} {'✅' if ok else '❌'}"
+            )
+
+    return consistent
+
+
+async def cleanup(user_ids: list[int]) -> None:
+    """Remove everything the benchmark created"""
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Transaction).where(Transaction.user_id.in_(user_ids)))
+        await db.execute(delete(User).where(User.id.in_(user_ids)))
+        await db.commit()
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark rows")
+    args = parser.parse_args()
+
+    print(f"💰 Creating {args.users} accounts with {STARTING_POINTS} points...")
+    user_ids = await create_users(args.users)
+
+    try:
+        print(f"🚀 Running {args.transactions} transactions with concurrency {args.concurrency}...")
+        elapsed, rejected, errors = await run(user_ids, args.transactions, args.concurrency)
+        print(
+            f"   {args.transactions} transactions in {elapsed:.2f}s = "
+            f"{args.transactions / elapsed:.1f} tx/sec ({rejected} rejected for balance)"
+        )
+
+        consistent = await verify(user_ids)
+        print("✅ No lost updates" if consistent else "❌ Balances disagree with the ledger")
+        return 0 if consistent and not errors else 1
+    finally:
+        if not args.keep:
+            await cleanup(user_ids)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,82 @@
+"""Bulk point grants from a CSV or JSONL file
+
+Streams (user_id, amount, reason) rows and applies them through
+PointGrantService in chunked set-based updates, printing progress after
+each chunk. Re-running with the same --batch-id resumes an interrupted
+batch and never applies a completed one twice.
+
+Usage:
+    python scripts/grant_points.py rewards.csv --batch-id summer-event-2026
+    python scripts/grant_points.py rewards.jsonl --batch-id airdrop-42 --chunk-size 5000
+
+File formats:
+    CSV     user_id,amount,reason   (header row optional)
+    JSONL   {"user_id": 1, "amount": 50, "reason": "Event reward"}
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.models.points import PointGrantBatch  # noqa: E402
+from src.services.point_grant_service import PointGrantService, parse_grant_rows  # noqa: E402
+
+
+async def read_lines(path: Path) -> AsyncIterator[str]:
+    """Yield a file's lines one at a time"""
+    with path.open(encoding="utf-8-sig") as f:
+        for line in f:
+            yield line
+
+
+def print_progress(batch: PointGrantBatch) -> None:
+    print(
+        f"   {batch.rows_processed} rows processed "
+        f"({batch.applied_count} applied, {batch.rejected_count} rejected, "
+        f"{batch.total_amount:+d} points)"
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--batch-id", required=True, help="Idempotency key for this batch")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="Default: from file suffix")
+    parser.add_argument("--chunk-size", type=int, default=PointGrantService.DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--admin-id", type=int, help="User ID recorded as the batch creator")
+    args = parser.parse_args()
+
+    fmt = args.format or ("jsonl" if args.file.suffix in (".jsonl", ".ndjson") else "csv")
+
+    print(f"💰 Applying {args.file} as batch {args.batch_id}...")
+    async with AsyncSessionLocal() as db:
+        batch, rejections = await PointGrantService(db).apply_grants(
+            args.batch_id,
+            parse_grant_rows(read_lines(args.file), fmt),
+            admin_id=args.admin_id,
+            chunk_size=args.chunk_size,
+            on_progress=print_progress,
+        )
+
+    for row in rejections:
+        print(f"   line {row.line}: user {row.user_id} amount {row.amount}: {row.error}")
+    if batch.rejected_count > len(rejections):
+        print(f"   ... {batch.rejected_count - len(rejections)} more rejections")
+
+    print(f"✅ Batch {args.batch_id} {batch.status}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,58 @@
+"""Rebuild the Redis points leaderboard from PostgreSQL
+
+Streams active users' balances in primary-key batches into a staging
+sorted set and swaps it in atomically, so the API keeps serving the old
+leaderboard until the new one is complete. Use after restoring a backup,
+flushing Redis or changing balances outside the application.
+
+Usage:
+    python scripts/rebuild_leaderboard.py [--batch-size 5000]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+    REDIS_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core import session as session_store  # noqa: E402
+from src.core.config import config  # noqa: E402
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.leaderboard import rebuild_leaderboard  # noqa: E402
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--batch-size", type=int, default=config.ranking.leaderboard_rebuild_batch_size
+    )
+    args = parser.parse_args()
+
+    if not config.ranking.leaderboard_enabled:
+        print("❌ ranking.leaderboard_enabled is off")
+        return 1
+
+    await session_store.init_redis()
+    try:
+        print("🏆 Rebuilding points leaderboard...")
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            count = await rebuild_leaderboard(db, batch_size=args.batch_size)
+        print(f"✅ Ranked {count} users in {time.perf_counter() - start:.2f}s")
+    finally:
+        await session_store.close_redis()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
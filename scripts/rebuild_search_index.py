@@ -0,0 +1,53 @@
+"""Rebuild the embedded search index from the database
+
+Streams every active post and comment, tokenizes it and writes fresh
+posts.idx and comments.idx files to ``search.index_dir``. Post and comment
+writes keep the index current; run this to create it, after restoring a
+backup or changing content outside the application. A running app adopts
+the new files on its next index flush.
+
+Usage:
+    python scripts/rebuild_search_index.py [--only posts|comments] [--batch-size 5000]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import config  # noqa: E402
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.search_index import COMMENTS, POSTS, rebuild_search_index  # noqa: E402
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", choices=[POSTS, COMMENTS])
+    parser.add_argument("--batch-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    if config.search.engine != "embedded":
+        print(f"⚠️  search.engine is {config.search.engine!r}; the index is built but unused")
+
+    async with AsyncSessionLocal() as db:
+        for kind in [args.only] if args.only else [POSTS, COMMENTS]:
+            print(f"🔎 Indexing {kind}...")
+            start = time.perf_counter()
+            count = await rebuild_search_index(db, kind, batch_size=args.batch_size)
+            print(f"✅ Indexed {count} {kind} in {time.perf_counter() - start:.2f}s")
+
+    print(f"📁 {Path(config.search.index_dir).resolve()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,58 @@
+"""Rebuild the Redis typeahead suggestion index from PostgreSQL
+
+Indexes active post titles, tag and channel names and usernames under a
+new generation and switches readers to it once complete, so
+``GET /api/v1/search/suggest`` keeps serving the old suggestions until
+then. The app already rebuilds once per
+``search.suggest_rebuild_interval_seconds``; use this after flushing Redis
+or bulk-editing content outside the application.
+
+Usage:
+    python scripts/rebuild_suggest_index.py [--batch-size 5000]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+    REDIS_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core import session as session_store  # noqa: E402
+from src.core.config import config  # noqa: E402
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.suggest import rebuild_suggest_index  # noqa: E402
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=config.search.suggest_rebuild_batch_size)
+    args = parser.parse_args()
+
+    if not config.search.suggest_enabled:
+        print("❌ search.suggest_enabled is off")
+        return 1
+
+    await session_store.init_redis()
+    try:
+        print("🔤 Rebuilding typeahead suggestions...")
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            count = await rebuild_suggest_index(db, batch_size=args.batch_size)
+        print(f"✅ Indexed {count} items in {time.perf_counter() - start:.2f}s")
+    finally:
+        await session_store.close_redis()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
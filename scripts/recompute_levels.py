@@ -0,0 +1,55 @@
+"""Recompute every user's level from their points
+
+Ledger writes keep levels current; run this after changing level thresholds
+(the ``levels`` table or ``user_levels`` config) or balances outside the
+application. Users are updated in primary-key chunks, one transaction per
+chunk, touching only rows whose level is wrong.
+
+Usage:
+    python scripts/recompute_levels.py [--batch-size 1000]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+    REDIS_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core import session as session_store  # noqa: E402
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.levels import get_level_thresholds, recompute_levels  # noqa: E402
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    # Redis holds cached principals that must see the new levels
+    await session_store.init_redis()
+    try:
+        async with AsyncSessionLocal() as db:
+            print("🎚️  Level thresholds:")
+            for min_points, level in reversed(await get_level_thresholds(db)):
+                print(f"   {min_points:>8} {level.value}")
+
+            start = time.perf_counter()
+            changed = await recompute_levels(db, batch_size=args.batch_size)
+        print(f"✅ Updated {len(changed)} users in {time.perf_counter() - start:.2f}s")
+    finally:
+        await session_store.close_redis()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,79 @@
+"""Check every user's balance against the point ledger
+
+Streams the whole ledger through a server-side cursor, sums it per user
+(including archived months) and compares with ``users.points``. Mismatches
+are written to a CSV report, largest first. With ``--repair`` each
+mismatch gets one corrective ledger entry so the ledger agrees with the
+balance; balances themselves are never changed.
+
+Usage:
+    python scripts/reconcile_ledger.py [--report ledger_mismatches.csv]
+    python scripts/reconcile_ledger.py --repair [--batch-size 1000]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.config import config  # noqa: E402
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.core.ledger_reconciliation import (  # noqa: E402
+    find_balance_mismatches,
+    repair_balance_mismatches,
+    write_mismatch_report,
+)
+
+# Mismatches echoed to the console; the report has all of them
+SHOWN = 10
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--report", type=Path, default=Path("ledger_mismatches.csv"))
+    parser.add_argument("--chunk-size", type=int, default=config.ledger.reconcile_chunk_size)
+    parser.add_argument("--repair", action="store_true", help="Write corrective ledger entries")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Users per repair batch")
+    args = parser.parse_args()
+
+    print("🧮 Reconciling balances with the ledger...")
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        mismatches = await find_balance_mismatches(db, chunk_size=args.chunk_size)
+        print(f"   scanned in {time.perf_counter() - start:.2f}s")
+
+        if not mismatches:
+            print("✅ Every balance matches its ledger")
+            return 0
+
+        drift = sum(mismatch.difference for mismatch in mismatches)
+        print(f"⚠️  {len(mismatches)} users disagree with their ledger (net drift {drift:+d})")
+        for mismatch in sorted(mismatches, key=lambda m: -abs(m.difference))[:SHOWN]:
+            print(
+                f"   user {mismatch.user_id}: points {mismatch.points}, "
+                f"ledger {mismatch.ledger_balance} ({mismatch.difference:+d})"
+            )
+        print(f"📝 Report: {write_mismatch_report(mismatches, args.report)}")
+
+        if not args.repair:
+            return 1
+
+        repaired = await repair_balance_mismatches(
+            db, [mismatch.user_id for mismatch in mismatches], batch_size=args.batch_size
+        )
+        print(f"✅ Wrote {len(repaired)} corrective ledger entries")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,44 @@
+"""Recompute users' lifetime point totals from the ledger
+
+total_earned, total_spent and tx_count on ``users`` are maintained by every
+ledger write. This walks all users in batches, recomputes the totals from
+``transactions`` and corrects any that drifted, e.g. after ledger rows were
+inserted or deleted by hand or by scripts/seed_data.py.
+
+Usage:
+    python scripts/reconcile_point_totals.py [--batch-size 1000]
+
+Environment Variables:
+    APP_SECRET_KEY
+    SECURITY_JWT_SECRET_KEY
+    IPFS_API_KEY
+    DATABASE_URL (from config.yaml)
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.database import AsyncSessionLocal  # noqa: E402
+from src.services.point_service import PointService  # noqa: E402
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=PointService.RECONCILE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    print("🧮 Reconciling lifetime point totals with the ledger...")
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        corrected = await PointService(db).reconcile_point_totals(batch_size=args.batch_size)
+    print(f"✅ Corrected {corrected} users in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -6,14 +6,46 @@ Provides dependency injection for user authentication and authorization.
 from typing import Optional
 
 from fastapi import Cookie, Depends, HTTPException, status
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
+from src.core.principal import Principal, get_session_principal
 from src.core.security import verify_access_token
 from src.models.user import User, UserLevelEnum
 
 
+async def get_current_principal(
+    session_id: Optional[str] = Cookie(None),
+    db: AsyncSession = Depends(get_db),
+) -> Optional[Principal]:
+    """Get the authenticated principal from the session cookie
+
+    Served from the per-worker session cache, so handlers that only need
+    identity and permissions usually avoid both Redis and the database.
+
+    Returns:
+        Principal if authenticated, None otherwise
+    """
+    return await get_session_principal(session_id, db)
+
+
+async def require_principal(
+    principal: Optional[Principal] = Depends(get_current_principal),
+) -> Principal:
+    """Require an authenticated principal
+
+    Raises:
+        HTTPException: If user is not authenticated
+    """
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return principal
+
+
 async def get_current_user(
     session_id: Optional[str] = Cookie(None),
     authorization: Optional[str] = None,
@@ -31,12 +63,12 @@ async def get_current_user(
     """
     user_id = None
 
-    # Try session cookie first (FIX CRT-002: Use Redis session lookup)
+    # Try session cookie first (FIX CRT-002: Use Redis session lookup,
+    # served from the per-worker session cache when possible)
     if session_id:
-        # Get user_id from Redis session store
-        from src.core.session import get_session
-
-        user_id = await get_session(session_id)
+        principal = await get_session_principal(session_id, db)
+        if principal:
+            user_id = principal.id
 
     # Try JWT token
     if not user_id and authorization:
@@ -46,10 +78,9 @@ async def get_current_user(
             if payload:
                 user_id = payload.get("sub")
 
-    # Fetch user from database
+    # Fetch user from database (primary key lookup reuses the identity map)
     if user_id:
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        user = await db.get(User, int(user_id))
         if user and user.is_active and not user.is_banned:
             return user
 
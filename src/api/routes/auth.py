@@ -14,9 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import config
 from src.core.dependencies import get_current_user, get_db
+from src.core import suggest
+from src.core.leaderboard import update_scores
+from src.core.levels import get_level_thresholds, level_for_points
 from src.core.security import create_access_token, hash_password, verify_password
 from src.core.session import create_session, delete_session
-from src.models.user import User, UserLevelEnum
+from src.models.user import User
 from src.models.points import Transaction, TransactionType
 
 router = APIRouter()
@@ -95,7 +98,11 @@ async def register(
         email=data.email,
         password_hash=hash_password(data.password),
         points=config.point_economy.registration_bonus,
-        level=UserLevelEnum.NEW_USER,
+        total_earned=config.point_economy.registration_bonus,
+        tx_count=1,
+        level=level_for_points(
+            config.point_economy.registration_bonus, await get_level_thresholds(db)
+        ),
         is_active=True,
         created_at=datetime.utcnow(),
     )
@@ -113,6 +120,8 @@ async def register(
     )
     db.add(transaction)
     await db.commit()
+    await update_scores({new_user.id: new_user.points})
+    await suggest.sync_user(new_user)
 
     # Generate JWT token
     access_token = create_access_token(data={"sub": new_user.id, "username": new_user.username})
@@ -10,9 +10,10 @@ Handles:
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies.auth import require_auth
+from src.api.dependencies.auth import require_auth, require_principal
 from src.core.database import get_db
 from src.core.exceptions import BlockchainError, InsufficientPointsError
+from src.core.principal import Principal
 from src.models.user import User
 from src.schemas.blockchain import (
     RewardRedemptionRequest,
@@ -58,7 +59,7 @@ async def connect_wallet(
 
 @router.delete("/wallet/disconnect", status_code=status.HTTP_204_NO_CONTENT)
 async def disconnect_wallet(
-    current_user: User = Depends(require_auth),
+    current_user: Principal = Depends(require_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Disconnect the user's BNB Chain wallet"""
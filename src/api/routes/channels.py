@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas.channel import ChannelCreate, ChannelUpdate, ChannelResponse, ChannelListResponse
 from src.core.dependencies import get_db, require_moderator
-from src.models.user import User
+from src.core.principal import Principal
 from src.services.channel_service import ChannelService
 
 router = APIRouter()
@@ -19,7 +19,7 @@ router = APIRouter()
 )
 async def create_channel(
     channel_data: ChannelCreate,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -76,7 +76,7 @@ async def get_channel_by_slug(
 async def update_channel(
     channel_id: int = Path(..., description="Channel ID"),
     channel_data: ChannelUpdate = ...,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -97,7 +97,7 @@ async def update_channel(
 @router.delete("/{channel_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a channel")
 async def delete_channel(
     channel_id: int = Path(..., description="Channel ID"),
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -13,14 +13,16 @@ from src.schemas.comment import (
     CommentTreeResponse,
     ContentStatus,
 )
+from src.core.counting import CountStrategy, has_more
 from src.core.dependencies import (
     get_db,
-    get_current_user,
-    get_optional_current_user,
+    get_current_principal,
+    get_optional_current_principal,
     require_moderator,
 )
-from src.models.user import User
+from src.core.principal import Principal
 from src.services.comment_service import CommentService
+from src.services.like_service import LikeService
 
 router = APIRouter()
 
@@ -34,7 +36,7 @@ router = APIRouter()
 async def create_comment(
     post_id: int = Path(..., description="Post ID to comment on"),
     comment_data: CommentCreate = ...,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -71,7 +73,10 @@ async def list_comments(
         None, description="Parent comment ID (null for root comments)"
     ),
     status: Optional[ContentStatus] = Query(ContentStatus.ACTIVE, description="Filter by status"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -87,23 +92,33 @@ async def list_comments(
     """
     comment_service = CommentService(db)
     comments, total = await comment_service.list_comments(
-        post_id=post_id, page=page, page_size=page_size, parent_id=parent_id, status=status
+        post_id=post_id,
+        page=page,
+        page_size=page_size,
+        parent_id=parent_id,
+        status=status,
+        count_strategy=count,
     )
 
     # Add metadata for each comment
+    liked_comments = set()
+    if current_user:
+        _, liked_comments = await LikeService(db).get_like_state(
+            current_user.id, comment_ids=[comment.id for comment in comments]
+        )
     for comment in comments:
         comment.replies_count = await comment_service.get_replies_count(comment.id)
-        if current_user:
-            comment.user_has_liked = await comment_service.check_user_liked_comment(
-                comment.id, current_user.id
-            )
-        else:
-            comment.user_has_liked = False
+        comment.user_has_liked = comment.id in liked_comments
 
     total_pages = (total + page_size - 1) // page_size
 
     return CommentListResponse(
-        comments=comments, total=total, page=page, page_size=page_size, total_pages=total_pages
+        comments=comments,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more(total, page, page_size),
     )
 
 
@@ -112,7 +127,7 @@ async def list_comments(
 )
 async def get_comment_tree(
     post_id: int = Path(..., description="Post ID"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -130,21 +145,24 @@ async def get_comment_tree(
     comment_service = CommentService(db)
     root_comments = await comment_service.get_comment_tree(post_id, max_depth=5)
 
-    # Recursively add metadata
-    async def add_metadata(comment):
-        if current_user:
-            comment.user_has_liked = await comment_service.check_user_liked_comment(
-                comment.id, current_user.id
-            )
-        else:
-            comment.user_has_liked = False
+    # Collect the whole tree so like state is resolved in one lookup
+    all_comments = []
 
-        if hasattr(comment, "replies_list"):
-            for reply in comment.replies_list:
-                await add_metadata(reply)
+    def collect(comment):
+        all_comments.append(comment)
+        for reply in getattr(comment, "replies_list", []):
+            collect(reply)
 
     for comment in root_comments:
-        await add_metadata(comment)
+        collect(comment)
+
+    liked_comments = set()
+    if current_user:
+        _, liked_comments = await LikeService(db).get_like_state(
+            current_user.id, comment_ids=[comment.id for comment in all_comments]
+        )
+    for comment in all_comments:
+        comment.user_has_liked = comment.id in liked_comments
 
     return CommentTreeResponse(comments=root_comments, total_root_comments=len(root_comments))
 
@@ -152,7 +170,7 @@ async def get_comment_tree(
 @router.get("/comments/{comment_id}", response_model=CommentResponse, summary="Get comment by ID")
 async def get_comment_by_id(
     comment_id: int = Path(..., description="Comment ID"),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -167,12 +185,12 @@ async def get_comment_by_id(
 
     # Add metadata
     comment.replies_count = await comment_service.get_replies_count(comment_id)
+    comment.user_has_liked = False
     if current_user:
-        comment.user_has_liked = await comment_service.check_user_liked_comment(
-            comment_id, current_user.id
+        _, liked_comments = await LikeService(db).get_like_state(
+            current_user.id, comment_ids=[comment_id]
         )
-    else:
-        comment.user_has_liked = False
+        comment.user_has_liked = comment_id in liked_comments
 
     return comment
 
@@ -181,7 +199,7 @@ async def get_comment_by_id(
 async def update_comment(
     comment_id: int = Path(..., description="Comment ID"),
     comment_data: CommentUpdate = ...,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -200,9 +218,10 @@ async def update_comment(
 
     # Add metadata
     updated_comment.replies_count = await comment_service.get_replies_count(comment_id)
-    updated_comment.user_has_liked = await comment_service.check_user_liked_comment(
-        comment_id, current_user.id
+    _, liked_comments = await LikeService(db).get_like_state(
+        current_user.id, comment_ids=[comment_id]
     )
+    updated_comment.user_has_liked = comment_id in liked_comments
 
     return updated_comment
 
@@ -212,7 +231,7 @@ async def update_comment(
 )
 async def delete_comment(
     comment_id: int = Path(..., description="Comment ID"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -240,7 +259,7 @@ async def delete_comment(
 async def moderate_comment(
     comment_id: int = Path(..., description="Comment ID"),
     moderation_data: CommentModerationUpdate = ...,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
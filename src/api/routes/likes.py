@@ -1,16 +1,62 @@
 """Likes API routes"""
 
-from typing import Optional
+from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, status, Path
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.schemas.like import LikeResponse, LikeListResponse
-from src.core.dependencies import get_db, get_current_user
-from src.models.user import User
+from src.schemas.like import LikeResponse, LikeListResponse, LikeStateResponse
+from src.core.counting import CountStrategy, has_more
+from src.core.exceptions import ValidationError
+from src.core.dependencies import get_db, get_current_principal
+from src.core.principal import Principal
 from src.services.like_service import LikeService
 
 router = APIRouter()
 
+MAX_LIKE_STATE_IDS = 100
+
+
+def _parse_ids(value: Optional[str], name: str) -> List[int]:
+    """Parse a comma-separated ID list"""
+    if not value:
+        return []
+    try:
+        ids = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise ValidationError(f"{name} must be comma-separated integers")
+    if len(ids) > MAX_LIKE_STATE_IDS:
+        raise ValidationError(f"{name} accepts at most {MAX_LIKE_STATE_IDS} IDs")
+    return ids
+
+
+@router.get("/state", response_model=LikeStateResponse, summary="Get my like state")
+async def get_like_state(
+    post_ids: Optional[str] = Query(None, description="Comma-separated post IDs"),
+    comment_ids: Optional[str] = Query(None, description="Comma-separated comment IDs"),
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get which of a page of posts and comments the current user has liked.
+
+    **Parameters:**
+    - `post_ids`: Comma-separated post IDs (max 100)
+    - `comment_ids`: Comma-separated comment IDs (max 100)
+
+    **Returns:**
+    - IDs from the request that the user has liked
+    """
+    like_service = LikeService(db)
+    liked_posts, liked_comments = await like_service.get_like_state(
+        current_user.id,
+        post_ids=_parse_ids(post_ids, "post_ids"),
+        comment_ids=_parse_ids(comment_ids, "comment_ids"),
+    )
+
+    return LikeStateResponse(
+        liked_post_ids=sorted(liked_posts), liked_comment_ids=sorted(liked_comments)
+    )
+
 
 @router.post(
     "/posts/{post_id}/like",
@@ -20,7 +66,7 @@ router = APIRouter()
 )
 async def like_post(
     post_id: int = Path(..., description="Post ID to like"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -45,7 +91,7 @@ async def like_post(
 )
 async def unlike_post(
     post_id: int = Path(..., description="Post ID to unlike"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -71,7 +117,7 @@ async def unlike_post(
 )
 async def like_comment(
     comment_id: int = Path(..., description="Comment ID to like"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -98,7 +144,7 @@ async def like_comment(
 )
 async def unlike_comment(
     comment_id: int = Path(..., description="Comment ID to unlike"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -123,6 +169,9 @@ async def get_post_likes(
     post_id: int = Path(..., description="Post ID"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Likes per page"),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -134,13 +183,18 @@ async def get_post_likes(
     """
     like_service = LikeService(db)
     likes, total = await like_service.get_post_likes(
-        post_id=post_id, page=page, page_size=page_size
+        post_id=post_id, page=page, page_size=page_size, count_strategy=count
     )
 
     total_pages = (total + page_size - 1) // page_size
 
     return LikeListResponse(
-        likes=likes, total=total, page=page, page_size=page_size, total_pages=total_pages
+        likes=likes,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more(total, page, page_size),
     )
 
 
@@ -153,6 +207,9 @@ async def get_comment_likes(
     comment_id: int = Path(..., description="Comment ID"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Likes per page"),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -164,13 +221,18 @@ async def get_comment_likes(
     """
     like_service = LikeService(db)
     likes, total = await like_service.get_comment_likes(
-        comment_id=comment_id, page=page, page_size=page_size
+        comment_id=comment_id, page=page, page_size=page_size, count_strategy=count
     )
 
     total_pages = (total + page_size - 1) // page_size
 
     return LikeListResponse(
-        likes=likes, total=total, page=page, page_size=page_size, total_pages=total_pages
+        likes=likes,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more(total, page, page_size),
     )
 
 
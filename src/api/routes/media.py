@@ -7,11 +7,13 @@ Handles:
 - File unpinning
 """
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
-from src.api.dependencies.auth import get_current_user as get_current_active_user
+from src.api.dependencies.auth import get_current_principal
 from src.core.exceptions import IPFSError, StorageError, ValidationError
-from src.models.user import User
+from src.core.principal import Principal
 from src.schemas.media import MediaDeleteRequest, MediaDeleteResponse, MediaUploadResponse
 from src.services.media_service import media_service
 
@@ -22,7 +24,7 @@ router = APIRouter(prefix="/media", tags=["media"])
 async def upload_media(
     file: UploadFile = File(..., description="Media file to upload"),
     optimize: bool = True,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Optional[Principal] = Depends(get_current_principal),
 ):
     """Upload media file to IPFS via Lighthouse
 
@@ -87,7 +89,7 @@ async def upload_media(
 @router.delete("/unpin", response_model=MediaDeleteResponse)
 async def unpin_media(
     delete_request: MediaDeleteRequest,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Optional[Principal] = Depends(get_current_principal),
 ):
     """Unpin file from Lighthouse pinning service
 
@@ -13,8 +13,9 @@ from src.schemas.moderation import (
     ReportStatus,
     ReportReason,
 )
-from src.core.dependencies import get_db, get_current_user, require_moderator
-from src.models.user import User
+from src.core.counting import CountStrategy, has_more
+from src.core.dependencies import get_db, get_current_principal, require_moderator
+from src.core.principal import Principal
 from src.services.moderation_service import ModerationService
 
 router = APIRouter()
@@ -28,7 +29,7 @@ router = APIRouter()
 )
 async def create_report(
     report_data: ReportCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -52,7 +53,10 @@ async def list_reports(
     page_size: int = Query(50, ge=1, le=100),
     status: Optional[ReportStatus] = Query(None),
     reason: Optional[ReportReason] = Query(None),
-    current_user: User = Depends(require_moderator),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -64,20 +68,25 @@ async def list_reports(
     """
     moderation_service = ModerationService(db)
     reports, total = await moderation_service.list_reports(
-        page=page, page_size=page_size, status=status, reason=reason
+        page=page, page_size=page_size, status=status, reason=reason, count_strategy=count
     )
 
     total_pages = (total + page_size - 1) // page_size
 
     return ReportListResponse(
-        reports=reports, total=total, page=page, page_size=page_size, total_pages=total_pages
+        reports=reports,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        has_more=has_more(total, page, page_size),
     )
 
 
 @router.get("/reports/{report_id}", response_model=ReportResponse, summary="Get report by ID")
 async def get_report(
     report_id: int = Path(...),
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """Get report details (moderator only)."""
@@ -90,7 +99,7 @@ async def get_report(
 async def resolve_report(
     report_id: int = Path(...),
     resolve_data: ReportResolve = ...,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -111,7 +120,7 @@ async def resolve_report(
 @router.post("/ban", status_code=status.HTTP_204_NO_CONTENT, summary="Ban a user")
 async def ban_user(
     ban_data: BanCreate,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
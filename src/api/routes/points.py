@@ -1,7 +1,8 @@
 """Points economy API routes"""
 
+from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, Path
+from fastapi import APIRouter, Depends, File, Form, Query, Path, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas.points import (
@@ -9,21 +10,31 @@ from src.schemas.points import (
     TransactionListResponse,
     UserPointsResponse,
     PointEconomyResponse,
+    PointEconomyUpdate,
+    PointGrantBatchResponse,
+    GrantRejectionResponse,
     LeaderboardResponse,
+    LeaderboardRankResponse,
     AdminAdjustment,
     CryptoRewardRequest,
     TransactionType,
 )
-from src.core.dependencies import get_db, get_current_user, require_senior_moderator
-from src.models.user import User
+from src.core.counting import CountStrategy, has_more
+from src.core.dependencies import get_db, get_current_principal, require_senior_moderator
+from src.core.principal import Principal
 from src.services.point_service import PointService
+from src.services.point_grant_service import (
+    PointGrantService,
+    iter_upload_lines,
+    parse_grant_rows,
+)
 
 router = APIRouter()
 
 
 @router.get("/me/points", response_model=UserPointsResponse, summary="Get my points summary")
 async def get_my_points(
-    current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(get_current_principal), db: AsyncSession = Depends(get_db)
 ):
     """
     Get the authenticated user's points summary.
@@ -69,7 +80,12 @@ async def get_my_transactions(
     transaction_type: Optional[TransactionType] = Query(
         None, description="Filter by transaction type"
     ),
-    current_user: User = Depends(get_current_user),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
+    since: Optional[datetime] = Query(None, description="Only transactions at or after (UTC)"),
+    until: Optional[datetime] = Query(None, description="Only transactions before (UTC)"),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -77,6 +93,7 @@ async def get_my_transactions(
 
     **Filters:**
     - `transaction_type`: Filter by type (REGISTRATION_BONUS, CREATE_POST, etc.)
+    - `since` / `until`: Limit to a time range
 
     **Returns:**
     - Paginated list of transactions
@@ -84,7 +101,13 @@ async def get_my_transactions(
     """
     point_service = PointService(db)
     transactions, total = await point_service.get_user_transactions(
-        user_id=current_user.id, page=page, page_size=page_size, transaction_type=transaction_type
+        user_id=current_user.id,
+        page=page,
+        page_size=page_size,
+        transaction_type=transaction_type,
+        count_strategy=count,
+        since=since,
+        until=until,
     )
 
     total_pages = (total + page_size - 1) // page_size
@@ -95,6 +118,7 @@ async def get_my_transactions(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        has_more=has_more(total, page, page_size),
     )
 
 
@@ -110,6 +134,11 @@ async def get_user_transactions(
     transaction_type: Optional[TransactionType] = Query(
         None, description="Filter by transaction type"
     ),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
+    since: Optional[datetime] = Query(None, description="Only transactions at or after (UTC)"),
+    until: Optional[datetime] = Query(None, description="Only transactions before (UTC)"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -117,6 +146,7 @@ async def get_user_transactions(
 
     **Filters:**
     - `transaction_type`: Filter by type
+    - `since` / `until`: Limit to a time range
 
     **Returns:**
     - Paginated list of transactions
@@ -124,7 +154,13 @@ async def get_user_transactions(
     """
     point_service = PointService(db)
     transactions, total = await point_service.get_user_transactions(
-        user_id=user_id, page=page, page_size=page_size, transaction_type=transaction_type
+        user_id=user_id,
+        page=page,
+        page_size=page_size,
+        transaction_type=transaction_type,
+        count_strategy=count,
+        since=since,
+        until=until,
     )
 
     total_pages = (total + page_size - 1) // page_size
@@ -135,6 +171,7 @@ async def get_user_transactions(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        has_more=has_more(total, page, page_size),
     )
 
 
@@ -155,6 +192,32 @@ async def get_economy_config(db: AsyncSession = Depends(get_db)):
     return config
 
 
+@router.patch(
+    "/admin/economy",
+    response_model=PointEconomyResponse,
+    summary="Admin: Update point economy configuration",
+)
+async def update_economy_config(
+    updates: PointEconomyUpdate,
+    current_user: Principal = Depends(require_senior_moderator),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Change point costs and rewards (senior moderator only).
+
+    **Updatable fields:**
+    - Costs (zero or negative): `create_post_cost`, `create_comment_cost`, `like_cost`
+    - Rewards: `registration_bonus`, `receive_like_tier1..3`
+    - Crypto: `crypto_reward_cost`, `crypto_reward_bnb_amount`
+
+    **Effects:**
+    - Every worker picks up the new configuration immediately
+    """
+    point_service = PointService(db)
+    config = await point_service.update_economy_config(updates)
+    return config
+
+
 @router.get("/leaderboard", response_model=LeaderboardResponse, summary="Get points leaderboard")
 async def get_leaderboard(
     page: int = Query(1, ge=1, description="Page number"),
@@ -177,10 +240,28 @@ async def get_leaderboard(
     )
 
 
+@router.get(
+    "/leaderboard/me", response_model=LeaderboardRankResponse, summary="Get my leaderboard rank"
+)
+async def get_my_leaderboard_rank(
+    current_user: Principal = Depends(get_current_principal), db: AsyncSession = Depends(get_db)
+):
+    """
+    Get the authenticated user's position on the points leaderboard.
+
+    **Returns:**
+    - Rank (1 = most points)
+    - Current points
+    - Total ranked users
+    """
+    point_service = PointService(db)
+    return await point_service.get_leaderboard_rank(current_user.id)
+
+
 @router.post("/claim-crypto", response_model=TransactionResponse, summary="Claim crypto reward")
 async def claim_crypto_reward(
     reward_request: CryptoRewardRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -209,7 +290,7 @@ async def claim_crypto_reward(
 )
 async def admin_adjust_points(
     adjustment: AdminAdjustment,
-    current_user: User = Depends(require_senior_moderator),
+    current_user: Principal = Depends(require_senior_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -228,3 +309,73 @@ async def admin_adjust_points(
     point_service = PointService(db)
     transaction = await point_service.admin_adjust_points(adjustment, current_user.id)
     return transaction
+
+
+@router.post(
+    "/admin/grants",
+    response_model=PointGrantBatchResponse,
+    summary="Admin: Bulk grant or deduct points",
+)
+async def bulk_grant_points(
+    batch_id: str = Form(..., max_length=100, description="Idempotency key for this batch"),
+    file: UploadFile = File(..., description="CSV or JSONL of user_id, amount, reason"),
+    format: Optional[str] = Form(
+        None, pattern="^(csv|jsonl)$", description="File format (default: from file name)"
+    ),
+    chunk_size: int = Form(1000, ge=1, le=10000, description="Rows per transaction"),
+    current_user: Principal = Depends(require_senior_moderator),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Apply point adjustments for many users at once (senior moderator only).
+
+    **File formats:**
+    - CSV: `user_id,amount,reason` (header row optional)
+    - JSONL: `{"user_id": 1, "amount": 50, "reason": "Event reward"}`
+
+    **Behaviour:**
+    - Streamed and applied in chunks of `chunk_size` rows, one transaction each
+    - Re-submitting the same `batch_id` resumes after the last applied chunk;
+      a completed batch is not applied again
+    - Rows for unknown users, or that would take a balance below zero, are
+      rejected and reported (first 100)
+
+    **Progress:**
+    - `GET /admin/grants/{batch_id}` while the upload is being applied
+    """
+    fmt = format or ("jsonl" if (file.filename or "").endswith((".jsonl", ".ndjson")) else "csv")
+
+    grant_service = PointGrantService(db)
+    batch, rejections = await grant_service.apply_grants(
+        batch_id,
+        parse_grant_rows(iter_upload_lines(file), fmt),
+        admin_id=current_user.id,
+        chunk_size=chunk_size,
+    )
+
+    response = PointGrantBatchResponse.model_validate(batch)
+    response.rejections = [GrantRejectionResponse.model_validate(row) for row in rejections]
+    return response
+
+
+@router.get(
+    "/admin/grants/{batch_id}",
+    response_model=PointGrantBatchResponse,
+    summary="Admin: Get bulk grant progress",
+)
+async def get_grant_batch(
+    batch_id: str = Path(..., description="Batch ID"),
+    current_user: Principal = Depends(require_senior_moderator),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the progress of a bulk point grant (senior moderator only).
+
+    **Returns:**
+    - Status (running or completed)
+    - Rows processed, applied and rejected so far
+    - Net points granted
+    """
+    grant_service = PointGrantService(db)
+    batch = await grant_service.get_batch(batch_id)
+    return PointGrantBatchResponse.model_validate(batch)
@@ -14,13 +14,15 @@ from src.schemas.post import (
     PostSortBy,
     ContentStatus,
 )
+from src.core.counting import CountStrategy, has_more
 from src.core.dependencies import (
     get_db,
-    get_current_user,
-    get_optional_current_user,
+    get_current_principal,
+    get_optional_current_principal,
     require_moderator,
 )
-from src.models.user import User
+from src.core.principal import Principal
+from src.services.like_service import LikeService
 from src.services.post_service import PostService
 
 router = APIRouter()
@@ -31,7 +33,7 @@ router = APIRouter()
 )
 async def create_post(
     post_data: PostCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -53,7 +55,7 @@ async def create_post(
 @router.get("/{post_id}", response_model=PostDetailResponse, summary="Get post by ID")
 async def get_post_by_id(
     post_id: int,
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[Principal] = Depends(get_optional_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -68,7 +70,8 @@ async def get_post_by_id(
     # Check if current user liked this post
     user_has_liked = False
     if current_user:
-        user_has_liked = await post_service.check_user_liked_post(post_id, current_user.id)
+        liked_posts, _ = await LikeService(db).get_like_state(current_user.id, post_ids=[post_id])
+        user_has_liked = post_id in liked_posts
 
     # Create response with user_has_liked field
     post_dict = {**post.__dict__, "user_has_liked": user_has_liked}
@@ -86,11 +89,24 @@ async def list_posts(
     sort_by: PostSortBy = Query(PostSortBy.CREATED_DESC, description="Sort order"),
     search: Optional[str] = Query(None, description="Search in title and body"),
     tag_ids: Optional[str] = Query(None, description="Comma-separated tag IDs"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     List posts with pagination and filters.
 
+    **Pagination:**
+    - `page`: Offset pagination (cost grows with page depth)
+    - `cursor`: Keyset pagination; pass the previous response's `next_cursor`
+      to fetch the following page at constant cost. `page` is ignored and
+      `next_cursor` is null on the last page. A cursor is only valid for the
+      `sort_by` it was issued with.
+    - `count`: How `total` is computed. `none` skips the count query; `total`
+      is then only a lower bound and `has_more` says whether a next page exists.
+
     **Filters:**
     - `channel_id`: Filter by channel
     - `author_id`: Filter by author
@@ -123,12 +139,21 @@ async def list_posts(
         sort_by=sort_by,
         search=search,
         tag_ids=tag_ids_list,
+        cursor=cursor,
+        count_strategy=count,
     )
 
     total_pages = (total + page_size - 1) // page_size
+    next_cursor = PostService.next_cursor(posts, page_size, sort_by)
 
     return PostListResponse(
-        posts=posts, total=total, page=page, page_size=page_size, total_pages=total_pages
+        posts=posts,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None if cursor else has_more(total, page, page_size),
     )
 
 
@@ -136,7 +161,7 @@ async def list_posts(
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -157,7 +182,9 @@ async def update_post(
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a post")
 async def delete_post(
-    post_id: int, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
+    post_id: int,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Delete a post (soft delete - marks as DELETED status).
@@ -177,7 +204,7 @@ async def delete_post(
 async def moderate_post(
     post_id: int,
     moderation_data: PostModerationUpdate,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -1,14 +1,27 @@
 """Search API routes"""
 
 import re
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.schemas.post import PostListResponse
 from src.schemas.user import UserListResponse
 from src.schemas.comment import CommentListResponse
-from src.core.dependencies import get_db
-from src.services.search_service import SearchService
+from src.schemas.search import Suggestion
+from src.core import search_cache
+from src.core.config import config
+from src.core.counting import CountStrategy, has_more
+from src.core.dependencies import get_db, get_session_factory
+from src.core.exceptions import ValidationError
+from src.core.search_cache import cached_search, normalize_query
+from src.core.search_index import highlight
+from src.services.search_service import (
+    UNIFIED_SOURCES,
+    SearchService,
+    unified_search as run_unified_search,
+)
 
 router = APIRouter()
 
@@ -31,25 +44,45 @@ async def search_posts(
     q: str = Query(..., min_length=2, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Results per page"),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Search posts by title and body content.
 
     **Query parameter:**
-    - `q`: Search term (minimum 2 characters)
+    - `q`: Search term (minimum 2 characters). Supports web search syntax:
+      `"exact phrase"`, `or` and `-excluded` words
 
     **Returns:**
-    - Posts matching the search query
-    - Sorted by relevance and recency
+    - Posts matching the search query, each with a highlighted `snippet`
+    - Sorted by relevance (title matches first) and recency
     """
-    search_service = SearchService(db)
-    posts, total = await search_service.search_posts(q, page, page_size)
+    query = normalize_query(q)
 
-    total_pages = (total + page_size - 1) // page_size
+    async def search():
+        search_service = SearchService(db)
+        posts, total = await search_service.search_posts(
+            query, page, page_size, count_strategy=count
+        )
+        for post in posts:
+            post.snippet = highlight(strip_html(post.body), query)
+
+        total_pages = (total + page_size - 1) // page_size
+
+        return PostListResponse(
+            posts=posts,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_more=has_more(total, page, page_size),
+        )
 
-    return PostListResponse(
-        posts=posts, total=total, page=page, page_size=page_size, total_pages=total_pages
+    return await cached_search(
+        [search_cache.POSTS], ("posts", query, page, page_size, count), search
     )
 
 
@@ -58,6 +91,9 @@ async def search_users(
     q: str = Query(..., min_length=2, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Results per page"),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -70,13 +106,27 @@ async def search_users(
     - Users matching the search query
     - Sorted by points (popularity)
     """
-    search_service = SearchService(db)
-    users, total = await search_service.search_users(q, page, page_size)
+    query = normalize_query(q)
+
+    async def search():
+        search_service = SearchService(db)
+        users, total = await search_service.search_users(
+            query, page, page_size, count_strategy=count
+        )
 
-    total_pages = (total + page_size - 1) // page_size
+        total_pages = (total + page_size - 1) // page_size
 
-    return UserListResponse(
-        users=users, total=total, page=page, page_size=page_size, total_pages=total_pages
+        return UserListResponse(
+            users=users,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_more=has_more(total, page, page_size),
+        )
+
+    return await cached_search(
+        [search_cache.USERS], ("users", query, page, page_size, count), search
     )
 
 
@@ -85,62 +135,152 @@ async def search_comments(
     q: str = Query(..., min_length=2, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Results per page"),
+    count: Optional[CountStrategy] = Query(
+        None, description="How to compute total: exact, cached, estimate or none"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
     Search comments by body content.
 
     **Query parameter:**
-    - `q`: Search term (minimum 2 characters)
+    - `q`: Search term (minimum 2 characters). Supports web search syntax:
+      `"exact phrase"`, `or` and `-excluded` words
 
     **Returns:**
-    - Comments matching the search query
-    - Sorted by recency
+    - Comments matching the search query, each with a highlighted `snippet`
+    - Sorted by relevance and recency
     """
-    search_service = SearchService(db)
-    comments, total = await search_service.search_comments(q, page, page_size)
+    query = normalize_query(q)
 
-    total_pages = (total + page_size - 1) // page_size
+    async def search():
+        search_service = SearchService(db)
+        comments, total = await search_service.search_comments(
+            query, page, page_size, count_strategy=count
+        )
+        for comment in comments:
+            comment.snippet = highlight(strip_html(comment.body), query)
+
+        total_pages = (total + page_size - 1) // page_size
+
+        return CommentListResponse(
+            comments=comments,
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            has_more=has_more(total, page, page_size),
+        )
 
-    return CommentListResponse(
-        comments=comments, total=total, page=page, page_size=page_size, total_pages=total_pages
+    return await cached_search(
+        [search_cache.COMMENTS], ("comments", query, page, page_size, count), search
     )
 
 
-@router.get("", summary="Unified search across posts, users, and comments")
-async def unified_search(
-    q: str = Query(..., min_length=2, description="Search query"),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Results per page"),
+@router.get("/suggest", response_model=List[Suggestion], summary="Typeahead suggestions")
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=20, description="Maximum suggestions (default: search.suggest_default_limit)"
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Unified search across posts, users, and comments.
+    Complete what the user has typed into the search box.
 
-    **Query parameter:**
-    - `q`: Search term (minimum 2 characters)
+    Matches post titles, tag and channel names and usernames that start
+    with the text, or have a word that does, most popular first. Answered
+    from a Redis prefix index without touching the database once it is
+    built.
+
+    **Query parameters:**
+    - `q`: Text typed so far (minimum 1 character)
+    - `limit`: Maximum suggestions (1-20)
 
     **Returns:**
-    - Mixed results from posts, users, and comments
+    - Suggestions with a type, id, text and url (null for tags)
     """
     search_service = SearchService(db)
+    return await search_service.suggest(q, limit or config.search.suggest_default_limit)
 
-    # Search all types
-    posts, _ = await search_service.search_posts(q, 1, 5)
-    users, _ = await search_service.search_users(q, 1, 5)
-    comments, _ = await search_service.search_comments(q, 1, 5)
 
-    # Format results for frontend
-    results = []
+@router.get("", summary="Unified search across posts and comments")
+async def unified_search(
+    response: Response,
+    q: str = Query(..., min_length=2, description="Search query"),
+    types: str = Query("posts", description="Comma-separated sources: posts, comments"),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+):
+    """
+    Unified search across posts and comments.
 
-    for post in posts[:3]:
-        body_text = strip_html(post.body) if post.body else ""
-        excerpt = body_text[:150] + "..." if len(body_text) > 150 else body_text
-        results.append(
-            {"title": post.title, "excerpt": excerpt, "url": f"/posts/{post.id}", "type": "post"}
+    Only the requested sources are searched. They run concurrently and
+    share a deadline (`search.unified_deadline_ms`). A source that has not
+    finished by then is left out, and the response still succeeds.
+
+    **Query parameters:**
+    - `q`: Search term (minimum 2 characters)
+    - `types`: Sources to search (default: posts)
+
+    **Returns:**
+    - Up to `search.unified_results_per_type` results per source, each with
+      a title, a highlighted excerpt, a url and a type
+    - `X-Search-Partial` header listing any sources left out
+    """
+    sources = list(dict.fromkeys(t.strip() for t in types.split(",") if t.strip()))
+    unknown = [source for source in sources if source not in UNIFIED_SOURCES]
+    if unknown:
+        raise ValidationError(
+            f"Unknown search types: {', '.join(unknown)}. Use {', '.join(UNIFIED_SOURCES)}"
+        )
+
+    query = normalize_query(q)
+
+    async def search():
+        # Users are not searchable here for privacy; they are searched by
+        # username on profile pages instead
+        found, missing = await run_unified_search(
+            session_factory,
+            query,
+            sources,
+            limit=config.search.unified_results_per_type,
+            deadline_seconds=config.search.unified_deadline_ms / 1000,
         )
 
-    # Don't include users in search results for privacy/security
-    # Users can search for users by username on profile pages instead
+        # Format results for frontend
+        results = []
+
+        for post in found.get("posts", []):
+            results.append(
+                {
+                    "title": post.title,
+                    "excerpt": highlight(strip_html(post.body), query),
+                    "url": f"/posts/{post.id}",
+                    "type": "post",
+                }
+            )
+
+        for comment in found.get("comments", []):
+            author = comment.author.display_name or comment.author.username
+            results.append(
+                {
+                    "title": f"Comment by {author}",
+                    "excerpt": highlight(strip_html(comment.body), query),
+                    "url": f"/posts/{comment.post_id}",
+                    "type": "comment",
+                }
+            )
+
+        return results, missing
+
+    # Partial results are not cached
+    results, missing = await cached_search(
+        sources,
+        ("unified", query, tuple(sorted(sources))),
+        search,
+        cacheable=lambda result: not result[1],
+    )
+    if missing:
+        response.headers["X-Search-Partial"] = ",".join(missing)
 
     return results
@@ -5,7 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas.tag import TagCreate, TagUpdate, TagResponse, TagListResponse
 from src.core.dependencies import get_db, require_moderator
-from src.models.user import User
+from src.core.principal import Principal
 from src.services.tag_service import TagService
 
 router = APIRouter()
@@ -16,7 +16,7 @@ router = APIRouter()
 )
 async def create_tag(
     tag_data: TagCreate,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """Create a new tag (moderator only)."""
@@ -57,7 +57,7 @@ async def get_tag_by_slug(
 async def update_tag(
     tag_id: int = Path(..., description="Tag ID"),
     tag_data: TagUpdate = ...,
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a tag (moderator only)."""
@@ -69,7 +69,7 @@ async def update_tag(
 @router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a tag")
 async def delete_tag(
     tag_id: int = Path(..., description="Tag ID"),
-    current_user: User = Depends(require_moderator),
+    current_user: Principal = Depends(require_moderator),
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a tag (moderator only)."""
@@ -0,0 +1,177 @@
+"""In-process caching with cross-worker invalidation
+
+Provides a small bounded TTL cache for hot per-request lookups and a
+Redis pub/sub channel that tells every worker to drop stale entries.
+
+Invalidation messages have the form ``"{scope}:{key}"`` (e.g. ``"session:abc"``
+or ``"user:42"``). Modules register a handler per scope; publishing applies the
+handler locally first and then broadcasts to the other workers.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, List, Optional, TypeVar
+
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+InvalidationHandler = Callable[[str], None]
+
+# Registered invalidation handlers by scope
+_invalidation_handlers: Dict[str, List[InvalidationHandler]] = {}
+
+# Background listener task (one per worker)
+_listener_task: Optional[asyncio.Task] = None
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded least-recently-used cache with per-entry expiry
+
+    Not thread-safe; intended for use from a single event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[K, tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a value, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> bool:
+        """Remove a key; returns True if it was present"""
+        return self._data.pop(key, None) is not None
+
+    def delete_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Remove every entry matching predicate(key, value)"""
+        stale = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+        for key in stale:
+            del self._data[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+
+def register_invalidation_handler(scope: str, handler: InvalidationHandler) -> None:
+    """Register a callback invoked with the key for each invalidation in scope"""
+    _invalidation_handlers.setdefault(scope, []).append(handler)
+
+
+def _apply_invalidation(message: str) -> None:
+    """Run local handlers for an invalidation message"""
+    scope, _, key = message.partition(":")
+    for handler in _invalidation_handlers.get(scope, []):
+        try:
+            handler(key)
+        except Exception:
+            logger.exception("Cache invalidation handler failed for %s", message)
+
+
+async def publish_invalidation(scope: str, key: Any) -> None:
+    """Invalidate a cache key in this worker and broadcast to all others
+
+    Args:
+        scope: Invalidation scope (e.g. "session", "user")
+        key: Key within the scope
+    """
+    from src.core import session as session_store
+
+    message = f"{scope}:{key}"
+    _apply_invalidation(message)
+
+    if not session_store.redis_client:
+        return
+
+    try:
+        await session_store.redis_client.publish(config.cache.invalidation_channel, message)
+    except Exception:
+        # Other workers fall back to TTL expiry
+        logger.warning("Failed to publish cache invalidation %s", message, exc_info=True)
+
+
+async def _listen_for_invalidations() -> None:
+    """Apply invalidation messages published by other workers"""
+    from src.core import session as session_store
+
+    while True:
+        pubsub = session_store.redis_client.pubsub()
+        try:
+            await pubsub.subscribe(config.cache.invalidation_channel)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                data = message.get("data")
+                if isinstance(data, bytes):
+                    data = data.decode()
+                _apply_invalidation(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Cache invalidation listener error, reconnecting", exc_info=True)
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+async def start_invalidation_listener() -> None:
+    """Start the background invalidation subscriber
+
+    Should be called during application startup, after Redis is initialized.
+    """
+    from src.core import session as session_store
+
+    global _listener_task
+    if _listener_task is None and session_store.redis_client:
+        _listener_task = asyncio.create_task(_listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the background invalidation subscriber
+
+    Should be called during application shutdown.
+    """
+    global _listener_task
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+        _listener_task = None
@@ -50,6 +50,91 @@ class RedisSettings(BaseSettings):
     decode_responses: bool = Field(default=True)
 
 
+class CacheSettings(BaseSettings):
+    """In-process cache configuration"""
+
+    model_config = {"env_prefix": "CACHE_"}
+
+    invalidation_channel: str = Field(default="cache:invalidate")
+    session_principal_ttl_seconds: int = Field(default=30)
+    session_principal_maxsize: int = Field(default=10000)
+    principal_ttl_seconds: int = Field(default=300)
+    count_strategy: str = Field(default="estimate")  # exact, cached, estimate, none
+    count_ttl_seconds: int = Field(default=60)
+    count_maxsize: int = Field(default=10000)
+    count_estimate_min_rows: int = Field(default=100000)
+    like_state_enabled: bool = Field(default=True)
+    like_state_ttl_seconds: int = Field(default=3600)
+    economy_ttl_seconds: int = Field(default=300)
+    levels_ttl_seconds: int = Field(default=300)
+    search_enabled: bool = Field(default=True)
+    search_ttl_seconds: int = Field(default=30)
+    search_maxsize: int = Field(default=2000)
+
+
+class RankingSettings(BaseSettings):
+    """Ranking (post hot score, points and contribution leaderboards) configuration"""
+
+    model_config = {"env_prefix": "RANKING_"}
+
+    hot_gravity: float = Field(default=1.8)  # Age decay exponent
+    hot_comment_weight: float = Field(default=2.0)  # A comment counts as this many likes
+    hot_refresh_interval_seconds: int = Field(default=300)
+    hot_refresh_window_days: int = Field(default=7)  # Older posts keep their last score
+    hot_refresh_batch_size: int = Field(default=1000)
+    leaderboard_enabled: bool = Field(default=True)
+    leaderboard_rebuild_batch_size: int = Field(default=5000)
+    contribution_refresh_interval_seconds: int = Field(default=3600)
+    contribution_refresh_batch_size: int = Field(default=1000)
+
+
+class CounterSettings(BaseSettings):
+    """Buffered engagement counter configuration"""
+
+    model_config = {"env_prefix": "COUNTERS_"}
+
+    view_flush_interval_seconds: int = Field(default=10)
+    view_flush_batch_size: int = Field(default=500)
+    like_shards_enabled: bool = Field(default=True)
+    like_shard_count: int = Field(default=16)
+    like_shard_rate_threshold: int = Field(default=30)
+    like_shard_rate_window_seconds: int = Field(default=60)
+    like_shard_fold_interval_seconds: int = Field(default=5)
+
+
+class LedgerSettings(BaseSettings):
+    """Point ledger (transactions) partitioning and archival configuration"""
+
+    model_config = {"env_prefix": "LEDGER_"}
+
+    partition_months_ahead: int = Field(default=3)  # Monthly partitions created in advance
+    partition_check_interval_seconds: int = Field(default=86400)
+    archive_after_months: int = Field(default=12)  # Full months kept online
+    archive_dir: str = Field(default="./archives/transactions")
+    reconcile_chunk_size: int = Field(default=50000)  # Ledger rows per streamed chunk
+
+
+class SearchSettings(BaseSettings):
+    """Post/comment search engine configuration"""
+
+    model_config = {"env_prefix": "SEARCH_"}
+
+    engine: str = Field(default="database")  # database (full-text / ILIKE) or embedded (BM25)
+    index_dir: str = Field(default="./data/search_index")
+    index_flush_interval_seconds: int = Field(default=30)
+    bm25_k1: float = Field(default=1.2)  # Term frequency saturation
+    bm25_b: float = Field(default=0.75)  # Document length normalization
+    snippet_length: int = Field(default=160)
+    unified_results_per_type: int = Field(default=3)  # Results per source in unified search
+    unified_deadline_ms: int = Field(default=500)  # Sources not done by then are left out
+    suggest_enabled: bool = Field(default=True)  # Typeahead index in Redis
+    suggest_max_prefix_length: int = Field(default=20)
+    suggest_prefix_capacity: int = Field(default=50)  # Most popular items kept per prefix
+    suggest_default_limit: int = Field(default=8)
+    suggest_rebuild_interval_seconds: int = Field(default=3600)
+    suggest_rebuild_batch_size: int = Field(default=1000)
+
+
 class OAuth2ProviderSettings(BaseSettings):
     """OAuth2 provider configuration"""
 
@@ -158,6 +243,11 @@ class Config:
         self.app = self._load_section("application", ApplicationSettings)
         self.database = self._load_section("database", DatabaseSettings)
         self.redis = self._load_section("redis", RedisSettings)
+        self.cache = self._load_section("cache", CacheSettings)
+        self.ranking = self._load_section("ranking", RankingSettings)
+        self.counters = self._load_section("counters", CounterSettings)
+        self.ledger = self._load_section("ledger", LedgerSettings)
+        self.search = self._load_section("search", SearchSettings)
         self.security = self._load_section("security", SecuritySettings)
         self.point_economy = self._load_section("point_economy", PointEconomySettings)
         self.user_levels = self._load_section("user_levels", UserLevelSettings)
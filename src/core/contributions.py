@@ -0,0 +1,221 @@
+"""Contribution leaderboard (posts + comments per user)
+
+    user_contribution_stats   user_id, post_count, comment_count, contribution_score
+
+Post and comment writes adjust their author's row in the same transaction
+(``record_contribution``), so the /leaderboard page is one indexed top-N
+read instead of grouping ``users`` against ``posts`` and ``comments``. Only
+content that has not been deleted counts.
+
+A background task recomputes every row from the content tables every
+``ranking.contribution_refresh_interval_seconds`` to correct drift from
+writes that bypass the services.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import desc, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.core.database import dialect_insert
+from src.models.content import Comment, ContentStatus, Post, UserContributionStats
+from src.models.user import User
+
+logger = logging.getLogger(__name__)
+
+CONTRIBUTION_REFRESH_LOCK_KEY = "lock:contribution_refresh"
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def counts_as_contribution(status: Optional[ContentStatus]) -> bool:
+    """Whether content in this status counts towards its author's stats"""
+    return status is not None and status != ContentStatus.DELETED
+
+
+async def record_contribution(
+    db: AsyncSession, user_id: int, posts: int = 0, comments: int = 0
+) -> None:
+    """Adjust a user's contribution counts in the caller's transaction
+
+    Args:
+        db: Session whose transaction also writes the post/comment
+        user_id: Author
+        posts: Change to the post count
+        comments: Change to the comment count
+    """
+    if not posts and not comments:
+        return
+
+    stmt = dialect_insert(db, UserContributionStats).values(
+        user_id=user_id,
+        post_count=max(posts, 0),
+        comment_count=max(comments, 0),
+        contribution_score=max(posts, 0) + max(comments, 0),
+        updated_at=datetime.utcnow(),
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[UserContributionStats.user_id],
+            set_={
+                "post_count": UserContributionStats.post_count + posts,
+                "comment_count": UserContributionStats.comment_count + comments,
+                "contribution_score": UserContributionStats.contribution_score + posts + comments,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def get_top_contributors(db: AsyncSession, limit: int = 50) -> List[Dict]:
+    """Top active users by posts + comments"""
+    result = await db.execute(
+        select(
+            User.username,
+            User.display_name,
+            User.avatar_url,
+            UserContributionStats.post_count,
+            UserContributionStats.comment_count,
+            UserContributionStats.contribution_score,
+        )
+        .join(User, User.id == UserContributionStats.user_id)
+        .where(UserContributionStats.contribution_score > 0)
+        .where(User.is_active)
+        .where(~User.is_banned)
+        .order_by(desc(UserContributionStats.contribution_score), UserContributionStats.user_id)
+        .limit(limit)
+    )
+    return [dict(row._mapping) for row in result.all()]
+
+
+async def refresh_contribution_stats(db: AsyncSession) -> int:
+    """Recompute every user's contribution counts from the content tables
+
+    Counts posts and comments in two separate grouped scans, then rewrites
+    the stats in one transaction: users who no longer have content are
+    zeroed and everyone else is upserted.
+
+    Returns:
+        Number of users with contributions
+    """
+    counts: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+    for index, model in enumerate((Post, Comment)):
+        result = await db.execute(
+            select(model.user_id, func.count())
+            .where(model.status != ContentStatus.DELETED)
+            .group_by(model.user_id)
+        )
+        for user_id, count in result.all():
+            counts[user_id][index] = count
+
+    now = datetime.utcnow()
+    try:
+        await db.execute(
+            update(UserContributionStats)
+            .where(UserContributionStats.user_id.not_in(list(counts)))
+            .where(UserContributionStats.contribution_score != 0)
+            .values(post_count=0, comment_count=0, contribution_score=0, updated_at=now)
+        )
+
+        rows = [
+            {
+                "user_id": user_id,
+                "post_count": post_count,
+                "comment_count": comment_count,
+                "contribution_score": post_count + comment_count,
+                "updated_at": now,
+            }
+            for user_id, (post_count, comment_count) in counts.items()
+        ]
+        batch_size = config.ranking.contribution_refresh_batch_size
+        for start in range(0, len(rows), batch_size):
+            stmt = dialect_insert(db, UserContributionStats).values(
+                rows[start : start + batch_size]
+            )
+            await db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[UserContributionStats.user_id],
+                    set_={
+                        "post_count": stmt.excluded.post_count,
+                        "comment_count": stmt.excluded.comment_count,
+                        "contribution_score": stmt.excluded.contribution_score,
+                        "updated_at": stmt.excluded.updated_at,
+                    },
+                )
+            )
+
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    return len(counts)
+
+
+async def _acquire_refresh_lock() -> bool:
+    """Let only one worker run each refresh cycle"""
+    from src.core import session as session_store
+
+    if not session_store.redis_client:
+        return True
+
+    try:
+        return bool(
+            await session_store.redis_client.set(
+                CONTRIBUTION_REFRESH_LOCK_KEY,
+                "1",
+                nx=True,
+                ex=max(config.ranking.contribution_refresh_interval_seconds - 1, 1),
+            )
+        )
+    except Exception:
+        logger.warning("Failed to take contribution refresh lock", exc_info=True)
+        return True
+
+
+async def _refresh_loop() -> None:
+    """Periodically recompute contribution stats"""
+    from src.core.database import AsyncSessionLocal
+
+    while True:
+        await asyncio.sleep(config.ranking.contribution_refresh_interval_seconds)
+        try:
+            if not await _acquire_refresh_lock():
+                continue
+            async with AsyncSessionLocal() as db:
+                users = await refresh_contribution_stats(db)
+            logger.debug("Refreshed contribution stats for %d users", users)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Contribution stats refresh failed", exc_info=True)
+
+
+async def start_contribution_refresher() -> None:
+    """Start the background contribution stats refresh task
+
+    Should be called during application startup.
+    """
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_contribution_refresher() -> None:
+    """Stop the background contribution stats refresh task
+
+    Should be called during application shutdown.
+    """
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
@@ -0,0 +1,168 @@
+"""Count strategies for paginated list totals
+
+A paginated list used to run ``SELECT count(*)`` with the same filters as
+the page query on every request, roughly doubling its cost. Services now
+resolve totals through ``count_rows`` with one of these strategies:
+
+    exact     run the count query
+    cached    per-worker TTL cache keyed by the count statement; writes
+              call ``invalidate_counts(scope)`` to drop a table's entries
+              in every worker
+    estimate  ``pg_class.reltuples`` for unfiltered lists on large tables,
+              otherwise behaves like ``cached``
+    none      skip the count; the page query fetches one look-ahead row
+              and the total becomes a lower bound that only answers
+              "is there another page?"
+
+Callers follow the same three steps regardless of strategy::
+
+    total = await count_rows(db, count_query, strategy, scope="posts")
+    query = query.offset(offset).limit(page_limit(page_size, strategy))
+    rows, total = finish_page(rows, total, page, page_size)
+
+after which ``has_more(total, page, page_size)`` is correct for all of them.
+"""
+
+import hashlib
+import logging
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache, publish_invalidation, register_invalidation_handler
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CountStrategy(str, Enum):
+    """How a list endpoint computes its total"""
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+
+# Per-worker "{scope}:{statement digest}" -> row count
+count_cache: TTLCache[str, int] = TTLCache(
+    maxsize=config.cache.count_maxsize,
+    ttl_seconds=config.cache.count_ttl_seconds,
+)
+
+
+def _evict_scope(scope: str) -> None:
+    prefix = f"{scope}:"
+    count_cache.delete_where(lambda key, _: key.startswith(prefix))
+
+
+register_invalidation_handler("count", _evict_scope)
+
+
+def default_strategy() -> CountStrategy:
+    """Strategy used when a caller does not ask for one"""
+    return CountStrategy(config.cache.count_strategy)
+
+
+def _cache_key(scope: str, count_query: Select) -> str:
+    """Key a count by its SQL and bound parameters"""
+    compiled = count_query.compile()
+    params = sorted((k, repr(v)) for k, v in compiled.params.items())
+    digest = hashlib.sha1(f"{compiled}|{params}".encode()).hexdigest()
+    return f"{scope}:{digest}"
+
+
+async def _estimate_rows(db: AsyncSession, table: str) -> Optional[int]:
+    """Planner row estimate for a table, or None if unavailable"""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+
+    try:
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+            {"table": table},
+        )
+        estimate = result.scalar()
+    except Exception:
+        logger.warning("Failed to read row estimate for %s", table, exc_info=True)
+        return None
+
+    # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+    if estimate is None or estimate < config.cache.count_estimate_min_rows:
+        return None
+    return int(estimate)
+
+
+async def count_rows(
+    db: AsyncSession,
+    count_query: Select,
+    strategy: Optional[CountStrategy] = None,
+    scope: str = "default",
+    table: Optional[str] = None,
+) -> Optional[int]:
+    """Resolve the total for a list query
+
+    Args:
+        db: Database session
+        count_query: ``select(func.count())`` with the list's filters
+        strategy: Count strategy (defaults to ``cache.count_strategy``)
+        scope: Invalidation scope, normally the table name
+        table: Table to estimate from; pass only when the list is unfiltered
+
+    Returns:
+        Row count, or None for ``CountStrategy.NONE``
+    """
+    strategy = strategy or default_strategy()
+
+    if strategy == CountStrategy.NONE:
+        return None
+
+    if strategy == CountStrategy.ESTIMATE and table:
+        estimate = await _estimate_rows(db, table)
+        if estimate is not None:
+            return estimate
+
+    if strategy == CountStrategy.EXACT:
+        return (await db.execute(count_query)).scalar() or 0
+
+    key = _cache_key(scope, count_query)
+    total = count_cache.get(key)
+    if total is None:
+        total = (await db.execute(count_query)).scalar() or 0
+        count_cache.set(key, total)
+    return total
+
+
+def page_limit(page_size: int, strategy: Optional[CountStrategy] = None) -> int:
+    """LIMIT for a page query, including the look-ahead row when totals are skipped"""
+    if (strategy or default_strategy()) == CountStrategy.NONE:
+        return page_size + 1
+    return page_size
+
+
+def finish_page(
+    rows: Sequence[T], total: Optional[int], page: int, page_size: int
+) -> Tuple[List[T], int]:
+    """Trim the look-ahead row and fill in a lower-bound total when skipped"""
+    if total is None:
+        total = (page - 1) * page_size + len(rows)
+        rows = rows[:page_size]
+    return list(rows), total
+
+
+def has_more(total: int, page: int, page_size: int) -> bool:
+    """Whether another page follows ``page``"""
+    return total > page * page_size
+
+
+async def invalidate_counts(scope: str) -> None:
+    """Drop cached counts for a scope in every worker
+
+    Call after inserting, deleting or changing the status of rows in the
+    scope's table.
+    """
+    await publish_invalidation("count", scope)
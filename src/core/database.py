@@ -56,6 +56,20 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def dialect_insert(db: AsyncSession, model):
+    """INSERT construct for the session's dialect
+
+    Returns the PostgreSQL (or SQLite, in tests) insert, which supports
+    ``on_conflict_do_nothing`` / ``on_conflict_do_update``.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    return insert(model)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting async database sessions
 
@@ -75,6 +89,15 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker:
+    """Dependency for routes that open their own sessions
+
+    For work that runs several queries concurrently, which a single
+    session cannot do.
+    """
+    return AsyncSessionLocal
+
+
 async def init_db() -> None:
     """Initialize database tables
 
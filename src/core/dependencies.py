@@ -5,7 +5,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_db, get_session_factory  # noqa: F401
+from src.core.principal import Principal, get_principal
 from src.core.security import verify_access_token
 from src.models.user import User
 from src.services.user_service import UserService
@@ -15,11 +16,15 @@ from src.services.user_service import UserService
 security = HTTPBearer()
 
 
-async def get_current_user(
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> User:
-    """Get current authenticated user from JWT token"""
+) -> Principal:
+    """Get current authenticated principal from JWT token
+
+    Served from the Redis principal snapshot; the users table is only read
+    on a cache miss.
+    """
     token = credentials.credentials
 
     # Verify token
@@ -40,11 +45,8 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Get user from database
-    user_service = UserService(db)
-    try:
-        user = await user_service.get_user_by_id(int(user_id))
-    except Exception:
+    principal = await get_principal(int(user_id), db)
+    if principal is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
@@ -52,13 +54,33 @@ async def get_current_user(
         )
 
     # Check if user is active
-    if not user.is_active:
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Account is inactive",
         )
 
-    return user
+    return principal
+
+
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Get current authenticated user from JWT token
+
+    Loads the full User row; prefer get_current_principal when only identity
+    and permissions are needed.
+    """
+    user_service = UserService(db)
+    try:
+        return await user_service.get_user_by_id(principal.id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -66,6 +88,33 @@ async def get_current_active_user(current_user: User = Depends(get_current_user)
     return current_user
 
 
+async def get_optional_current_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    db: AsyncSession = Depends(get_db),
+) -> Optional[Principal]:
+    """Get current principal if authenticated, None otherwise"""
+    if credentials is None:
+        return None
+
+    try:
+        token = credentials.credentials
+        payload = verify_access_token(token)
+        if payload is None:
+            return None
+
+        user_id = payload.get("sub")
+        if user_id is None:
+            return None
+
+        principal = await get_principal(int(user_id), db)
+        if principal is None or not principal.is_active:
+            return None
+
+        return principal
+    except Exception:
+        return None
+
+
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     db: AsyncSession = Depends(get_db),
@@ -95,11 +144,9 @@ async def get_optional_current_user(
         return None
 
 
-def require_moderator(current_user: User = Depends(get_current_user)) -> User:
+def require_moderator(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Require user to be at least a moderator"""
-    from src.models.user import UserLevelEnum
-
-    if current_user.level not in [UserLevelEnum.MODERATOR, UserLevelEnum.SENIOR_MODERATOR]:
+    if not current_user.is_moderator:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Moderator access required",
@@ -108,7 +155,9 @@ def require_moderator(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-def require_senior_moderator(current_user: User = Depends(get_current_user)) -> User:
+def require_senior_moderator(
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
     """Require user to be a senior moderator"""
     from src.models.user import UserLevelEnum
 
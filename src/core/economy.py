@@ -0,0 +1,98 @@
+"""Cached point economy configuration
+
+The ``point_economy`` row is read by every like, registration, points
+summary and crypto claim but changes only when an admin edits it. Workers
+keep an immutable ``EconomyConfig`` snapshot stamped with the row's
+``updated_at`` (its version):
+
+    update      ``PointService.update_economy_config`` commits the row and
+                publishes ``economy:{version}``; every worker whose
+                snapshot has a different version drops it
+    safety net  snapshots also expire after ``cache.economy_ttl_seconds``,
+                so a missed pub/sub message only delays the change
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from src.core.cache import TTLCache, publish_invalidation, register_invalidation_handler
+from src.core.config import config
+from src.models.points import PointEconomy
+
+ECONOMY_CACHE_KEY = "economy"
+
+
+@dataclass(frozen=True)
+class EconomyConfig:
+    """Point costs and rewards"""
+
+    create_post_cost: int
+    create_comment_cost: int
+    like_cost: int
+    registration_bonus: int
+    receive_like_tier1: int
+    receive_like_tier2: int
+    receive_like_tier3: int
+    crypto_reward_cost: int
+    crypto_reward_bnb_amount: str
+    updated_at: datetime
+
+    @property
+    def version(self) -> str:
+        """Version stamp carried by invalidation messages"""
+        return self.updated_at.isoformat()
+
+    @classmethod
+    def from_model(cls, economy: PointEconomy) -> "EconomyConfig":
+        """Build a snapshot from the point_economy row"""
+        return cls(
+            create_post_cost=economy.create_post_cost,
+            create_comment_cost=economy.create_comment_cost,
+            like_cost=economy.like_cost,
+            registration_bonus=economy.registration_bonus,
+            receive_like_tier1=economy.receive_like_tier1,
+            receive_like_tier2=economy.receive_like_tier2,
+            receive_like_tier3=economy.receive_like_tier3,
+            crypto_reward_cost=economy.crypto_reward_cost,
+            crypto_reward_bnb_amount=str(economy.crypto_reward_bnb_amount),
+            updated_at=economy.updated_at,
+        )
+
+
+# Per-worker snapshot (a single entry)
+economy_cache: TTLCache[str, EconomyConfig] = TTLCache(
+    maxsize=1, ttl_seconds=config.cache.economy_ttl_seconds
+)
+
+
+def _evict_stale(version: str) -> None:
+    cached = economy_cache.get(ECONOMY_CACHE_KEY)
+    if cached is not None and cached.version != version:
+        economy_cache.delete(ECONOMY_CACHE_KEY)
+
+
+register_invalidation_handler("economy", _evict_stale)
+
+
+def get_cached_economy() -> Optional[EconomyConfig]:
+    """This worker's economy snapshot, or None if it must be reloaded"""
+    return economy_cache.get(ECONOMY_CACHE_KEY)
+
+
+def cache_economy(economy: PointEconomy) -> EconomyConfig:
+    """Snapshot the economy row into this worker's cache"""
+    snapshot = EconomyConfig.from_model(economy)
+    economy_cache.set(ECONOMY_CACHE_KEY, snapshot)
+    return snapshot
+
+
+async def publish_economy_change(economy: PointEconomy) -> EconomyConfig:
+    """Announce a committed economy change to every worker
+
+    Call after committing the row.
+    """
+    snapshot = EconomyConfig.from_model(economy)
+    await publish_invalidation("economy", snapshot.version)
+    economy_cache.set(ECONOMY_CACHE_KEY, snapshot)
+    return snapshot
@@ -84,6 +84,13 @@ class ValidationError(BaseAPIException):
         super().__init__(detail=detail, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
 
 
+class InvalidCursorError(BaseAPIException):
+    """Raised when a pagination cursor cannot be decoded"""
+
+    def __init__(self, detail: str = "Invalid pagination cursor"):
+        super().__init__(detail=detail, status_code=status.HTTP_400_BAD_REQUEST)
+
+
 class DuplicateLikeError(BaseAPIException):
     """Raised when attempting to like content twice"""
 
@@ -120,6 +127,20 @@ class InsufficientPointsError(BaseAPIException):
         super().__init__(detail=detail, status_code=status.HTTP_400_BAD_REQUEST)
 
 
+class GrantBatchNotFoundError(BaseAPIException):
+    """Raised when a bulk point grant batch is not found"""
+
+    def __init__(self, detail: str = "Grant batch not found"):
+        super().__init__(detail=detail, status_code=status.HTTP_404_NOT_FOUND)
+
+
+class GrantBatchConflictError(BaseAPIException):
+    """Raised when a bulk point grant batch is being applied by another run"""
+
+    def __init__(self, detail: str = "Grant batch is being applied by another run"):
+        super().__init__(detail=detail, status_code=status.HTTP_409_CONFLICT)
+
+
 class InvalidWalletAddressError(BaseAPIException):
     """Raised when wallet address is invalid"""
 
@@ -0,0 +1,59 @@
+"""PostgreSQL text search: full-text for content, trigrams for users
+
+On PostgreSQL ``posts`` and ``comments`` carry a stored generated
+``search_vector`` column with a GIN index (``SEARCH_VECTORS`` in
+``src/models/content.py``):
+
+    posts.search_vector      title (weight A) || body (weight B)
+    comments.search_vector   body
+
+Queries are parsed with ``websearch_to_tsquery`` (quoted phrases, ``or``,
+``-exclusions``), matched with ``@@`` through the index and ordered by
+``ts_rank``.
+
+User names are searched with ``ILIKE '%q%'``, which PostgreSQL answers from
+``pg_trgm`` GIN indexes on ``users.username`` and ``users.display_name``
+(``USER_TRIGRAM_COLUMNS`` in ``src/models/user.py``), and ranked by
+trigram ``similarity``.
+
+On other databases (SQLite in tests) there are no search vectors or
+trigram indexes: callers fall back to ``ILIKE`` without relevance ranking.
+"""
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.models.content import TEXT_SEARCH_CONFIG
+
+
+def is_supported(db: AsyncSession) -> bool:
+    """Whether the session's database has search vectors"""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def search_vector(model) -> ColumnElement:
+    """The unmapped ``search_vector`` column of a posts/comments query"""
+    return literal_column(f"{model.__tablename__}.search_vector", TSVECTOR)
+
+
+def parse_query(query: str) -> ColumnElement:
+    """``websearch_to_tsquery`` for a user's search string"""
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+
+
+def matches(model, query: str) -> ColumnElement:
+    """Index-backed ``search_vector @@ query`` filter"""
+    return search_vector(model).op("@@")(parse_query(query))
+
+
+def rank(model, query: str) -> ColumnElement:
+    """``ts_rank`` relevance of a row for a query"""
+    return func.ts_rank(search_vector(model), parse_query(query))
+
+
+def similarity(query: str, *columns) -> ColumnElement:
+    """Best trigram ``similarity`` of the query to any of the columns"""
+    scores = [func.similarity(column, query) for column in columns]
+    return scores[0] if len(scores) == 1 else func.greatest(*scores)
@@ -0,0 +1,225 @@
+"""Points leaderboard in a Redis sorted set
+
+    leaderboard:points   ZSET  member=user_id  score=points   (active users)
+
+Ledger writes update a user's score after commit (``update_scores``), new
+accounts are added on registration and deactivated accounts are removed,
+so pages are ``ZREVRANGE`` and "my rank" is ``ZREVRANK`` instead of a
+COUNT plus an ORDER BY ... OFFSET scan over ``users``.
+
+Score updates only touch a leaderboard that has been built; until
+``rebuild_leaderboard`` has run (at startup when the key is missing, or
+via ``scripts/rebuild_leaderboard.py``) callers fall back to SQL.
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_KEY = "leaderboard:points"
+LEADERBOARD_REBUILD_KEY = "leaderboard:points:rebuild"
+LEADERBOARD_LOCK_KEY = "lock:leaderboard_rebuild"
+
+# Apply scores to the live leaderboard and to one being rebuilt, but never
+# create a partial leaderboard from scratch
+_UPDATE_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if redis.call('EXISTS', key) == 1 then
+        for i = 1, #ARGV, 2 do
+            redis.call('ZADD', key, ARGV[i + 1], ARGV[i])
+        end
+    end
+end
+return 1
+"""
+
+_rebuild_task: Optional[asyncio.Task] = None
+
+
+def _redis():
+    from src.core import session as session_store
+
+    if not config.ranking.leaderboard_enabled:
+        return None
+    return session_store.redis_client
+
+
+async def is_available() -> bool:
+    """Whether the leaderboard has been built and can serve reads"""
+    redis = _redis()
+    if not redis:
+        return False
+
+    try:
+        return bool(await redis.exists(LEADERBOARD_KEY))
+    except Exception:
+        logger.warning("Failed to check leaderboard", exc_info=True)
+        return False
+
+
+async def update_scores(scores: Dict[int, int]) -> None:
+    """Set users' scores after a committed balance change
+
+    Args:
+        scores: User ID -> points
+    """
+    redis = _redis()
+    if not redis or not scores:
+        return
+
+    args = []
+    for user_id, points in scores.items():
+        args.extend((user_id, points))
+
+    try:
+        await redis.eval(_UPDATE_SCRIPT, 2, LEADERBOARD_KEY, LEADERBOARD_REBUILD_KEY, *args)
+    except Exception:
+        logger.warning("Failed to update leaderboard scores", exc_info=True)
+
+
+async def remove_user(user_id: int) -> None:
+    """Drop a deactivated user from the leaderboard"""
+    redis = _redis()
+    if not redis:
+        return
+
+    try:
+        await redis.zrem(LEADERBOARD_KEY, user_id)
+        await redis.zrem(LEADERBOARD_REBUILD_KEY, user_id)
+    except Exception:
+        logger.warning("Failed to remove user %s from leaderboard", user_id, exc_info=True)
+
+
+async def get_page(offset: int, limit: int) -> Tuple[List[Tuple[int, int]], int]:
+    """Read a leaderboard page
+
+    Returns:
+        Tuple of ([(user_id, points), ...] highest first, total users)
+    """
+    redis = _redis()
+    pipe = redis.pipeline(transaction=False)
+    pipe.zrevrange(LEADERBOARD_KEY, offset, offset + limit - 1, withscores=True)
+    pipe.zcard(LEADERBOARD_KEY)
+    entries, total = await pipe.execute()
+    return [(int(member), int(score)) for member, score in entries], int(total)
+
+
+async def get_rank(user_id: int) -> Optional[Tuple[int, int, int]]:
+    """A user's 1-based rank
+
+    Returns:
+        Tuple of (rank, points, total users), or None if the user is not ranked
+    """
+    redis = _redis()
+    pipe = redis.pipeline(transaction=False)
+    pipe.zrevrank(LEADERBOARD_KEY, user_id)
+    pipe.zscore(LEADERBOARD_KEY, user_id)
+    pipe.zcard(LEADERBOARD_KEY)
+    rank, score, total = await pipe.execute()
+    if rank is None:
+        return None
+    return int(rank) + 1, int(score), int(total)
+
+
+async def rebuild_leaderboard(db: AsyncSession, batch_size: Optional[int] = None) -> int:
+    """Rebuild the leaderboard from the users table
+
+    Streams active users in primary-key batches into a staging key and
+    swaps it in with RENAME, so readers never see a partial leaderboard.
+    Score updates made while the rebuild runs are applied to both keys.
+
+    Args:
+        db: Database session to read users with
+        batch_size: Users per batch (defaults to ``ranking.leaderboard_rebuild_batch_size``)
+
+    Returns:
+        Number of users in the rebuilt leaderboard
+    """
+    from src.models.user import User
+
+    redis = _redis()
+    if not redis:
+        return 0
+
+    batch_size = batch_size or config.ranking.leaderboard_rebuild_batch_size
+    # Placeholder member marks the staging key as existing for update_scores
+    await redis.delete(LEADERBOARD_REBUILD_KEY)
+    await redis.zadd(LEADERBOARD_REBUILD_KEY, {"-": 0})
+
+    count = 0
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(User.id, User.points)
+            .where(User.is_active, User.id > last_id)
+            .order_by(User.id)
+            .limit(batch_size)
+        )
+        rows = result.all()
+        if not rows:
+            break
+
+        await redis.zadd(LEADERBOARD_REBUILD_KEY, {str(row.id): row.points for row in rows})
+        count += len(rows)
+        last_id = rows[-1].id
+
+    await redis.zrem(LEADERBOARD_REBUILD_KEY, "-")
+    if count:
+        await redis.rename(LEADERBOARD_REBUILD_KEY, LEADERBOARD_KEY)
+    else:
+        await redis.delete(LEADERBOARD_REBUILD_KEY, LEADERBOARD_KEY)
+
+    return count
+
+
+async def _rebuild_if_missing() -> None:
+    """Build the leaderboard once if no worker has yet"""
+    from src.core.database import AsyncSessionLocal
+
+    redis = _redis()
+    if not redis or await is_available():
+        return
+
+    if not await redis.set(LEADERBOARD_LOCK_KEY, "1", nx=True, ex=600):
+        return
+
+    try:
+        async with AsyncSessionLocal() as db:
+            count = await rebuild_leaderboard(db)
+        logger.info("Built points leaderboard with %d users", count)
+    except Exception:
+        logger.warning("Leaderboard rebuild failed", exc_info=True)
+    finally:
+        await redis.delete(LEADERBOARD_LOCK_KEY)
+
+
+async def start_leaderboard() -> None:
+    """Build the leaderboard in the background if it does not exist
+
+    Should be called during application startup, after Redis is initialized.
+    """
+    global _rebuild_task
+    if _rebuild_task is None and _redis():
+        _rebuild_task = asyncio.create_task(_rebuild_if_missing())
+
+
+async def stop_leaderboard() -> None:
+    """Cancel a startup rebuild that is still running
+
+    Should be called during application shutdown.
+    """
+    global _rebuild_task
+    if _rebuild_task is not None:
+        _rebuild_task.cancel()
+        try:
+            await _rebuild_task
+        except asyncio.CancelledError:
+            pass
+        _rebuild_task = None
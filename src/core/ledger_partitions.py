@@ -0,0 +1,300 @@
+"""Monthly partitions of the point ledger
+
+On PostgreSQL ``transactions`` is range-partitioned on ``created_at``:
+
+    transactions_y2026m10   [2026-10-01, 2026-11-01)
+    transactions_default    anything without a partition
+
+Ledger rows are only ever inserted at ``now()``, so past months never
+change. A background task keeps ``ledger.partition_months_ahead`` future
+months created, and ``archive_cold_partitions`` (run by
+``scripts/archive_transactions.py``) exports months older than
+``ledger.archive_after_months`` to gzip CSV files, folds their per-user
+totals into ``archived_point_totals`` and drops them.
+
+On other databases (SQLite in tests) the table is not partitioned and
+these functions do nothing.
+"""
+
+import asyncio
+import csv
+import gzip
+import logging
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.models.points import Transaction, TransactionArchive
+
+logger = logging.getLogger(__name__)
+
+PARTITION_MAINTENANCE_LOCK_KEY = "lock:ledger_partitions"
+
+_PARTITION_NAME = re.compile(r"^transactions_y(\d{4})m(\d{2})$")
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of the month containing ``moment``"""
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Shift a month start by a number of months"""
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    """Partition table name for a month"""
+    return f"transactions_y{month.year:04d}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Month covered by a partition table, or None for the default partition"""
+    match = _PARTITION_NAME.match(name)
+    if not match:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1)
+
+
+def cold_partitions(
+    names: List[str], now: Optional[datetime] = None, keep_months: Optional[int] = None
+) -> List[str]:
+    """Monthly partitions that ended more than ``keep_months`` full months ago
+
+    Returns:
+        Partition names, oldest first
+    """
+    if keep_months is None:
+        keep_months = config.ledger.archive_after_months
+    cutoff = add_months(month_start(now or datetime.utcnow()), -keep_months)
+
+    months = [(partition_month(name), name) for name in names]
+    return [name for month, name in sorted(m for m in months if m[0]) if month < cutoff]
+
+
+async def is_partitioned(db: AsyncSession) -> bool:
+    """Whether ``transactions`` is a partitioned table"""
+    if db.bind.dialect.name != "postgresql":
+        return False
+    return bool(
+        await db.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('transactions'))"
+            )
+        )
+    )
+
+
+async def list_partitions(db: AsyncSession) -> List[str]:
+    """Names of the partitions currently attached to ``transactions``"""
+    result = await db.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass('transactions') ORDER BY c.relname"
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def ensure_partitions(db: AsyncSession, months_ahead: Optional[int] = None) -> List[str]:
+    """Create monthly partitions from this month to ``months_ahead`` months out
+
+    Returns:
+        Names of the partitions created
+    """
+    if not await is_partitioned(db):
+        return []
+
+    if months_ahead is None:
+        months_ahead = config.ledger.partition_months_ahead
+    existing = set(await list_partitions(db))
+    current = month_start(datetime.utcnow())
+
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        try:
+            await db.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF transactions "
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{add_months(month, 1).isoformat()}')"
+                )
+            )
+            await db.commit()
+            created.append(name)
+        except Exception:
+            # e.g. the default partition already holds rows for this month
+            await db.rollback()
+            logger.warning("Failed to create ledger partition %s", name, exc_info=True)
+
+    return created
+
+
+async def archive_partition(
+    db: AsyncSession, name: str, directory: Optional[Path] = None
+) -> TransactionArchive:
+    """Export a month to ``{directory}/{name}.csv.gz`` and drop it
+
+    The rows are streamed to a temporary file that is synced and renamed
+    into place. Then, in one database transaction, the partition's per-user
+    totals are added to ``archived_point_totals``, the partition is detached
+    and its row count re-checked against the export, and it is dropped.
+    Any mismatch rolls everything back and leaves the month online.
+    """
+    month = partition_month(name)
+    if month is None:
+        raise ValueError(f"{name} is not a monthly ledger partition")
+    range_end = add_months(month, 1)
+
+    directory = Path(directory or config.ledger.archive_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.csv.gz"
+    partial = directory / f"{name}.csv.gz.partial"
+
+    columns = list(Transaction.__table__.columns)
+    exported = 0
+    result = await db.stream(
+        select(*columns)
+        .where(Transaction.created_at >= month, Transaction.created_at < range_end)
+        .order_by(Transaction.id)
+        .execution_options(yield_per=5000)
+    )
+    with gzip.open(partial, "wt", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow([column.name for column in columns])
+        async for rows in result.partitions():
+            writer.writerows(rows)
+            exported += len(rows)
+
+    with open(partial, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(partial, path)
+
+    try:
+        await db.execute(text(f"""
+                INSERT INTO archived_point_totals (user_id, total_earned, total_spent, tx_count)
+                SELECT user_id,
+                       COALESCE(SUM(amount) FILTER (WHERE amount > 0), 0),
+                       COALESCE(-SUM(amount) FILTER (WHERE amount < 0), 0),
+                       COUNT(*)
+                FROM {name}
+                GROUP BY user_id
+                ON CONFLICT (user_id) DO UPDATE SET
+                    total_earned = archived_point_totals.total_earned + EXCLUDED.total_earned,
+                    total_spent = archived_point_totals.total_spent + EXCLUDED.total_spent,
+                    tx_count = archived_point_totals.tx_count + EXCLUDED.tx_count
+                """))
+        await db.execute(text(f"ALTER TABLE transactions DETACH PARTITION {name}"))
+        detached = await db.scalar(select(func.count()).select_from(text(name)))
+        if detached != exported:
+            raise RuntimeError(
+                f"{name} has {detached} rows but {exported} were exported; not dropping"
+            )
+        await db.execute(text(f"DROP TABLE {name}"))
+
+        archive = TransactionArchive(
+            partition_name=name,
+            range_start=month,
+            range_end=range_end,
+            row_count=exported,
+            file_path=str(path),
+            archived_at=datetime.utcnow(),
+        )
+        db.add(archive)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    return archive
+
+
+async def archive_cold_partitions(
+    db: AsyncSession, directory: Optional[Path] = None, keep_months: Optional[int] = None
+) -> List[TransactionArchive]:
+    """Archive every monthly partition older than the retention window"""
+    if not await is_partitioned(db):
+        return []
+
+    archives = []
+    for name in cold_partitions(await list_partitions(db), keep_months=keep_months):
+        archives.append(await archive_partition(db, name, directory))
+    return archives
+
+
+async def _acquire_maintenance_lock() -> bool:
+    """Let only one worker run each maintenance cycle"""
+    from src.core import session as session_store
+
+    if not session_store.redis_client:
+        return True
+
+    try:
+        return bool(
+            await session_store.redis_client.set(
+                PARTITION_MAINTENANCE_LOCK_KEY,
+                "1",
+                nx=True,
+                ex=max(config.ledger.partition_check_interval_seconds - 1, 1),
+            )
+        )
+    except Exception:
+        logger.warning("Failed to take ledger partition lock", exc_info=True)
+        return True
+
+
+async def _maintenance_loop() -> None:
+    """Create upcoming partitions at startup and then periodically"""
+    from src.core.database import AsyncSessionLocal
+
+    while True:
+        try:
+            if await _acquire_maintenance_lock():
+                async with AsyncSessionLocal() as db:
+                    created = await ensure_partitions(db)
+                if created:
+                    logger.info("Created ledger partitions %s", ", ".join(created))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Ledger partition maintenance failed", exc_info=True)
+        await asyncio.sleep(config.ledger.partition_check_interval_seconds)
+
+
+async def start_partition_maintainer() -> None:
+    """Start the background ledger partition maintenance task
+
+    Should be called during application startup.
+    """
+    global _maintenance_task
+    if _maintenance_task is None:
+        _maintenance_task = asyncio.create_task(_maintenance_loop())
+
+
+async def stop_partition_maintainer() -> None:
+    """Stop the background ledger partition maintenance task
+
+    Should be called during application shutdown.
+    """
+    global _maintenance_task
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        try:
+            await _maintenance_task
+        except asyncio.CancelledError:
+            pass
+        _maintenance_task = None
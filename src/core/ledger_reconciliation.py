@@ -0,0 +1,190 @@
+"""Balance reconciliation against the point ledger
+
+Every user's ``points`` must equal the sum of their ``transactions.amount``
+plus the net of any months archived into ``archived_point_totals``.
+
+``find_balance_mismatches`` checks every user in one pass: it streams
+``(user_id, amount)`` through a server-side cursor in
+``ledger.reconcile_chunk_size`` chunks, folding each chunk into per-user
+sums, then streams ``(id, points)`` the same way and compares. On
+PostgreSQL both reads share one ``REPEATABLE READ`` snapshot, so writes
+that land mid-scan never show up as false mismatches.
+
+``repair_balance_mismatches`` treats ``users.points`` as authoritative and
+appends one corrective ``ADMIN_ADJUSTMENT`` entry per user, re-checking
+each batch under row locks first.
+"""
+
+import csv
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.core.counting import invalidate_counts
+from src.models.points import ArchivedPointTotal, Transaction, TransactionType
+from src.models.user import User
+
+RECONCILIATION_REFERENCE_TYPE = "ledger_reconciliation"
+
+
+@dataclass(frozen=True)
+class BalanceMismatch:
+    """A user whose balance disagrees with their ledger"""
+
+    user_id: int
+    points: int
+    ledger_balance: int
+
+    @property
+    def difference(self) -> int:
+        """Amount missing from the ledger (negative if the ledger is ahead)"""
+        return self.points - self.ledger_balance
+
+
+async def _archived_balances(db: AsyncSession, user_ids: Optional[List[int]] = None):
+    stmt = select(
+        ArchivedPointTotal.user_id,
+        ArchivedPointTotal.total_earned - ArchivedPointTotal.total_spent,
+    )
+    if user_ids is not None:
+        stmt = stmt.where(ArchivedPointTotal.user_id.in_(user_ids))
+    result = await db.execute(stmt)
+    return dict(result.all())
+
+
+async def find_balance_mismatches(
+    db: AsyncSession, chunk_size: Optional[int] = None
+) -> List[BalanceMismatch]:
+    """Compare every user's balance with their ledger
+
+    Returns:
+        Mismatches ordered by user ID
+    """
+    chunk_size = chunk_size or config.ledger.reconcile_chunk_size
+
+    if db.bind.dialect.name == "postgresql":
+        # Must be set before the session's transaction begins
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    try:
+        balances: Dict[int, int] = await _archived_balances(db)
+
+        result = await db.stream(
+            select(Transaction.user_id, Transaction.amount).execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            for user_id, amount in rows:
+                balances[user_id] = balances.get(user_id, 0) + amount
+
+        mismatches = []
+        result = await db.stream(
+            select(User.id, User.points).order_by(User.id).execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            for user_id, points in rows:
+                ledger_balance = balances.get(user_id, 0)
+                if points != ledger_balance:
+                    mismatches.append(BalanceMismatch(user_id, points, ledger_balance))
+    finally:
+        # Release the snapshot
+        await db.rollback()
+
+    return mismatches
+
+
+def write_mismatch_report(mismatches: Iterable[BalanceMismatch], path: Path) -> Path:
+    """Write mismatches as CSV, largest discrepancy first"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["user_id", "points", "ledger_balance", "difference"])
+        for mismatch in sorted(mismatches, key=lambda m: (-abs(m.difference), m.user_id)):
+            writer.writerow(
+                [mismatch.user_id, mismatch.points, mismatch.ledger_balance, mismatch.difference]
+            )
+    return path
+
+
+async def repair_balance_mismatches(
+    db: AsyncSession, user_ids: Iterable[int], batch_size: int = 1000
+) -> List[Transaction]:
+    """Append corrective ledger entries so each ledger matches its balance
+
+    Works in batches of ``batch_size`` users. Each batch locks the user rows,
+    which waits out in-flight ledger writes, re-sums their ledgers and
+    inserts one entry for every user who still disagrees, with the lifetime
+    totals updated to match. Balances are not changed.
+
+    Returns:
+        Corrective transactions written
+    """
+    user_ids = sorted(set(user_ids))
+    repaired: List[Transaction] = []
+
+    for start in range(0, len(user_ids), batch_size):
+        batch = user_ids[start : start + batch_size]
+        try:
+            result = await db.execute(
+                select(User.id, User.points, User.total_earned, User.total_spent, User.tx_count)
+                .where(User.id.in_(batch))
+                .order_by(User.id)
+                .with_for_update()
+            )
+            users = result.all()
+
+            balances = await _archived_balances(db, batch)
+            result = await db.execute(
+                select(Transaction.user_id, func.sum(Transaction.amount))
+                .where(Transaction.user_id.in_(batch))
+                .group_by(Transaction.user_id)
+            )
+            for user_id, amount in result.all():
+                balances[user_id] = balances.get(user_id, 0) + amount
+
+            now = datetime.utcnow()
+            entries = []
+            totals = []
+            for user in users:
+                difference = user.points - balances.get(user.id, 0)
+                if not difference:
+                    continue
+                entries.append(
+                    Transaction(
+                        user_id=user.id,
+                        amount=difference,
+                        transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                        description="Ledger reconciliation",
+                        reference_type=RECONCILIATION_REFERENCE_TYPE,
+                        balance_after=user.points,
+                        created_at=now,
+                    )
+                )
+                totals.append(
+                    {
+                        "id": user.id,
+                        "total_earned": user.total_earned + max(difference, 0),
+                        "total_spent": user.total_spent + max(-difference, 0),
+                        "tx_count": user.tx_count + 1,
+                    }
+                )
+
+            if entries:
+                # Flushed as one multi-row INSERT
+                db.add_all(entries)
+                await db.execute(update(User), totals)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        for entry in entries:
+            await invalidate_counts(f"transactions:{entry.user_id}")
+        repaired.extend(entries)
+
+    return repaired
@@ -0,0 +1,131 @@
+"""User level thresholds
+
+A user's level is the highest level whose minimum points their balance
+reaches. Minimums come from the ``levels`` table, falling back to
+``UserLevelSettings`` for levels without a row. Ledger writes set the level
+in the same ``UPDATE`` that moves the balance (``level_expression``), so a
+promotion or demotion is never a separate step; ``recompute_levels``
+backfills existing users in primary-key chunks.
+
+Workers cache the thresholds for ``cache.levels_ttl_seconds``.
+"""
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.core.cache import TTLCache
+from src.core.config import config
+from src.core.principal import invalidate_user_principal
+from src.models.user import Level, User, UserLevelEnum
+
+LEVELS_CACHE_KEY = "levels"
+
+# (min_points, level), highest minimum first
+Thresholds = Tuple[Tuple[int, UserLevelEnum], ...]
+
+levels_cache: TTLCache[str, Thresholds] = TTLCache(
+    maxsize=1, ttl_seconds=config.cache.levels_ttl_seconds
+)
+
+
+def default_thresholds() -> Thresholds:
+    """Thresholds from ``UserLevelSettings``"""
+    settings = config.user_levels
+    minimums = {
+        UserLevelEnum.NEW_USER: settings.level_0_min,
+        UserLevelEnum.ACTIVE_USER: settings.level_1_min,
+        UserLevelEnum.TRUSTED_USER: settings.level_2_min,
+        UserLevelEnum.MODERATOR: settings.level_3_min,
+        UserLevelEnum.SENIOR_MODERATOR: settings.level_4_min,
+    }
+    return _sorted(minimums)
+
+
+def _sorted(minimums: dict) -> Thresholds:
+    return tuple(sorted(((points, level) for level, points in minimums.items()), reverse=True))
+
+
+async def get_level_thresholds(db: AsyncSession) -> Thresholds:
+    """Level thresholds, from the ``levels`` table where configured"""
+    cached = levels_cache.get(LEVELS_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    minimums = {level: points for points, level in default_thresholds()}
+    result = await db.execute(select(Level.name, Level.min_points))
+    minimums.update(dict(result.all()))
+
+    thresholds = _sorted(minimums)
+    levels_cache.set(LEVELS_CACHE_KEY, thresholds)
+    return thresholds
+
+
+def level_for_points(points: int, thresholds: Optional[Thresholds] = None) -> UserLevelEnum:
+    """Level for a balance"""
+    for min_points, level in thresholds or default_thresholds():
+        if points >= min_points:
+            return level
+    return UserLevelEnum.NEW_USER
+
+
+def level_expression(points: ColumnElement, thresholds: Thresholds) -> ColumnElement:
+    """SQL ``CASE`` giving the level for a points expression"""
+    level_type = User.__table__.c.level.type
+    *higher, (_, lowest) = thresholds
+    return case(
+        *[(points >= min_points, literal(level, level_type)) for min_points, level in higher],
+        else_=literal(lowest, level_type),
+    )
+
+
+async def recompute_levels(db: AsyncSession, batch_size: int = 1000) -> List[int]:
+    """Set every user's level from their current balance
+
+    Walks users in primary-key chunks of ``batch_size``, updating only rows
+    whose level is wrong and committing after each chunk.
+
+    Returns:
+        IDs of users whose level changed
+    """
+    thresholds = await get_level_thresholds(db)
+    expected = level_expression(User.points, thresholds)
+
+    changed: List[int] = []
+    last_id = 0
+    while True:
+        upper = await db.scalar(
+            select(User.id)
+            .where(User.id > last_id)
+            .order_by(User.id)
+            .offset(batch_size - 1)
+            .limit(1)
+        )
+        bounds = [User.id > last_id]
+        if upper is not None:
+            bounds.append(User.id <= upper)
+
+        try:
+            result = await db.execute(
+                update(User)
+                .where(*bounds, User.level != expected)
+                .values(level=expected)
+                .returning(User.id)
+                .execution_options(synchronize_session=False)
+            )
+            chunk = result.scalars().all()
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+
+        # Level is a permission input; drop stale principals everywhere
+        for user_id in chunk:
+            await invalidate_user_principal(user_id)
+        changed.extend(chunk)
+
+        if upper is None:
+            return changed
+        last_id = upper
@@ -0,0 +1,255 @@
+"""Sharded like counters for hot posts and comments
+
+An atomic ``like_count = like_count + 1`` still serialises every like on
+the target row's lock, so a viral post queues all of its likers behind one
+row. Once a target receives ``counters.like_shard_rate_threshold`` likes
+within ``counters.like_shard_rate_window_seconds`` its new likes go to one
+of ``counters.like_shard_count`` random slots instead:
+
+    like_counter_shards (target_type, target_id, slot) -> delta
+
+A background task folds the slots back into ``like_count`` (and the post's
+hot score) every ``counters.like_shard_fold_interval_seconds``. Lists show
+the folded value; detail reads add ``pending_like_counts`` on top.
+
+The like rate is tracked in Redis (``like_rate:{type}:{id}:{window}``) so
+all workers agree on which targets are hot, or per worker without Redis.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import bindparam, case, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.core.database import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# Per-worker like counts for the current rate window when Redis is unavailable
+_local_window: Dict[str, object] = {"window": None, "counts": defaultdict(int)}
+_fold_task: Optional[asyncio.Task] = None
+
+
+async def record_like_rate(target_type: str, target_id: int) -> bool:
+    """Count a like towards its target's rate and report whether it is hot
+
+    Args:
+        target_type: "post" or "comment"
+        target_id: Post or comment ID
+
+    Returns:
+        True if the like should go to a counter shard
+    """
+    from src.core import session as session_store
+
+    if not config.counters.like_shards_enabled:
+        return False
+
+    window_seconds = config.counters.like_shard_rate_window_seconds
+    window = int(time.time() // window_seconds)
+
+    count = None
+    if session_store.redis_client:
+        key = f"like_rate:{target_type}:{target_id}:{window}"
+        try:
+            pipe = session_store.redis_client.pipeline(transaction=False)
+            pipe.incr(key)
+            pipe.expire(key, window_seconds * 2)
+            count, _ = await pipe.execute()
+        except Exception:
+            logger.warning("Failed to track like rate in Redis, tracking locally", exc_info=True)
+
+    if count is None:
+        if _local_window["window"] != window:
+            _local_window["window"] = window
+            _local_window["counts"] = defaultdict(int)
+        counts = _local_window["counts"]
+        counts[(target_type, target_id)] += 1
+        count = counts[(target_type, target_id)]
+
+    return int(count) > config.counters.like_shard_rate_threshold
+
+
+async def add_like_delta(db: AsyncSession, target_type: str, target_id: int, delta: int) -> None:
+    """Add to a random counter slot of a target (not committed)
+
+    Args:
+        db: Database session
+        target_type: "post" or "comment"
+        target_id: Post or comment ID
+        delta: Change to the target's like_count
+    """
+    from src.models.content import LikeCounterShard
+
+    stmt = dialect_insert(db, LikeCounterShard).values(
+        target_type=target_type,
+        target_id=target_id,
+        slot=random.randrange(config.counters.like_shard_count),
+        delta=delta,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["target_type", "target_id", "slot"],
+        set_={"delta": LikeCounterShard.delta + stmt.excluded.delta},
+    )
+    await db.execute(stmt)
+
+
+async def pending_like_counts(
+    db: AsyncSession, target_type: str, target_ids: Iterable[int]
+) -> Dict[int, int]:
+    """Sum unfolded slot deltas per target
+
+    Args:
+        db: Database session
+        target_type: "post" or "comment"
+        target_ids: Post or comment IDs
+
+    Returns:
+        Pending delta per target ID (targets without slots are omitted)
+    """
+    from src.models.content import LikeCounterShard
+
+    target_ids = list(target_ids)
+    if not target_ids:
+        return {}
+
+    result = await db.execute(
+        select(LikeCounterShard.target_id, func.sum(LikeCounterShard.delta))
+        .where(
+            LikeCounterShard.target_type == target_type,
+            LikeCounterShard.target_id.in_(target_ids),
+        )
+        .group_by(LikeCounterShard.target_id)
+    )
+    return {target_id: int(delta) for target_id, delta in result.all() if delta}
+
+
+async def fold_like_shards(db: AsyncSession) -> int:
+    """Fold all counter slots into like_count
+
+    Slots are deleted and applied in one transaction, so a failed fold
+    leaves them in place for the next run.
+
+    Args:
+        db: Database session to write with
+
+    Returns:
+        Number of posts and comments updated
+    """
+    from src.core.ranking import hot_score
+    from src.models.content import Comment, LikeCounterShard, Post
+
+    shards = LikeCounterShard.__table__
+    try:
+        result = await db.execute(
+            delete(shards).returning(shards.c.target_type, shards.c.target_id, shards.c.delta)
+        )
+        totals: Dict[Tuple[str, int], int] = defaultdict(int)
+        for target_type, target_id, delta in result.all():
+            totals[(target_type, target_id)] += delta
+
+        updated = 0
+        for target_type, model in (("post", Post), ("comment", Comment)):
+            rows = [
+                {"target_id": target_id, "delta": delta}
+                for (kind, target_id), delta in totals.items()
+                if kind == target_type and delta
+            ]
+            if not rows:
+                continue
+
+            table = model.__table__
+            new_count = table.c.like_count + bindparam("delta")
+            await db.execute(
+                update(table)
+                .where(table.c.id == bindparam("target_id"))
+                .values(
+                    like_count=case((new_count < 0, 0), else_=new_count),
+                    updated_at=table.c.updated_at,
+                ),
+                rows,
+            )
+            updated += len(rows)
+
+        post_ids = [target_id for (kind, target_id) in totals if kind == "post"]
+        if post_ids:
+            posts = await db.execute(
+                select(Post.id, Post.like_count, Post.comment_count, Post.created_at).where(
+                    Post.id.in_(post_ids)
+                )
+            )
+            posts_table = Post.__table__
+            await db.execute(
+                update(posts_table)
+                .where(posts_table.c.id == bindparam("post_id"))
+                .values(hot_score=bindparam("score"), updated_at=posts_table.c.updated_at),
+                [
+                    {
+                        "post_id": row.id,
+                        "score": hot_score(row.like_count, row.comment_count, row.created_at),
+                    }
+                    for row in posts
+                ],
+            )
+
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    return updated
+
+
+async def _fold() -> None:
+    from src.core.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        await fold_like_shards(db)
+
+
+async def _fold_loop() -> None:
+    """Fold counter slots on an interval"""
+    while True:
+        await asyncio.sleep(config.counters.like_shard_fold_interval_seconds)
+        try:
+            await _fold()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Like counter fold failed", exc_info=True)
+
+
+async def start_like_shard_folder() -> None:
+    """Start the background like counter folder
+
+    Should be called during application startup.
+    """
+    global _fold_task
+    if _fold_task is None:
+        _fold_task = asyncio.create_task(_fold_loop())
+
+
+async def stop_like_shard_folder() -> None:
+    """Stop the folder and fold any remaining counter slots
+
+    Should be called during application shutdown, before the database is closed.
+    """
+    global _fold_task
+    if _fold_task is not None:
+        _fold_task.cancel()
+        try:
+            await _fold_task
+        except asyncio.CancelledError:
+            pass
+        _fold_task = None
+
+    try:
+        await _fold()
+    except Exception:
+        logger.warning("Final like counter fold failed", exc_info=True)
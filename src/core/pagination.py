@@ -0,0 +1,67 @@
+"""Keyset (cursor) pagination helpers
+
+A cursor encodes the sort key of the last row a client has seen, so the
+next page is fetched with ``WHERE (sort_col, id) < (:value, :id)`` instead
+of ``OFFSET``. Every page then costs one index range scan regardless of
+depth. Cursors are opaque to clients: URL-safe base64 of a small JSON
+document tagged with the sort order it was issued for.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+from src.core.exceptions import InvalidCursorError
+
+
+def encode_cursor(sort: str, value: Any, row_id: int) -> str:
+    """Encode the sort key of the last row on a page
+
+    Args:
+        sort: Sort order the cursor is valid for
+        value: Sort column value of the last row
+        row_id: Primary key of the last row (tie-breaker)
+
+    Returns:
+        Opaque URL-safe cursor string
+    """
+    if isinstance(value, datetime):
+        payload = {"s": sort, "t": value.isoformat(), "i": row_id}
+    else:
+        payload = {"s": sort, "v": value, "i": row_id}
+
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+    """Decode a cursor issued by encode_cursor
+
+    Args:
+        cursor: Cursor string from the client
+        sort: Sort order of the current request
+
+    Returns:
+        Tuple of (sort column value, row id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different sort order
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        row_id = int(payload["i"])
+        if "t" in payload:
+            value = datetime.fromisoformat(payload["t"])
+        else:
+            value = payload["v"]
+        cursor_sort = payload["s"]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorError()
+
+    if cursor_sort != sort:
+        raise InvalidCursorError("Cursor does not match the requested sort order")
+
+    return value, row_id
@@ -0,0 +1,241 @@
+"""Authenticated principal resolution
+
+A principal is a compact, immutable snapshot of the fields needed to
+authenticate and authorize a request. It is cached at two levels:
+
+    L1  per-worker session_id -> Principal (``session_principal_cache``)
+    L2  Redis ``principal:{user_id}`` JSON snapshot shared by all workers
+
+Handlers that only need identity and permissions depend on a principal and
+never load the User row from Postgres.
+
+Flag, level and profile changes call ``invalidate_user_principal``, which
+deletes the Redis snapshot and drops L1 entries in every worker. Point
+balance changes patch the Redis snapshot in place via
+``refresh_principal_points``; L1 copies may show a balance up to
+``cache.session_principal_ttl_seconds`` old.
+"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache, publish_invalidation, register_invalidation_handler
+from src.core.config import config
+from src.models.user import User, UserLevelEnum
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_KEY_PREFIX = "principal:"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user identity and permission flags"""
+
+    id: int
+    username: str
+    level: UserLevelEnum
+    points: int
+    is_active: bool
+    is_banned: bool
+    avatar_url: Optional[str] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Build a principal snapshot from a User row"""
+        return cls(
+            id=user.id,
+            username=user.username,
+            level=user.level,
+            points=user.points,
+            is_active=user.is_active,
+            is_banned=user.is_banned,
+            avatar_url=user.avatar_url,
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "Principal":
+        """Deserialize a snapshot stored in Redis"""
+        data = json.loads(raw)
+        data["level"] = UserLevelEnum(data["level"])
+        return cls(**data)
+
+    def to_json(self) -> str:
+        """Serialize for storage in Redis"""
+        data = asdict(self)
+        data["level"] = self.level.value
+        return json.dumps(data)
+
+    @property
+    def can_authenticate(self) -> bool:
+        """Whether this principal may make authenticated requests"""
+        return self.is_active and not self.is_banned
+
+    @property
+    def is_moderator(self) -> bool:
+        """Whether this principal has moderator privileges"""
+        return self.level in (UserLevelEnum.MODERATOR, UserLevelEnum.SENIOR_MODERATOR)
+
+
+# Per-worker session_id -> Principal cache
+session_principal_cache: TTLCache[str, Principal] = TTLCache(
+    maxsize=config.cache.session_principal_maxsize,
+    ttl_seconds=config.cache.session_principal_ttl_seconds,
+)
+
+
+def _evict_session(session_id: str) -> None:
+    session_principal_cache.delete(session_id)
+
+
+def _evict_user(user_id: str) -> None:
+    uid = int(user_id)
+    session_principal_cache.delete_where(lambda _, principal: principal.id == uid)
+
+
+register_invalidation_handler("session", _evict_session)
+register_invalidation_handler("user", _evict_user)
+
+
+def _principal_key(user_id: int) -> str:
+    """Redis key holding a user's principal snapshot"""
+    return f"{PRINCIPAL_KEY_PREFIX}{user_id}"
+
+
+async def cache_principal(principal: Principal) -> None:
+    """Store a principal snapshot in Redis"""
+    from src.core import session as session_store
+
+    if not session_store.redis_client:
+        return
+
+    try:
+        await session_store.redis_client.set(
+            _principal_key(principal.id),
+            principal.to_json(),
+            ex=config.cache.principal_ttl_seconds,
+        )
+    except Exception:
+        logger.warning("Failed to cache principal for user %s", principal.id, exc_info=True)
+
+
+async def get_principal(user_id: int, db: AsyncSession) -> Optional[Principal]:
+    """Get a user's principal from Redis, falling back to the database
+
+    Args:
+        user_id: User ID
+        db: Database session used on cache miss
+
+    Returns:
+        Principal snapshot, or None if the user does not exist. Callers must
+        check ``can_authenticate`` / ``is_active`` themselves.
+    """
+    from src.core import session as session_store
+
+    if session_store.redis_client:
+        try:
+            raw = await session_store.redis_client.get(_principal_key(user_id))
+        except Exception:
+            logger.warning("Failed to read cached principal for user %s", user_id, exc_info=True)
+            raw = None
+        if raw:
+            return Principal.from_json(raw)
+
+    user = await db.get(User, user_id)
+    if not user:
+        return None
+
+    principal = Principal.from_user(user)
+    await cache_principal(principal)
+    return principal
+
+
+# Patch the balance inside an existing snapshot; a missing snapshot is
+# rebuilt from the database on next use
+_SET_POINTS_SCRIPT = """
+local raw = redis.call('GET', KEYS[1])
+if not raw then
+    return 0
+end
+local data = cjson.decode(raw)
+data['points'] = tonumber(ARGV[1])
+redis.call('SET', KEYS[1], cjson.encode(data), 'KEEPTTL')
+return 1
+"""
+
+
+async def refresh_principal_points(user_id: int, points: int) -> None:
+    """Update the balance in a user's Redis snapshot after a point change
+
+    Args:
+        user_id: User ID
+        points: Balance after the change
+    """
+    from src.core import session as session_store
+
+    if not session_store.redis_client:
+        return
+
+    try:
+        await session_store.redis_client.eval(
+            _SET_POINTS_SCRIPT, 1, _principal_key(user_id), points
+        )
+    except Exception:
+        logger.warning("Failed to refresh cached principal for user %s", user_id, exc_info=True)
+
+
+async def get_session_principal(session_id: str, db: AsyncSession) -> Optional[Principal]:
+    """Resolve a session cookie to an authenticated principal
+
+    Args:
+        session_id: Session ID from cookie
+        db: Database session used on cache miss
+
+    Returns:
+        Principal if the session is valid and the user may authenticate, None otherwise
+    """
+    if not session_id:
+        return None
+
+    principal = session_principal_cache.get(session_id)
+    if principal is not None:
+        return principal
+
+    from src.core.session import get_session
+
+    user_id = await get_session(session_id)
+    if not user_id:
+        return None
+
+    principal = await get_principal(user_id, db)
+    if not principal or not principal.can_authenticate:
+        return None
+
+    session_principal_cache.set(session_id, principal)
+    return principal
+
+
+async def invalidate_user_principal(user_id: int) -> None:
+    """Drop cached principals for a user in every worker
+
+    Call after changing any field carried by Principal (ban, deactivation,
+    username, level, avatar) or after revoking the user's sessions.
+    """
+    from src.core import session as session_store
+
+    if session_store.redis_client:
+        try:
+            await session_store.redis_client.delete(_principal_key(user_id))
+        except Exception:
+            logger.warning("Failed to delete cached principal for user %s", user_id, exc_info=True)
+
+    await publish_invalidation("user", user_id)
+
+
+async def invalidate_session_principal(session_id: str) -> None:
+    """Drop a cached session principal in every worker"""
+    await publish_invalidation("session", session_id)
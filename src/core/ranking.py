@@ -0,0 +1,111 @@
+"""Time-decayed "hot" ranking for posts
+
+    hot_score = (likes + comment_weight * comments + 1) / (age_hours + 2) ^ gravity
+
+The score is stored on ``posts.hot_score`` so ``PostSortBy.HOT`` can sort
+and paginate in SQL. It is recomputed whenever a like or comment lands on
+the post, and a background task periodically re-decays posts newer than
+``ranking.hot_refresh_window_days`` so quiet posts sink over time. Posts
+outside the window keep their last (already tiny) score.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Optional
+
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+HOT_REFRESH_LOCK_KEY = "lock:hot_score_refresh"
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def hot_score(
+    like_count: int,
+    comment_count: int,
+    created_at: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> float:
+    """Compute a post's hot score
+
+    Args:
+        like_count: Number of likes on the post
+        comment_count: Number of comments on the post
+        created_at: Post creation time (naive UTC)
+        now: Reference time, defaults to utcnow
+
+    Returns:
+        Score that decays with age; higher ranks first
+    """
+    now = now or datetime.utcnow()
+    age_hours = max((now - (created_at or now)).total_seconds() / 3600, 0.0)
+    engagement = (like_count or 0) + config.ranking.hot_comment_weight * (comment_count or 0)
+    return (engagement + 1) / (age_hours + 2) ** config.ranking.hot_gravity
+
+
+async def _acquire_refresh_lock() -> bool:
+    """Let only one worker run each refresh cycle"""
+    from src.core import session as session_store
+
+    if not session_store.redis_client:
+        return True
+
+    try:
+        return bool(
+            await session_store.redis_client.set(
+                HOT_REFRESH_LOCK_KEY,
+                "1",
+                nx=True,
+                ex=max(config.ranking.hot_refresh_interval_seconds - 1, 1),
+            )
+        )
+    except Exception:
+        logger.warning("Failed to take hot score refresh lock", exc_info=True)
+        return True
+
+
+async def _refresh_loop() -> None:
+    """Periodically re-decay recent posts"""
+    from src.core.database import AsyncSessionLocal
+    from src.services.post_service import PostService
+
+    while True:
+        await asyncio.sleep(config.ranking.hot_refresh_interval_seconds)
+        try:
+            if not await _acquire_refresh_lock():
+                continue
+            async with AsyncSessionLocal() as db:
+                updated = await PostService(db).refresh_hot_scores()
+            logger.debug("Refreshed hot scores for %d posts", updated)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Hot score refresh failed", exc_info=True)
+
+
+async def start_hot_score_refresher() -> None:
+    """Start the background hot score refresh task
+
+    Should be called during application startup.
+    """
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_hot_score_refresher() -> None:
+    """Stop the background hot score refresh task
+
+    Should be called during application shutdown.
+    """
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
@@ -0,0 +1,125 @@
+"""Per-worker search result cache with write-aware invalidation
+
+Search responses are cached for ``cache.search_ttl_seconds`` under the
+normalized query, result type and page, so "Proof  of stake" and
+"proof of stake" share an entry.
+
+Each entry is also stamped with the generations of the tables it was read
+from. Post and comment writes call ``invalidate_search(scope)``, which
+bumps that scope's generation in every worker (via the cache invalidation
+channel) and drops the entries that read it. A search still running when
+the generation moves stores its result under the old stamp, so nothing
+read before a write is served after it. User results are not bumped by
+writes and only expire.
+
+Concurrent misses for the same key are single-flighted: the first request
+runs the search and the rest wait for its result. If that request is
+cancelled a waiter takes over; if it fails they all see the error.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Sequence, Tuple, TypeVar
+
+from src.core.cache import TTLCache, publish_invalidation, register_invalidation_handler
+from src.core.config import config
+
+T = TypeVar("T")
+
+# Tables a search result is read from
+POSTS = "posts"
+COMMENTS = "comments"
+USERS = "users"
+
+Stamp = Tuple[Tuple[str, int], ...]
+
+# Per-worker (generation stamp, key) -> search response
+search_cache: TTLCache[Tuple[Stamp, Hashable], Any] = TTLCache(
+    maxsize=config.cache.search_maxsize,
+    ttl_seconds=config.cache.search_ttl_seconds,
+)
+
+_generations: Dict[str, int] = defaultdict(int)
+
+# Searches in progress in this worker, by the cache key they will fill
+_in_flight: Dict[Tuple[Stamp, Hashable], asyncio.Future] = {}
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query"""
+    return " ".join(query.lower().split())
+
+
+def _stamp(scopes: Sequence[str]) -> Stamp:
+    return tuple((scope, _generations[scope]) for scope in sorted(scopes))
+
+
+def _bump(scope: str) -> None:
+    _generations[scope] += 1
+    search_cache.delete_where(lambda key, _: scope in dict(key[0]))
+
+
+register_invalidation_handler("search", _bump)
+
+
+async def invalidate_search(scope: str) -> None:
+    """Drop cached results read from a table, in every worker
+
+    Call after committing a write to the table.
+    """
+    await publish_invalidation("search", scope)
+
+
+async def cached_search(
+    scopes: Sequence[str],
+    key: Hashable,
+    search: Callable[[], Awaitable[T]],
+    cacheable: Optional[Callable[[T], bool]] = None,
+) -> T:
+    """Cached result of a search, running it at most once at a time per key
+
+    Args:
+        scopes: Tables the search reads
+        key: Normalized query, type and page
+        search: Runs the search on a miss
+        cacheable: Whether a result may be stored (default: always)
+    """
+    if not config.cache.search_enabled:
+        return await search()
+
+    while True:
+        cache_key = (_stamp(scopes), key)
+        result = search_cache.get(cache_key)
+        if result is not None:
+            return result
+
+        pending = _in_flight.get(cache_key)
+        if pending is None:
+            break
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            # The request running the search was cancelled, not this one
+            if pending.cancelled() and not asyncio.current_task().cancelling():
+                continue
+            raise
+
+    future = asyncio.get_running_loop().create_future()
+    # Don't warn about an error nobody waited for
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _in_flight[cache_key] = future
+    try:
+        result = await search()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        del _in_flight[cache_key]
+
+    future.set_result(result)
+    if cache_key[0] == _stamp(scopes) and (cacheable is None or cacheable(result)):
+        search_cache.set(cache_key, result)
+    return result
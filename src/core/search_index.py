@@ -0,0 +1,616 @@
+"""Embedded BM25 search index for posts and comments
+
+An alternative to database search (``search.engine: embedded``) for
+deployments without PostgreSQL full-text tuning and for local development.
+Each kind of content has an inverted index:
+
+    {search.index_dir}/posts.idx      title (counted twice) + body
+    {search.index_dir}/comments.idx   body
+
+An index file is an immutable segment of flat native-order ``uint32``
+arrays (document ids and lengths, sorted terms, and per-term postings of
+document id and term frequency) that is memory-mapped and read in place.
+Post and comment writes update a small in-memory delta on top of it:
+changed documents are re-tokenized into the delta and their segment
+postings are masked. A background task merges the delta into a new
+segment file every ``search.index_flush_interval_seconds`` and swaps it in.
+
+Only active content is indexed. Hits are ranked with Okapi BM25
+(``search.bm25_k1``, ``search.bm25_b``) over any of the query's terms.
+
+The delta lives in the process that made the write, so the embedded engine
+is meant for single-process deployments. ``scripts/rebuild_search_index.py``
+rebuilds the files from the database; a running process adopts the rebuilt
+files on its next flush.
+"""
+
+import asyncio
+import bisect
+import heapq
+import html
+import logging
+import math
+import mmap
+import os
+import re
+import struct
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+from src.models.content import Comment, ContentStatus, Post
+
+logger = logging.getLogger(__name__)
+
+POSTS = "posts"
+COMMENTS = "comments"
+
+_TOKEN = re.compile(r"\w+")
+
+# Longer tokens are almost always noise (hashes, URLs)
+MAX_TOKEN_LENGTH = 40
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it its of on or that the "
+    "this to was were will with".split()
+)
+
+_MAGIC = b"BM25SEG1"
+# magic, document count, term count, posting count, total document length
+_HEADER = struct.Struct("<8sIIIQ")
+
+_indexes: Dict[str, "InvertedIndex"] = {}
+_flush_task: Optional[asyncio.Task] = None
+# Serializes flushes between the background task and shutdown
+_flush_lock = asyncio.Lock()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased word tokens, without stopwords"""
+    if not text:
+        return []
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if len(token) <= MAX_TOKEN_LENGTH and token not in STOPWORDS
+    ]
+
+
+def _uint32(values: Iterable[int]) -> array:
+    return array("I", values)
+
+
+class Segment:
+    """A memory-mapped, read-only index file"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            stat = os.fstat(f.fileno())
+        self.identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        magic, docs, terms, postings, self.total_length = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a search index segment")
+
+        view = memoryview(self._mmap)
+        offset = _HEADER.size
+        arrays = []
+        for count in (docs, docs, terms + 1, terms + 1, postings, postings):
+            arrays.append(view[offset : offset + count * 4].cast("I"))
+            offset += count * 4
+        (
+            self.doc_ids,
+            self.doc_lengths,
+            self._term_offsets,
+            self._posting_offsets,
+            self._posting_docs,
+            self._posting_tfs,
+        ) = arrays
+        self._terms_blob = view[offset:]
+        self._views = [view, *arrays, self._terms_blob]
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.doc_ids)
+
+    @property
+    def term_count(self) -> int:
+        return len(self._term_offsets) - 1
+
+    def term(self, index: int) -> str:
+        """The ``index``-th term in sort order"""
+        start, end = self._term_offsets[index], self._term_offsets[index + 1]
+        return bytes(self._terms_blob[start:end]).decode("utf-8")
+
+    def _find(self, term: str) -> Optional[int]:
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.term(middle) < term:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.term_count and self.term(low) == term:
+            return low
+        return None
+
+    def postings(self, term: str) -> Tuple[Iterable[int], Iterable[int]]:
+        """Document ids and term frequencies of a term's postings"""
+        index = self._find(term)
+        if index is None:
+            return (), ()
+        start, end = self._posting_offsets[index], self._posting_offsets[index + 1]
+        return self._posting_docs[start:end], self._posting_tfs[start:end]
+
+    def postings_at(self, index: int) -> Tuple[Iterable[int], Iterable[int]]:
+        start, end = self._posting_offsets[index], self._posting_offsets[index + 1]
+        return self._posting_docs[start:end], self._posting_tfs[start:end]
+
+    def doc_length(self, doc_id: int) -> Optional[int]:
+        """Length of a document in this segment, or None if it is not here"""
+        index = bisect.bisect_left(self.doc_ids, doc_id)
+        if index < self.doc_count and self.doc_ids[index] == doc_id:
+            return self.doc_lengths[index]
+        return None
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+    @staticmethod
+    def write(
+        path: Path,
+        lengths: Dict[int, int],
+        postings: Dict[str, List[Tuple[int, int]]],
+    ) -> None:
+        """Write a segment file atomically
+
+        Args:
+            path: Destination; replaced with a synced temporary file
+            lengths: Document id -> token count
+            postings: Term -> (document id, term frequency) pairs
+        """
+        doc_ids = sorted(lengths)
+        terms = sorted(term for term, entries in postings.items() if entries)
+
+        term_offsets = _uint32([0])
+        posting_offsets = _uint32([0])
+        posting_docs = _uint32([])
+        posting_tfs = _uint32([])
+        blob = bytearray()
+        for term in terms:
+            blob += term.encode("utf-8")
+            term_offsets.append(len(blob))
+            for doc_id, tf in sorted(postings[term]):
+                posting_docs.append(doc_id)
+                posting_tfs.append(tf)
+            posting_offsets.append(len(posting_docs))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(path.name + ".partial")
+        with open(partial, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC, len(doc_ids), len(terms), len(posting_docs), sum(lengths.values())
+                )
+            )
+            for values in (
+                _uint32(doc_ids),
+                _uint32(lengths[doc_id] for doc_id in doc_ids),
+                term_offsets,
+                posting_offsets,
+                posting_docs,
+                posting_tfs,
+            ):
+                f.write(values.tobytes())
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial, path)
+
+
+class InvertedIndex:
+    """A segment file plus the in-memory changes made since it was written
+
+    Not thread-safe; used from the event loop, except that ``_write_merged``
+    runs in a worker thread over a snapshot.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.segment: Optional[Segment] = None
+        # Documents added or changed since the segment was written
+        self._delta_terms: Dict[int, Counter] = {}
+        self._delta_postings: Dict[str, Dict[int, int]] = {}
+        # Segment documents superseded by the delta or removed
+        self._masked: Set[int] = set()
+        # Documents changed while a flush is being written
+        self._touched: Optional[Set[int]] = None
+        self._doc_count = 0
+        self._total_length = 0
+        self.load()
+
+    @property
+    def doc_count(self) -> int:
+        """Number of live documents"""
+        return self._doc_count
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._delta_terms or self._masked)
+
+    def load(self) -> None:
+        """Map the segment file, keeping pending changes on top of it"""
+        segment = None
+        if self.path.exists():
+            try:
+                segment = Segment(self.path)
+            except (OSError, ValueError, struct.error):
+                logger.warning("Ignoring unreadable search index %s", self.path, exc_info=True)
+        self._adopt(segment, keep=set(self._delta_terms) | self._masked)
+
+    def is_stale(self) -> bool:
+        """Whether the file on disk was replaced, e.g. by a rebuild"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        return self.segment is None or identity != self.segment.identity
+
+    def _adopt(self, segment: Optional[Segment], keep: Set[int]) -> None:
+        """Switch to a new segment, re-applying pending changes to ``keep`` docs"""
+        previous = self.segment
+        self.segment = segment
+
+        delta = {
+            doc_id: self._delta_terms[doc_id] for doc_id in keep if doc_id in self._delta_terms
+        }
+        self._delta_terms = {}
+        self._delta_postings = {}
+        self._masked = set()
+        self._doc_count = segment.doc_count if segment else 0
+        self._total_length = segment.total_length if segment else 0
+
+        for doc_id in keep:
+            self._mask(doc_id)
+        for doc_id, terms in delta.items():
+            self._add_delta(doc_id, terms)
+
+        if previous is not None:
+            previous.close()
+
+    def _mask(self, doc_id: int) -> None:
+        """Take a document out of the live set"""
+        if doc_id in self._delta_terms:
+            terms = self._delta_terms.pop(doc_id)
+            for term in terms:
+                postings = self._delta_postings[term]
+                del postings[doc_id]
+                if not postings:
+                    del self._delta_postings[term]
+            self._doc_count -= 1
+            self._total_length -= sum(terms.values())
+
+        if self.segment is not None and doc_id not in self._masked:
+            length = self.segment.doc_length(doc_id)
+            if length is not None:
+                self._masked.add(doc_id)
+                self._doc_count -= 1
+                self._total_length -= length
+
+    def _add_delta(self, doc_id: int, terms: Counter) -> None:
+        self._delta_terms[doc_id] = terms
+        for term, tf in terms.items():
+            self._delta_postings.setdefault(term, {})[doc_id] = tf
+        self._doc_count += 1
+        self._total_length += sum(terms.values())
+
+    def update(self, doc_id: int, tokens: List[str]) -> None:
+        """Index a document, replacing any previous version"""
+        self._mask(doc_id)
+        if tokens:
+            self._add_delta(doc_id, Counter(tokens))
+        if self._touched is not None:
+            self._touched.add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """Drop a document from the index"""
+        self._mask(doc_id)
+        if self._touched is not None:
+            self._touched.add(doc_id)
+
+    def _length(self, doc_id: int) -> int:
+        terms = self._delta_terms.get(doc_id)
+        if terms is not None:
+            return sum(terms.values())
+        if self.segment is None:
+            return 0
+        return self.segment.doc_length(doc_id) or 0
+
+    def search(
+        self, query: str, offset: int = 0, limit: int = 20
+    ) -> Tuple[List[Tuple[int, float]], int]:
+        """BM25-ranked documents matching any query term
+
+        Returns:
+            ((document id, score) for the requested page, number of matches)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._doc_count:
+            return [], 0
+
+        k1, b = config.search.bm25_k1, config.search.bm25_b
+        average_length = self._total_length / self._doc_count or 1.0
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            matches = []
+            if self.segment is not None:
+                docs, tfs = self.segment.postings(term)
+                matches.extend(
+                    (doc_id, tf) for doc_id, tf in zip(docs, tfs) if doc_id not in self._masked
+                )
+            matches.extend(self._delta_postings.get(term, {}).items())
+            if not matches:
+                continue
+
+            idf = math.log(1 + (self._doc_count - len(matches) + 0.5) / (len(matches) + 0.5))
+            for doc_id, tf in matches:
+                norm = k1 * (1 - b + b * self._length(doc_id) / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        # Ties go to the newer document
+        top = heapq.nlargest(offset + limit, scores.items(), key=lambda hit: (hit[1], hit[0]))
+        return top[offset:], len(scores)
+
+    def _snapshot(self) -> Tuple[Optional[Segment], Dict[int, Counter], Set[int]]:
+        return self.segment, dict(self._delta_terms), set(self._masked)
+
+    def _write_merged(
+        self, segment: Optional[Segment], delta: Dict[int, Counter], masked: Set[int]
+    ) -> None:
+        """Write segment + delta as a new segment file"""
+        lengths: Dict[int, int] = {}
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+
+        if segment is not None:
+            superseded = masked | set(delta)
+            for doc_id, length in zip(segment.doc_ids, segment.doc_lengths):
+                if doc_id not in superseded:
+                    lengths[doc_id] = length
+            for index in range(segment.term_count):
+                docs, tfs = segment.postings_at(index)
+                entries = [
+                    (doc_id, tf) for doc_id, tf in zip(docs, tfs) if doc_id not in superseded
+                ]
+                if entries:
+                    postings[segment.term(index)] = entries
+
+        for doc_id, terms in delta.items():
+            lengths[doc_id] = sum(terms.values())
+            for term, tf in terms.items():
+                postings.setdefault(term, []).append((doc_id, tf))
+
+        Segment.write(self.path, lengths, postings)
+
+    async def flush(self) -> bool:
+        """Merge pending changes into the segment file
+
+        The merge is written in a worker thread from a snapshot; changes
+        made meanwhile stay pending on top of the new segment. A file
+        replaced on disk since it was mapped (a rebuild) is adopted instead.
+
+        Returns:
+            Whether a new segment was swapped in
+        """
+        if self._touched is not None:
+            return False
+        if self.is_stale():
+            self.load()
+            return True
+        if not self.dirty:
+            return False
+
+        self._touched = set()
+        try:
+            await asyncio.to_thread(self._write_merged, *self._snapshot())
+            segment = Segment(self.path)
+        except BaseException:
+            self._touched = None
+            raise
+        touched, self._touched = self._touched, None
+        self._adopt(segment, keep=touched)
+        return True
+
+    def close(self) -> None:
+        if self.segment is not None:
+            self.segment.close()
+            self.segment = None
+
+
+def is_enabled() -> bool:
+    """Whether searches use the embedded index"""
+    return config.search.engine == "embedded"
+
+
+def get_index(kind: str) -> InvertedIndex:
+    """This process's index for ``POSTS`` or ``COMMENTS``, loaded on first use"""
+    index = _indexes.get(kind)
+    if index is None:
+        index = InvertedIndex(Path(config.search.index_dir) / f"{kind}.idx")
+        if index.segment is None:
+            logger.warning(
+                "Search index %s is empty; build it with scripts/rebuild_search_index.py",
+                index.path,
+            )
+        _indexes[kind] = index
+    return index
+
+
+def post_tokens(post) -> List[str]:
+    """Tokens indexed for a post; title terms count twice"""
+    title = tokenize(post.title)
+    return title + title + tokenize(post.body)
+
+
+def comment_tokens(comment) -> List[str]:
+    """Tokens indexed for a comment"""
+    return tokenize(comment.body)
+
+
+def _sync(kind: str, document, tokens) -> None:
+    if not is_enabled():
+        return
+    index = get_index(kind)
+    if document.status == ContentStatus.ACTIVE:
+        index.update(document.id, tokens(document))
+    else:
+        index.remove(document.id)
+
+
+def sync_post(post) -> None:
+    """Reflect a committed post write in the index"""
+    _sync(POSTS, post, post_tokens)
+
+
+def sync_comment(comment) -> None:
+    """Reflect a committed comment write in the index"""
+    _sync(COMMENTS, comment, comment_tokens)
+
+
+def search(kind: str, query: str, offset: int, limit: int) -> Tuple[List[int], int]:
+    """Page of matching ids, best first, and the number of matches"""
+    hits, total = get_index(kind).search(query, offset, limit)
+    return [doc_id for doc_id, _ in hits], total
+
+
+async def rebuild_search_index(db: AsyncSession, kind: str, batch_size: int = 5000) -> int:
+    """Rebuild an index file from the database
+
+    Streams active posts or comments in ``batch_size`` chunks, tokenizes
+    them and writes a fresh segment. Processes using the embedded engine
+    pick it up on their next flush.
+
+    Returns:
+        Number of documents indexed
+    """
+    if kind == POSTS:
+        stmt, tokens = select(Post.id, Post.title, Post.body), post_tokens
+        stmt = stmt.where(Post.status == ContentStatus.ACTIVE)
+    elif kind == COMMENTS:
+        stmt, tokens = select(Comment.id, Comment.body), comment_tokens
+        stmt = stmt.where(Comment.status == ContentStatus.ACTIVE)
+    else:
+        raise ValueError(f"Unknown search index {kind}")
+
+    lengths: Dict[int, int] = {}
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for rows in result.partitions():
+        for row in rows:
+            terms = Counter(tokens(row))
+            if not terms:
+                continue
+            lengths[row.id] = sum(terms.values())
+            for term, tf in terms.items():
+                postings.setdefault(term, []).append((row.id, tf))
+
+    path = Path(config.search.index_dir) / f"{kind}.idx"
+    await asyncio.to_thread(Segment.write, path, lengths, postings)
+
+    if kind in _indexes:
+        _indexes[kind].load()
+    return len(lengths)
+
+
+def highlight(text: Optional[str], query: str, length: Optional[int] = None) -> str:
+    """HTML-escaped excerpt around the first query term, terms wrapped in ``<mark>``"""
+    if not text:
+        return ""
+    length = length or config.search.snippet_length
+    terms = set(tokenize(query))
+    hits = [match for match in _TOKEN.finditer(text) if match.group().lower() in terms]
+
+    start = 0
+    if hits and hits[0].start() > length // 3:
+        # Open a little before the first hit, on a word boundary
+        start = text.rfind(" ", 0, hits[0].start() - length // 3) + 1
+    end = min(len(text), start + length)
+    if end < len(text):
+        end = max(text.rfind(" ", start, end), hits[0].end() if hits else start) or end
+
+    parts = ["…" if start else ""]
+    position = start
+    for match in hits:
+        if match.start() < start:
+            continue
+        if match.end() > end:
+            break
+        parts.append(html.escape(text[position : match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(text[position:end]))
+    if end < len(text):
+        parts.append("…")
+    return "".join(parts)
+
+
+async def _flush_all() -> None:
+    async with _flush_lock:
+        for kind, index in list(_indexes.items()):
+            try:
+                await index.flush()
+            except Exception:
+                logger.warning("Failed to flush search index %s", kind, exc_info=True)
+
+
+async def _flush_loop() -> None:
+    """Periodically merge pending index changes into the index files"""
+    while True:
+        await asyncio.sleep(config.search.index_flush_interval_seconds)
+        # A flush interrupted by shutdown finishes before the final one runs
+        await asyncio.shield(_flush_all())
+
+
+async def start_search_index() -> None:
+    """Load the embedded search index and start its flush task
+
+    Should be called during application startup. Does nothing unless
+    ``search.engine`` is ``embedded``.
+    """
+    global _flush_task
+    if not is_enabled() or _flush_task is not None:
+        return
+    for kind in (POSTS, COMMENTS):
+        get_index(kind)
+    _flush_task = asyncio.create_task(_flush_loop())
+
+
+async def stop_search_index() -> None:
+    """Stop the flush task, write pending changes and unmap the index
+
+    Should be called during application shutdown.
+    """
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+
+    await _flush_all()
+    for index in _indexes.values():
+        index.close()
+    _indexes.clear()
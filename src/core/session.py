@@ -2,19 +2,70 @@
 
 Implements cryptographically secure session tokens with Redis backend.
 Fixes CRT-002: Insecure Session Token Generation (CVSS 9.1)
+
+Key layout:
+    session:{session_id}       -> user_id (string, TTL = session lifetime)
+    user_sessions:{user_id}    -> sorted set of session_ids scored by expiry timestamp
+
+The per-user index lets "log out everywhere" and session counting touch only
+that user's sessions instead of scanning every session on the platform.
 """
 
 import secrets
+import time
 from datetime import timedelta
 from typing import Optional
 
 from redis.asyncio import Redis
 
+from src.core.cache import publish_invalidation
 from src.core.config import config
 
 # Global Redis client for sessions
 redis_client: Optional[Redis] = None
 
+SESSION_KEY_PREFIX = "session:"
+USER_SESSIONS_KEY_PREFIX = "user_sessions:"
+
+# Delete a session and drop it from its owner's index in one round trip.
+# KEYS[1] = session key, ARGV[1] = session id, ARGV[2] = user index prefix
+_DELETE_SESSION_SCRIPT = """
+local user_id = redis.call('GET', KEYS[1])
+if not user_id then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', ARGV[2] .. user_id, ARGV[1])
+return 1
+"""
+
+# Delete every session listed in a user's index, then the index itself.
+# KEYS[1] = user index key, ARGV[1] = session key prefix
+_INVALIDATE_USER_SESSIONS_SCRIPT = """
+local session_ids = redis.call('ZRANGE', KEYS[1], 0, -1)
+local deleted = 0
+for _, session_id in ipairs(session_ids) do
+    deleted = deleted + redis.call('DEL', ARGV[1] .. session_id)
+end
+redis.call('DEL', KEYS[1])
+return deleted
+"""
+
+
+def _session_key(session_id: str) -> str:
+    """Redis key holding the user_id for a session"""
+    return f"{SESSION_KEY_PREFIX}{session_id}"
+
+
+def _user_sessions_key(user_id: int) -> str:
+    """Redis key of the per-user session index"""
+    return f"{USER_SESSIONS_KEY_PREFIX}{user_id}"
+
+
+def _session_ttl() -> timedelta:
+    """Session lifetime from configuration"""
+    return timedelta(hours=config.security.session_expiration_hours)
+
 
 async def init_redis():
     """Initialize Redis connection for session storage
@@ -52,16 +103,23 @@ async def create_session(user_id: int) -> str:
         - Session ID is 43 characters (256 bits of entropy)
         - No predictable components (no user ID, timestamp, etc.)
         - Stored in Redis with automatic expiration
+        - Indexed under the user so all their sessions can be revoked at once
     """
     # Generate cryptographically random session ID (256 bits)
     session_id = secrets.token_urlsafe(32)
 
-    # Store user_id in Redis with automatic expiration
-    await redis_client.setex(
-        f"session:{session_id}",
-        timedelta(hours=config.security.session_expiration_hours),
-        user_id,
-    )
+    ttl = _session_ttl()
+    now = time.time()
+    index_key = _user_sessions_key(user_id)
+
+    # Store the session and index it in a single round trip. Expired index
+    # entries are pruned on every write so the index stays bounded.
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.setex(_session_key(session_id), ttl, user_id)
+        pipe.zremrangebyscore(index_key, "-inf", now)
+        pipe.zadd(index_key, {session_id: now + ttl.total_seconds()})
+        pipe.expire(index_key, ttl)
+        await pipe.execute()
 
     return session_id
 
@@ -78,7 +136,7 @@ async def get_session(session_id: str) -> Optional[int]:
     if not session_id or not redis_client:
         return None
 
-    user_id = await redis_client.get(f"session:{session_id}")
+    user_id = await redis_client.get(_session_key(session_id))
     return int(user_id) if user_id else None
 
 
@@ -94,8 +152,15 @@ async def delete_session(session_id: str) -> bool:
     if not session_id or not redis_client:
         return False
 
-    result = await redis_client.delete(f"session:{session_id}")
-    return result > 0
+    result = await redis_client.eval(
+        _DELETE_SESSION_SCRIPT,
+        1,
+        _session_key(session_id),
+        session_id,
+        USER_SESSIONS_KEY_PREFIX,
+    )
+    await publish_invalidation("session", session_id)
+    return int(result) > 0
 
 
 async def refresh_session(session_id: str) -> bool:
@@ -110,12 +175,22 @@ async def refresh_session(session_id: str) -> bool:
     if not session_id or not redis_client:
         return False
 
-    # Extend TTL without changing the value
-    result = await redis_client.expire(
-        f"session:{session_id}",
-        timedelta(hours=config.security.session_expiration_hours),
-    )
-    return result
+    key = _session_key(session_id)
+    user_id = await redis_client.get(key)
+    if not user_id:
+        return False
+
+    ttl = _session_ttl()
+    index_key = _user_sessions_key(int(user_id))
+
+    # Extend TTL without changing the value and move the index score along
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.expire(key, ttl)
+        pipe.zadd(index_key, {session_id: time.time() + ttl.total_seconds()}, xx=True)
+        pipe.expire(index_key, ttl)
+        refreshed, _, _ = await pipe.execute()
+
+    return bool(refreshed)
 
 
 async def invalidate_user_sessions(user_id: int) -> int:
@@ -132,22 +207,14 @@ async def invalidate_user_sessions(user_id: int) -> int:
     if not redis_client:
         return 0
 
-    # Find all session keys for this user
-    # Note: This is potentially slow for large numbers of sessions
-    # Consider maintaining a user_id -> session_ids mapping for better performance
-    cursor = 0
-    deleted = 0
-    while True:
-        cursor, keys = await redis_client.scan(cursor, match="session:*", count=100)
-        for key in keys:
-            value = await redis_client.get(key)
-            if value and int(value) == user_id:
-                await redis_client.delete(key)
-                deleted += 1
-        if cursor == 0:
-            break
-
-    return deleted
+    deleted = await redis_client.eval(
+        _INVALIDATE_USER_SESSIONS_SCRIPT,
+        1,
+        _user_sessions_key(user_id),
+        SESSION_KEY_PREFIX,
+    )
+    await publish_invalidation("user", user_id)
+    return int(deleted)
 
 
 async def get_session_count(user_id: int) -> int:
@@ -162,15 +229,12 @@ async def get_session_count(user_id: int) -> int:
     if not redis_client:
         return 0
 
-    cursor = 0
-    count = 0
-    while True:
-        cursor, keys = await redis_client.scan(cursor, match="session:*", count=100)
-        for key in keys:
-            value = await redis_client.get(key)
-            if value and int(value) == user_id:
-                count += 1
-        if cursor == 0:
-            break
-
-    return count
+    index_key = _user_sessions_key(user_id)
+
+    # Drop expired entries and count the remainder in one round trip
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.zremrangebyscore(index_key, "-inf", time.time())
+        pipe.zcard(index_key)
+        _, count = await pipe.execute()
+
+    return int(count)
@@ -0,0 +1,387 @@
+"""Typeahead suggestions from Redis prefix sorted sets
+
+Post titles, tag and channel names and usernames are indexed under every
+prefix of the label and of each word in it, up to
+``search.suggest_max_prefix_length`` characters:
+
+    suggest:{gen}:p:{prefix}   ZSET  member=kind:id  score=popularity
+    suggest:{gen}:items        HASH  kind:id -> {"type", "id", "text", "url"}
+    suggest:{gen}:keys         SET   every key above in the generation
+
+so completing "proof o" is one ``ZREVRANGE`` of the top members and an
+``HMGET`` of their labels. Popularity is likes for posts, post counts for
+tags and channels and points for users. Each prefix set keeps only its
+``search.suggest_prefix_capacity`` most popular members.
+
+Writes update the index after commit (``sync_post`` and friends). Scores
+drift as likes and points change, so the index is rebuilt from the
+database at most once per ``search.suggest_rebuild_interval_seconds``
+across workers. A rebuild fills a new generation ``gen`` and then points
+``suggest:generation`` at it, so readers never see a partial index;
+writes made meanwhile go to both generations. Generations holding keys
+are listed in ``suggest:generations``, and the rebuild then deletes every
+other one by its key set, so it never scans the keyspace. Until the first
+build finishes callers fall back to SQL.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+POST = "post"
+TAG = "tag"
+CHANNEL = "channel"
+USER = "user"
+
+SUGGEST_GENERATION_KEY = "suggest:generation"
+SUGGEST_BUILDING_KEY = "suggest:building"
+SUGGEST_SEQUENCE_KEY = "suggest:sequence"
+SUGGEST_GENERATIONS_KEY = "suggest:generations"
+SUGGEST_LOCK_KEY = "lock:suggest_rebuild"
+
+# Only the first words of long titles get their own prefixes
+MAX_INDEXED_WORDS = 8
+
+_WORD = re.compile(r"\w+")
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def _redis():
+    from src.core import session as session_store
+
+    if not config.search.suggest_enabled:
+        return None
+    return session_store.redis_client
+
+
+def normalize(text: str) -> str:
+    """Lowercase words of a label or query, joined by single spaces"""
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def prefixes(text: str, max_length: Optional[int] = None) -> List[str]:
+    """Prefixes a label is completed from
+
+    Every prefix of the normalized label and of the label from each of its
+    first ``MAX_INDEXED_WORDS`` words on, so "Proof of Stake" completes
+    "pro", "of st" and "stake".
+    """
+    max_length = max_length or config.search.suggest_max_prefix_length
+    words = normalize(text).split(" ")
+    found = {}
+    for start in range(min(len(words), MAX_INDEXED_WORDS)):
+        tail = " ".join(words[start:])
+        for end in range(1, min(len(tail), max_length) + 1):
+            found[tail[:end]] = None
+    found.pop("", None)
+    return list(found)
+
+
+def completes(text: str, query: str) -> bool:
+    """Whether a label completes a normalized query"""
+    label = normalize(text)
+    return label.startswith(query) or f" {query}" in f" {label}"
+
+
+def _member(kind: str, item_id: int) -> str:
+    return f"{kind}:{item_id}"
+
+
+def _prefix_key(generation, prefix: str) -> str:
+    return f"suggest:{generation}:p:{prefix}"
+
+
+def _items_key(generation) -> str:
+    return f"suggest:{generation}:items"
+
+
+def _keys_key(generation) -> str:
+    return f"suggest:{generation}:keys"
+
+
+def post_entry(post) -> Optional[dict]:
+    """Suggestion for a post, or None if it should not be suggested"""
+    from src.models.content import ContentStatus
+
+    if post.status != ContentStatus.ACTIVE:
+        return None
+    return _entry(POST, post.id, post.title, f"/posts/{post.id}", post.like_count)
+
+
+def tag_entry(tag) -> dict:
+    """Suggestion for a tag (tags have no page of their own)"""
+    return _entry(TAG, tag.id, tag.name, None, tag.post_count)
+
+
+def channel_entry(channel) -> dict:
+    """Suggestion for a channel"""
+    return _entry(CHANNEL, channel.id, channel.name, f"/channel/{channel.slug}", channel.post_count)
+
+
+def user_entry(user) -> Optional[dict]:
+    """Suggestion for a user, or None if they should not be suggested
+
+    Only usernames are indexed; display names are not searchable.
+    """
+    if not user.is_active or user.is_banned:
+        return None
+    return _entry(USER, user.id, user.username, f"/profile/{user.username}", user.points)
+
+
+def _entry(kind: str, item_id: int, text: str, url: Optional[str], score: int) -> dict:
+    return {"type": kind, "id": item_id, "text": text, "url": url, "score": score or 0}
+
+
+def rank_entries(entries: Iterable[dict], limit: int) -> List[dict]:
+    """Most popular entries first, as suggestions"""
+    ranked = sorted(entries, key=lambda e: (-e["score"], e["text"].lower()))
+    return [{k: v for k, v in e.items() if k != "score"} for e in ranked[:limit]]
+
+
+async def _generations(redis) -> List[str]:
+    """Generations writes must reach: the live one and any being built"""
+    live, building = await redis.mget(SUGGEST_GENERATION_KEY, SUGGEST_BUILDING_KEY)
+    return [g for g in dict.fromkeys((live, building)) if g is not None]
+
+
+def _queue_add(pipe, generation, entries: Iterable[dict]) -> set:
+    """Queue index writes; returns the prefix keys touched"""
+    touched = set()
+    items = {}
+    for entry in entries:
+        member = _member(entry["type"], entry["id"])
+        items[member] = json.dumps({k: v for k, v in entry.items() if k != "score"})
+        for prefix in prefixes(entry["text"]):
+            key = _prefix_key(generation, prefix)
+            pipe.zadd(key, {member: entry["score"]})
+            touched.add(key)
+    if items:
+        pipe.hset(_items_key(generation), mapping=items)
+        # Registered with every write, so a generation that a racing write
+        # recreates after it was dropped is dropped again by the next rebuild
+        pipe.sadd(_keys_key(generation), _items_key(generation), *touched)
+        pipe.sadd(SUGGEST_GENERATIONS_KEY, generation)
+    return touched
+
+
+def _queue_trim(pipe, keys: Iterable[str]) -> None:
+    capacity = config.search.suggest_prefix_capacity
+    for key in keys:
+        pipe.zremrangebyrank(key, 0, -capacity - 1)
+
+
+async def _write(kind: str, item_id: int, entry: Optional[dict]) -> None:
+    """Replace (or with no entry, remove) an item in every generation"""
+    redis = _redis()
+    if not redis:
+        return
+
+    member = _member(kind, item_id)
+    try:
+        for generation in await _generations(redis):
+            items_key = _items_key(generation)
+            old = await redis.hget(items_key, member)
+            new_prefixes = set(prefixes(entry["text"])) if entry else set()
+
+            pipe = redis.pipeline(transaction=True)
+            if old is not None:
+                for prefix in set(prefixes(json.loads(old)["text"])) - new_prefixes:
+                    pipe.zrem(_prefix_key(generation, prefix), member)
+            if entry:
+                _queue_trim(pipe, _queue_add(pipe, generation, [entry]))
+            else:
+                pipe.hdel(items_key, member)
+            await pipe.execute()
+    except Exception:
+        logger.warning("Failed to update suggestions for %s", member, exc_info=True)
+
+
+async def sync_post(post) -> None:
+    """Index a post's title after commit, or drop it once it is not active"""
+    await _write(POST, post.id, post_entry(post))
+
+
+async def sync_tag(tag) -> None:
+    """Index a tag's name after commit"""
+    await _write(TAG, tag.id, tag_entry(tag))
+
+
+async def sync_channel(channel) -> None:
+    """Index a channel's name after commit"""
+    await _write(CHANNEL, channel.id, channel_entry(channel))
+
+
+async def sync_user(user) -> None:
+    """Index a username after commit, or drop a deactivated user"""
+    await _write(USER, user.id, user_entry(user))
+
+
+async def remove_item(kind: str, item_id: int) -> None:
+    """Drop a deleted item from the suggestions"""
+    await _write(kind, item_id, None)
+
+
+async def lookup(query: str, limit: int) -> Optional[List[dict]]:
+    """Most popular completions of a query
+
+    Returns:
+        Suggestions, most popular first, or None if the index has not been
+        built (or Redis failed) and the caller should fall back to SQL
+    """
+    redis = _redis()
+    if not redis:
+        return None
+
+    query = normalize(query)
+    if not query:
+        return []
+    max_length = config.search.suggest_max_prefix_length
+
+    try:
+        generation = await redis.get(SUGGEST_GENERATION_KEY)
+        if generation is None:
+            return None
+
+        # Queries longer than the indexed prefixes are filtered from the
+        # candidates for their longest indexed prefix
+        truncated = len(query) > max_length
+        count = config.search.suggest_prefix_capacity if truncated else limit
+        members = await redis.zrevrange(_prefix_key(generation, query[:max_length]), 0, count - 1)
+        if not members:
+            return []
+        payloads = await redis.hmget(_items_key(generation), members)
+    except Exception:
+        logger.warning("Failed to read suggestions", exc_info=True)
+        return None
+
+    suggestions = [json.loads(payload) for payload in payloads if payload is not None]
+    if truncated:
+        suggestions = [s for s in suggestions if completes(s["text"], query)]
+    return suggestions[:limit]
+
+
+async def _entries(db: AsyncSession, model, build, batch_size: int):
+    """Suggestion entries for a table in primary-key batches"""
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(model).where(model.id > last_id).order_by(model.id).limit(batch_size)
+        )
+        rows = result.scalars().all()
+        if not rows:
+            return
+        yield [entry for entry in map(build, rows) if entry]
+        last_id = rows[-1].id
+        db.expunge_all()
+
+
+async def _drop_generations(redis, keep: str, batch_size: int = 1000) -> None:
+    """Delete every generation but ``keep``, including ones left by failed builds"""
+    for generation in await redis.smembers(SUGGEST_GENERATIONS_KEY):
+        if generation == keep:
+            continue
+        await redis.srem(SUGGEST_GENERATIONS_KEY, generation)
+        keys_key = _keys_key(generation)
+        while keys := await redis.spop(keys_key, batch_size):
+            await redis.unlink(*keys)
+
+
+async def rebuild_suggest_index(db: AsyncSession, batch_size: Optional[int] = None) -> int:
+    """Rebuild the suggestions from posts, tags, channels and users
+
+    Args:
+        db: Database session to read with
+        batch_size: Rows per batch (defaults to ``search.suggest_rebuild_batch_size``)
+
+    Returns:
+        Number of items indexed
+    """
+    from src.models.content import Post
+    from src.models.organization import Channel, Tag
+    from src.models.user import User
+
+    redis = _redis()
+    if not redis:
+        return 0
+
+    batch_size = batch_size or config.search.suggest_rebuild_batch_size
+    generation = str(await redis.incr(SUGGEST_SEQUENCE_KEY))
+    await redis.set(SUGGEST_BUILDING_KEY, generation)
+
+    count = 0
+    try:
+        sources = (
+            (Post, post_entry),
+            (Tag, tag_entry),
+            (Channel, channel_entry),
+            (User, user_entry),
+        )
+        for model, build in sources:
+            async for entries in _entries(db, model, build, batch_size):
+                pipe = redis.pipeline(transaction=False)
+                _queue_trim(pipe, _queue_add(pipe, generation, entries))
+                await pipe.execute()
+                count += len(entries)
+
+        await redis.set(SUGGEST_GENERATION_KEY, generation)
+    finally:
+        await redis.delete(SUGGEST_BUILDING_KEY)
+
+    await _drop_generations(redis, keep=generation)
+    return count
+
+
+async def _refresh_loop() -> None:
+    """Rebuild the suggestions once per interval across all workers"""
+    from src.core.database import AsyncSessionLocal
+
+    interval = config.search.suggest_rebuild_interval_seconds
+    while True:
+        try:
+            redis = _redis()
+            # The lock doubles as the "rebuilt recently" marker, so it is
+            # left to expire rather than released
+            if redis and await redis.set(SUGGEST_LOCK_KEY, "1", nx=True, ex=interval):
+                async with AsyncSessionLocal() as db:
+                    count = await rebuild_suggest_index(db)
+                logger.info("Built typeahead suggestions with %d items", count)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Typeahead suggestion rebuild failed", exc_info=True)
+        await asyncio.sleep(interval)
+
+
+async def start_suggest_index() -> None:
+    """Start the background suggestion rebuild task
+
+    Should be called during application startup, after Redis is initialized.
+    """
+    global _refresh_task
+    if _refresh_task is None and _redis():
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_suggest_index() -> None:
+    """Stop the background suggestion rebuild task
+
+    Should be called during application shutdown.
+    """
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
@@ -0,0 +1,173 @@
+"""Write-behind buffer for post view counts
+
+Recording a view no longer updates the ``posts`` row. Views accumulate in
+a buffer and a background task folds them into ``posts.view_count`` in
+batched UPDATEs:
+
+    Redis       HINCRBY post_views:pending {post_id} 1  (shared by workers)
+    fallback    per-worker dict when Redis is unavailable
+
+``record_view`` returns the post's pending delta so the detail page can
+show ``view_count + pending`` and counts still look live between flushes.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import config
+
+logger = logging.getLogger(__name__)
+
+PENDING_VIEWS_KEY = "post_views:pending"
+
+# Atomically take the whole pending hash so concurrent HINCRBYs land in a
+# fresh one instead of being lost by the flush.
+_TAKE_PENDING_SCRIPT = """
+local entries = redis.call('HGETALL', KEYS[1])
+redis.call('DEL', KEYS[1])
+return entries
+"""
+
+_local_pending: Dict[int, int] = defaultdict(int)
+_flush_task: Optional[asyncio.Task] = None
+
+
+async def record_view(post_id: int) -> int:
+    """Buffer one view of a post
+
+    Args:
+        post_id: Post ID
+
+    Returns:
+        Views buffered for the post that are not yet in ``posts.view_count``
+    """
+    from src.core import session as session_store
+
+    if session_store.redis_client:
+        try:
+            return int(await session_store.redis_client.hincrby(PENDING_VIEWS_KEY, post_id, 1))
+        except Exception:
+            logger.warning("Failed to buffer view in Redis, buffering locally", exc_info=True)
+
+    _local_pending[post_id] += 1
+    return _local_pending[post_id]
+
+
+async def _take_pending() -> Dict[int, int]:
+    """Remove and return all buffered views"""
+    from src.core import session as session_store
+
+    pending: Dict[int, int] = dict(_local_pending)
+    _local_pending.clear()
+
+    if session_store.redis_client:
+        try:
+            entries = await session_store.redis_client.eval(
+                _TAKE_PENDING_SCRIPT, 1, PENDING_VIEWS_KEY
+            )
+        except Exception:
+            logger.warning("Failed to read buffered views from Redis", exc_info=True)
+            entries = []
+        for field, value in zip(entries[::2], entries[1::2]):
+            post_id = int(field)
+            pending[post_id] = pending.get(post_id, 0) + int(value)
+
+    return pending
+
+
+def _restore_pending(pending: Dict[int, int]) -> None:
+    """Put views back in the buffer after a failed flush"""
+    for post_id, delta in pending.items():
+        _local_pending[post_id] += delta
+
+
+async def flush_views(db: AsyncSession) -> int:
+    """Fold buffered views into posts.view_count
+
+    Failed flushes put the views back in this worker's buffer.
+
+    Args:
+        db: Database session to write with
+
+    Returns:
+        Number of posts updated
+    """
+    from src.models.content import Post
+
+    pending = await _take_pending()
+    if not pending:
+        return 0
+
+    table = Post.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("post_id"))
+        .values(view_count=table.c.view_count + bindparam("delta"))
+    )
+    rows = [{"post_id": post_id, "delta": delta} for post_id, delta in pending.items()]
+    batch_size = config.counters.view_flush_batch_size
+
+    try:
+        for start in range(0, len(rows), batch_size):
+            await db.execute(stmt, rows[start : start + batch_size])
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        _restore_pending(pending)
+        raise
+
+    return len(rows)
+
+
+async def _flush() -> None:
+    from src.core.database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        await flush_views(db)
+
+
+async def _flush_loop() -> None:
+    """Flush buffered views on an interval"""
+    while True:
+        await asyncio.sleep(config.counters.view_flush_interval_seconds)
+        try:
+            await _flush()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("View count flush failed", exc_info=True)
+
+
+async def start_view_flusher() -> None:
+    """Start the background view count flusher
+
+    Should be called during application startup.
+    """
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(_flush_loop())
+
+
+async def stop_view_flusher() -> None:
+    """Stop the flusher and write out any remaining buffered views
+
+    Should be called during application shutdown, before the database is closed.
+    """
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+
+    try:
+        await _flush()
+    except Exception:
+        logger.warning("Final view count flush failed", exc_info=True)
@@ -37,6 +37,15 @@ from src.routes import frontend
 from src.core.config import config
 from src.core.database import init_db, close_db
 from src.core.session import init_redis, close_redis
+from src.core.cache import start_invalidation_listener, stop_invalidation_listener
+from src.core.ranking import start_hot_score_refresher, stop_hot_score_refresher
+from src.core.view_counter import start_view_flusher, stop_view_flusher
+from src.core.like_counter import start_like_shard_folder, stop_like_shard_folder
+from src.core.leaderboard import start_leaderboard, stop_leaderboard
+from src.core.contributions import start_contribution_refresher, stop_contribution_refresher
+from src.core.ledger_partitions import start_partition_maintainer, stop_partition_maintainer
+from src.core.search_index import start_search_index, stop_search_index
+from src.core.suggest import start_suggest_index, stop_suggest_index
 from src.middleware.security_headers import SecurityHeadersMiddleware
 from src.middleware.https_redirect import HTTPSRedirectMiddleware
 from src.middleware.rate_limit import limiter
@@ -63,13 +72,58 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     await init_redis()
     print("✅ Redis session store initialized")
 
+    # Subscribe to cross-worker cache invalidations
+    await start_invalidation_listener()
+    print("✅ Cache invalidation listener started")
+
+    # Periodically decay hot scores
+    await start_hot_score_refresher()
+    print("✅ Hot score refresher started")
+
+    # Fold buffered post views into the database
+    await start_view_flusher()
+    print("✅ View count flusher started")
+
+    # Fold sharded like counters of hot posts/comments into the database
+    await start_like_shard_folder()
+    print("✅ Like counter folder started")
+
+    # Build the points leaderboard if no worker has yet
+    await start_leaderboard()
+    print("✅ Points leaderboard started")
+
+    # Periodically recompute contribution stats
+    await start_contribution_refresher()
+    print("✅ Contribution stats refresher started")
+
+    # Keep upcoming monthly ledger partitions created
+    await start_partition_maintainer()
+    print("✅ Ledger partition maintainer started")
+
+    # Embedded search index (search.engine: embedded)
+    await start_search_index()
+    print(f"✅ Search engine: {config.search.engine}")
+
+    # Keep the typeahead index built and its popularity scores fresh
+    await start_suggest_index()
+    print("✅ Typeahead suggestions started")
+
     yield
 
     # Shutdown
     print("🛑 Shutting down Decentralized Forum...")
+    await stop_hot_score_refresher()
+    await stop_view_flusher()
+    await stop_like_shard_folder()
+    await stop_leaderboard()
+    await stop_contribution_refresher()
+    await stop_partition_maintainer()
+    await stop_search_index()
+    await stop_suggest_index()
     await close_db()
     print("✅ Database connections closed")
 
+    await stop_invalidation_listener()
     await close_redis()
     print("✅ Redis connections closed")
 
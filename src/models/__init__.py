@@ -4,9 +4,22 @@ Implements 18 tables normalized to 3NF as per database-schema-20251021-190000.sq
 """
 
 from src.models.user import User, OAuthAccount, Level
-from src.models.content import Post, Comment, Like, Media
+from src.models.content import (
+    Post,
+    Comment,
+    Like,
+    LikeCounterShard,
+    UserContributionStats,
+    Media,
+)
 from src.models.moderation import Report, Ban
-from src.models.points import Transaction, PointEconomy
+from src.models.points import (
+    Transaction,
+    PointEconomy,
+    PointGrantBatch,
+    TransactionArchive,
+    ArchivedPointTotal,
+)
 from src.models.organization import Channel, Tag, PostTag
 
 __all__ = [
@@ -16,11 +29,16 @@ __all__ = [
     "Post",
     "Comment",
     "Like",
+    "LikeCounterShard",
+    "UserContributionStats",
     "Media",
     "Report",
     "Ban",
     "Transaction",
     "PointEconomy",
+    "PointGrantBatch",
+    "TransactionArchive",
+    "ArchivedPointTotal",
     "Channel",
     "Tag",
     "PostTag",
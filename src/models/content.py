@@ -5,15 +5,18 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     DateTime,
     Enum,
+    Float,
     ForeignKey,
     Integer,
     String,
     Text,
     Index,
 )
+from sqlalchemy import event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -61,6 +64,8 @@ class Post(Base):
     like_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
     comment_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     view_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Time-decayed ranking score, see src.core.ranking
+    hot_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
 
     # Moderation
     status: Mapped[ContentStatus] = mapped_column(
@@ -107,6 +112,19 @@ class Post(Base):
         Index("idx_posts_created_at_desc", created_at.desc()),
         Index("idx_posts_like_count_desc", like_count.desc()),
         Index("idx_posts_user_id_created_at", user_id, created_at.desc()),
+        # Keyset pagination: (filter, sort column, id) for every PostSortBy
+        Index("idx_posts_status_created_at_id", status, created_at.desc(), id.desc()),
+        Index("idx_posts_status_like_count_id", status, like_count.desc(), id.desc()),
+        Index("idx_posts_status_last_activity_id", status, last_activity_at.desc(), id.desc()),
+        Index("idx_posts_status_comment_count_id", status, comment_count.desc(), id.desc()),
+        Index("idx_posts_status_hot_score_id", status, hot_score.desc(), id.desc()),
+        Index(
+            "idx_posts_channel_status_created_at_id",
+            channel_id,
+            status,
+            created_at.desc(),
+            id.desc(),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -217,6 +235,65 @@ class Like(Base):
         )
 
 
+class LikeCounterShard(Base):
+    """Pending like_count delta for a hot post or comment
+
+    Likes on a hot target add to one of ``counters.like_shard_count`` slots
+    picked at random instead of updating the target row, spreading the row
+    lock. Deltas are folded back into ``like_count`` periodically.
+    """
+
+    __tablename__ = "like_counter_shards"
+
+    # Primary Key
+    target_type: Mapped[str] = mapped_column(String(10), primary_key=True)  # "post" or "comment"
+    target_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    slot: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    # Pending change to the target's like_count (negative after unlikes)
+    delta: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<LikeCounterShard(target={self.target_type}:{self.target_id}, "
+            f"slot={self.slot}, delta={self.delta})>"
+        )
+
+
+class UserContributionStats(Base):
+    """Per-user count of posts and comments that have not been deleted
+
+    Maintained in the same transaction as post/comment writes and
+    periodically recomputed from the content tables, so the contribution
+    leaderboard is a single indexed read.
+    """
+
+    __tablename__ = "user_contribution_stats"
+
+    # Primary Key
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Counts
+    post_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    contribution_score: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_user_contribution_stats_score", contribution_score.desc(), user_id),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<UserContributionStats(user_id={self.user_id}, posts={self.post_count}, "
+            f"comments={self.comment_count})>"
+        )
+
+
 class Media(Base):
     """Media attachments for posts (IPFS storage)"""
 
@@ -259,6 +336,38 @@ class Media(Base):
         return f"<Media(id={self.id}, file_name={self.file_name}, ipfs_hash={self.ipfs_hash})>"
 
 
+# Full-text search (PostgreSQL only, see src/core/fulltext.py): a stored
+# generated tsvector per searchable table with a GIN index. The column is not
+# mapped, so the ORM never reads or writes it.
+TEXT_SEARCH_CONFIG = "english"
+
+SEARCH_VECTORS = {
+    Post.__table__: (
+        f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+        f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(body, '')), 'B')"
+    ),
+    Comment.__table__: f"to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(body, ''))",
+}
+
+for _table, _expression in SEARCH_VECTORS.items():
+    event.listen(
+        _table,
+        "after_create",
+        DDL(
+            f"ALTER TABLE {_table.name} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({_expression}) STORED"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        _table,
+        "after_create",
+        DDL(
+            f"CREATE INDEX IF NOT EXISTS idx_{_table.name}_search_vector "
+            f"ON {_table.name} USING GIN (search_vector)"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
 # Import to avoid circular dependencies
 from src.models.moderation import Report  # noqa: E402
 from src.models.organization import Channel, PostTag  # noqa: E402
@@ -24,7 +24,13 @@ class TransactionType(str, enum.Enum):
 
 
 class Transaction(Base):
-    """Point transaction history"""
+    """Point transaction history
+
+    On PostgreSQL the table is range-partitioned by month on ``created_at``
+    (see ``src/core/ledger_partitions.py``), with primary key
+    ``(id, created_at)``; ``id`` alone stays unique through its sequence and
+    is what the ORM keys rows by.
+    """
 
     __tablename__ = "transactions"
 
@@ -110,5 +116,93 @@ class PointEconomy(Base):
         return f"<PointEconomy(create_post_cost={self.create_post_cost}, crypto_reward_cost={self.crypto_reward_cost})>"
 
 
+class PointGrantBatch(Base):
+    """Bulk point grant run, keyed by a caller-chosen batch ID
+
+    Chunks advance ``rows_processed`` in the same transaction as their
+    balance updates, so re-submitting a batch resumes after the last
+    committed chunk and a completed batch is never applied twice.
+    """
+
+    __tablename__ = "point_grant_batches"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Idempotency key
+    batch_key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+
+    # Foreign Keys
+    created_by: Mapped[Optional[int]] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # Progress
+    status: Mapped[str] = mapped_column(String(20), default="running", nullable=False)
+    rows_processed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    applied_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    rejected_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_amount: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PointGrantBatch(batch_key={self.batch_key}, status={self.status}, "
+            f"rows_processed={self.rows_processed})>"
+        )
+
+
+class TransactionArchive(Base):
+    """A month of transactions exported to disk and dropped from the database"""
+
+    __tablename__ = "transaction_archives"
+
+    # Primary Key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Partition
+    partition_name: Mapped[str] = mapped_column(String(63), unique=True, nullable=False)
+    range_start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    range_end: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # Export
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+
+    # Timestamps
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TransactionArchive(partition_name={self.partition_name}, "
+            f"row_count={self.row_count})>"
+        )
+
+
+class ArchivedPointTotal(Base):
+    """Per-user totals of archived transactions
+
+    Lets ledger reconciliation account for rows no longer in ``transactions``.
+    """
+
+    __tablename__ = "archived_point_totals"
+
+    # Primary Key
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Totals
+    total_earned: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_spent: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    tx_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ArchivedPointTotal(user_id={self.user_id}, tx_count={self.tx_count})>"
+
+
 # Import to avoid circular dependencies
 from src.models.user import User  # noqa: E402
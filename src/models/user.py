@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     DateTime,
     Enum,
@@ -14,6 +15,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
+from sqlalchemy import event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -60,6 +62,10 @@ class User(Base):
 
     # Gamification
     points: Mapped[int] = mapped_column(Integer, default=0, nullable=False, index=True)
+    # Lifetime ledger totals, updated by the same statement as points
+    total_earned: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_spent: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    tx_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     level: Mapped[UserLevelEnum] = mapped_column(
         Enum(UserLevelEnum), default=UserLevelEnum.NEW_USER, nullable=False
     )
@@ -116,6 +122,26 @@ class User(Base):
         return f"<User(id={self.id}, username={self.username}, level={self.level})>"
 
 
+# Trigram indexes for user search (PostgreSQL only, see src/core/fulltext.py).
+# They serve ILIKE '%q%' on the name columns; SQLite has no equivalent.
+USER_TRIGRAM_COLUMNS = ("username", "display_name")
+
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for _column in USER_TRIGRAM_COLUMNS:
+    event.listen(
+        User.__table__,
+        "after_create",
+        DDL(
+            f"CREATE INDEX IF NOT EXISTS idx_users_{_column}_trgm "
+            f"ON users USING GIN ({_column} gin_trgm_ops)"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
 class OAuthAccount(Base):
     """OAuth2 provider account linkage"""
 
@@ -7,17 +7,29 @@ from fastapi import APIRouter, Request, Form, UploadFile, File
 from fastapi.responses import HTMLResponse, RedirectResponse
 from typing import Optional, List
 from src.core.database import AsyncSessionLocal
+from src.schemas.post import PostSortBy
 
 router = APIRouter()
 
+# Feed filter tabs -> SQL sort order (anything else is newest first)
+FEED_FILTER_SORTS = {
+    "hot": PostSortBy.HOT,
+    "top": PostSortBy.COMMENTED,
+}
+
 
 # Template helper function
-async def get_template_context(request: Request):
-    """Get default template context for all pages"""
-    from src.core.database import get_db
-    from src.core.session import get_session
+async def get_template_context(request: Request, full_user: bool = False):
+    """Get default template context for all pages
+
+    ``current_user`` is the cached session principal, which carries the
+    identity, level and points shown in the layout. Pages that render
+    profile fields (email, bio, wallet, ...) pass ``full_user=True`` to load
+    the User row instead.
+    """
+    from src.core.database import AsyncSessionLocal
+    from src.core.principal import get_session_principal
     from src.models.user import User
-    from sqlalchemy import select
 
     current_user = None
 
@@ -26,18 +38,10 @@ async def get_template_context(request: Request):
         session_id = request.cookies.get("session_id")
 
         if session_id:
-            # Get user_id from Redis session
-            user_id = await get_session(session_id)
-
-            if user_id:
-                # Get database session
-                async for db in get_db():
-                    # Fetch user from database
-                    result = await db.execute(select(User).where(User.id == user_id))
-                    user = result.scalar_one_or_none()
-                    if user and user.is_active and not user.is_banned:
-                        current_user = user
-                    break
+            async with AsyncSessionLocal() as db:
+                current_user = await get_session_principal(session_id, db)
+                if current_user and full_user:
+                    current_user = await db.get(User, current_user.id)
     except Exception:
         current_user = None
 
@@ -59,18 +63,8 @@ async def index(request: Request, filter: Optional[str] = None, page: int = 1):
     async with AsyncSessionLocal() as db:
         # Get posts
         post_service = PostService(db)
-        posts, total = await post_service.list_posts(page=page, page_size=20)
-
-        # Apply filter if specified
-        if filter == "hot":
-            # Sort by highest likes
-            posts = sorted(posts, key=lambda p: p.like_count, reverse=True)
-        elif filter == "new":
-            # Already sorted by newest (default)
-            pass
-        elif filter == "top":
-            # Sort by most comments
-            posts = sorted(posts, key=lambda p: p.comment_count, reverse=True)
+        sort_by = FEED_FILTER_SORTS.get(filter, PostSortBy.CREATED_DESC)
+        posts, total = await post_service.list_posts(page=page, page_size=20, sort_by=sort_by)
 
         # Get channels
         result = await db.execute(select(Channel))
@@ -101,7 +95,9 @@ async def index(request: Request, filter: Optional[str] = None, page: int = 1):
 
 
 @router.get("/explore", response_class=HTMLResponse, include_in_schema=False)
-async def explore(request: Request, filter: Optional[str] = None, page: int = 1):
+async def explore(
+    request: Request, filter: Optional[str] = None, page: int = 1, cursor: Optional[str] = None
+):
     """Explore page - browse all posts"""
     from src.main import templates
     from src.core.database import AsyncSessionLocal
@@ -112,20 +108,11 @@ async def explore(request: Request, filter: Optional[str] = None, page: int = 1)
     # Get real posts from database
     async with AsyncSessionLocal() as db:
         post_service = PostService(db)
-        posts, total_count = await post_service.list_posts(page=page, page_size=50)
-
-        # Apply filter if specified
-        if filter == "hot":
-            # Sort by highest likes
-            posts = sorted(posts, key=lambda p: p.like_count if p.like_count else 0, reverse=True)
-        elif filter == "new":
-            # Already sorted by newest (default)
-            pass
-        elif filter == "top":
-            # Sort by most comments
-            posts = sorted(
-                posts, key=lambda p: p.comment_count if p.comment_count else 0, reverse=True
-            )
+        sort_by = FEED_FILTER_SORTS.get(filter, PostSortBy.CREATED_DESC)
+        posts, total_count = await post_service.list_posts(
+            page=page, page_size=50, sort_by=sort_by, cursor=cursor
+        )
+        next_cursor = PostService.next_cursor(posts, 50, sort_by)
 
         # Get channels
         result = await db.execute(select(Channel))
@@ -136,14 +123,22 @@ async def explore(request: Request, filter: Optional[str] = None, page: int = 1)
         from src.models.user import User
         from src.models.content import Post, Comment
 
-        total_users_result = await db.execute(select(func.count(User.id)))
-        total_users = total_users_result.scalar() or 0
-
-        total_posts_result = await db.execute(select(func.count(Post.id)))
-        total_posts = total_posts_result.scalar() or 0
+        from src.core.counting import CountStrategy, count_rows
 
-        total_comments_result = await db.execute(select(func.count(Comment.id)))
-        total_comments = total_comments_result.scalar() or 0
+        # Sidebar totals tolerate estimates on large tables
+        total_users = await count_rows(
+            db, select(func.count(User.id)), CountStrategy.ESTIMATE, scope="users", table="users"
+        )
+        total_posts = await count_rows(
+            db, select(func.count(Post.id)), CountStrategy.ESTIMATE, scope="posts", table="posts"
+        )
+        total_comments = await count_rows(
+            db,
+            select(func.count(Comment.id)),
+            CountStrategy.ESTIMATE,
+            scope="comments",
+            table="comments",
+        )
 
     context = await get_template_context(request)
     context.update(
@@ -151,6 +146,7 @@ async def explore(request: Request, filter: Optional[str] = None, page: int = 1)
             "posts": posts,
             "channels": channels,
             "current_filter": filter or "all",
+            "next_cursor": next_cursor,
             "top_users": [],
             "stats": {
                 "total_users": total_users,
@@ -166,7 +162,13 @@ async def explore(request: Request, filter: Optional[str] = None, page: int = 1)
 
 
 @router.get("/channel/{slug}", response_class=HTMLResponse, include_in_schema=False)
-async def channel_page(request: Request, slug: str, filter: Optional[str] = None, page: int = 1):
+async def channel_page(
+    request: Request,
+    slug: str,
+    filter: Optional[str] = None,
+    page: int = 1,
+    cursor: Optional[str] = None,
+):
     """Channel page - show posts for a specific channel"""
     from src.main import templates
     from src.core.database import AsyncSessionLocal
@@ -184,17 +186,11 @@ async def channel_page(request: Request, slug: str, filter: Optional[str] = None
 
         # Get posts for this channel
         post_service = PostService(db)
-        posts, total = await post_service.list_posts(page=page, page_size=20, channel_id=channel.id)
-
-        # Apply filter if specified
-        if filter == "hot":
-            posts = sorted(posts, key=lambda p: p.like_count if p.like_count else 0, reverse=True)
-        elif filter == "new":
-            pass  # Already sorted by newest
-        elif filter == "top":
-            posts = sorted(
-                posts, key=lambda p: p.comment_count if p.comment_count else 0, reverse=True
-            )
+        sort_by = FEED_FILTER_SORTS.get(filter, PostSortBy.CREATED_DESC)
+        posts, total = await post_service.list_posts(
+            page=page, page_size=20, channel_id=channel.id, sort_by=sort_by, cursor=cursor
+        )
+        next_cursor = PostService.next_cursor(posts, 20, sort_by)
 
         # Get all channels for sidebar
         all_channels = await db.execute(select(Channel))
@@ -209,6 +205,7 @@ async def channel_page(request: Request, slug: str, filter: Optional[str] = None
                 "posts": posts,
                 "channels": channels,
                 "current_filter": filter or "new",
+                "next_cursor": next_cursor,
                 "total_posts": total,
                 "total_pages": math.ceil(total / 20) if total > 0 else 1,
                 "current_page": page,
@@ -269,7 +266,7 @@ async def rewards(request: Request):
     from src.main import templates
 
     # Get real user context
-    context = await get_template_context(request)
+    context = await get_template_context(request, full_user=True)
 
     # Add rewards-specific data
     context.update(
@@ -290,63 +287,34 @@ async def leaderboard(request: Request):
     from src.models.user import User
     from src.models.organization import Channel
     from src.models.content import Post, Comment
-    from sqlalchemy import select, desc, func
+    from src.core.contributions import get_top_contributors
+    from sqlalchemy import select, func
 
     async with AsyncSessionLocal() as db:
-        # Get users with contribution statistics (posts + comments count)
-        # Calculate contribution score as total posts + total comments
-        result = await db.execute(
-            select(
-                User.id,
-                User.username,
-                User.display_name,
-                User.avatar_url,
-                func.coalesce(func.count(Post.id), 0).label("post_count"),
-                func.coalesce(func.count(Comment.id), 0).label("comment_count"),
-            )
-            .outerjoin(Post, User.id == Post.user_id)
-            .outerjoin(Comment, User.id == Comment.user_id)
-            .where(User.is_active)
-            .where(~User.is_banned)
-            .group_by(User.id)
-            .having(
-                func.coalesce(func.count(Post.id), 0) + func.coalesce(func.count(Comment.id), 0) > 0
-            )
-            .order_by(
-                desc(
-                    func.coalesce(func.count(Post.id), 0) + func.coalesce(func.count(Comment.id), 0)
-                )
-            )
-            .limit(50)
-        )
-
-        top_users_data = []
-        for row in result.all():
-            contribution_score = row.post_count + row.comment_count
-            top_users_data.append(
-                {
-                    "username": row.username,
-                    "display_name": row.display_name,
-                    "avatar_url": row.avatar_url,
-                    "post_count": row.post_count,
-                    "comment_count": row.comment_count,
-                    "contribution_score": contribution_score,
-                }
-            )
+        # Top users by posts + comments, precomputed in user_contribution_stats
+        top_users_data = await get_top_contributors(db, limit=50)
 
         # Get channels for sidebar
         channels_result = await db.execute(select(Channel))
         channels = channels_result.scalars().all()
 
         # Get stats
-        total_users_result = await db.execute(select(func.count(User.id)))
-        total_users = total_users_result.scalar() or 0
-
-        total_posts_result = await db.execute(select(func.count(Post.id)))
-        total_posts = total_posts_result.scalar() or 0
+        from src.core.counting import CountStrategy, count_rows
 
-        total_comments_result = await db.execute(select(func.count(Comment.id)))
-        total_comments = total_comments_result.scalar() or 0
+        # Sidebar totals tolerate estimates on large tables
+        total_users = await count_rows(
+            db, select(func.count(User.id)), CountStrategy.ESTIMATE, scope="users", table="users"
+        )
+        total_posts = await count_rows(
+            db, select(func.count(Post.id)), CountStrategy.ESTIMATE, scope="posts", table="posts"
+        )
+        total_comments = await count_rows(
+            db,
+            select(func.count(Comment.id)),
+            CountStrategy.ESTIMATE,
+            scope="comments",
+            table="comments",
+        )
 
         context = await get_template_context(request)
         context.update(
@@ -636,13 +604,12 @@ async def post_detail(request: Request, post_id: int):
         # Check if current user has liked the post
         user_has_liked = False
         if current_user:
-            from src.models.content import Like
-            from sqlalchemy import select, and_
+            from src.services.like_service import LikeService
 
-            like_result = await db.execute(
-                select(Like).where(and_(Like.post_id == post_id, Like.user_id == current_user.id))
+            liked_posts, _ = await LikeService(db).get_like_state(
+                current_user.id, post_ids=[post_id]
             )
-            user_has_liked = like_result.scalar_one_or_none() is not None
+            user_has_liked = post_id in liked_posts
 
         return templates.TemplateResponse(
             "posts/detail.html",
@@ -739,7 +706,7 @@ async def settings_page(request: Request):
     """Settings page"""
     from src.main import templates
 
-    context = await get_template_context(request)
+    context = await get_template_context(request, full_user=True)
 
     # Require authentication
     if not context.get("current_user"):
@@ -784,6 +751,14 @@ async def update_profile(
 
             await db.commit()
 
+            from src.core.principal import invalidate_user_principal
+            from src.core.leaderboard import remove_user
+            from src.core import suggest
+
+            await invalidate_user_principal(user.id)
+            await remove_user(user.id)
+            await suggest.sync_user(user)
+
             return RedirectResponse(
                 url="/settings?success=Profile+updated+successfully", status_code=303
             )
@@ -931,6 +906,10 @@ async def delete_account(request: Request):
             user.is_active = False
             await db.commit()
 
+            from src.core.principal import invalidate_user_principal
+
+            await invalidate_user_principal(user.id)
+
             # Logout user
             resp = RedirectResponse(url="/auth/logout", status_code=303)
             return resp
@@ -82,6 +82,7 @@ class CommentResponse(BaseModel):
     updated_at: datetime
     replies_count: int = 0  # Number of direct replies
     user_has_liked: Optional[bool] = False  # Whether current user liked this comment
+    snippet: Optional[str] = None  # Search results: excerpt with <mark>ed query terms
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -106,6 +107,7 @@ class CommentListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
 
 
 class CommentTreeResponse(BaseModel):
@@ -45,6 +45,7 @@ class LikeListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
 
 
 class LikeStatsResponse(BaseModel):
@@ -54,3 +55,10 @@ class LikeStatsResponse(BaseModel):
     content_type: str  # "post" or "comment"
     total_likes: int
     user_has_liked: bool = False
+
+
+class LikeStateResponse(BaseModel):
+    """Schema for the current user's like state on a page of content"""
+
+    liked_post_ids: list[int]
+    liked_comment_ids: list[int]
@@ -72,6 +72,7 @@ class ReportListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
 
 
 class BanCreate(BaseModel):
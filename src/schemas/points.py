@@ -1,6 +1,7 @@
 """Points API schemas for request/response validation"""
 
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 from enum import Enum
@@ -65,6 +66,7 @@ class TransactionListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
 
 
 class UserPointsResponse(BaseModel):
@@ -80,6 +82,20 @@ class UserPointsResponse(BaseModel):
     crypto_reward_cost: int
 
 
+class PointEconomyUpdate(BaseModel):
+    """Schema for changing point economy configuration (admin only)"""
+
+    create_post_cost: Optional[int] = Field(None, le=0)
+    create_comment_cost: Optional[int] = Field(None, le=0)
+    like_cost: Optional[int] = Field(None, le=0)
+    registration_bonus: Optional[int] = Field(None, ge=0)
+    receive_like_tier1: Optional[int] = Field(None, ge=0)
+    receive_like_tier2: Optional[int] = Field(None, ge=0)
+    receive_like_tier3: Optional[int] = Field(None, ge=0)
+    crypto_reward_cost: Optional[int] = Field(None, gt=0)
+    crypto_reward_bnb_amount: Optional[Decimal] = Field(None, gt=0)
+
+
 class PointEconomyResponse(BaseModel):
     """Schema for point economy configuration"""
 
@@ -116,3 +132,39 @@ class LeaderboardResponse(BaseModel):
     total_users: int
     page: int
     page_size: int
+
+
+class LeaderboardRankResponse(BaseModel):
+    """Schema for a user's leaderboard rank"""
+
+    user_id: int
+    rank: Optional[int]  # None for inactive users
+    points: int
+    total_users: int
+
+
+class GrantRejectionResponse(BaseModel):
+    """Schema for a bulk grant row that was not applied"""
+
+    line: int
+    user_id: Optional[int]
+    amount: Optional[int]
+    error: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PointGrantBatchResponse(BaseModel):
+    """Schema for bulk point grant progress"""
+
+    batch_id: str = Field(validation_alias="batch_key")
+    status: str  # running, completed
+    rows_processed: int
+    applied_count: int
+    rejected_count: int
+    total_amount: int
+    created_at: datetime
+    completed_at: Optional[datetime]
+    rejections: list[GrantRejectionResponse] = []
+
+    model_config = ConfigDict(from_attributes=True)
@@ -127,6 +127,7 @@ class PostResponse(BaseModel):
     updated_at: datetime
     last_activity_at: datetime
     tags: List[PostTagResponse] = []
+    snippet: Optional[str] = None  # Search results: excerpt with <mark>ed query terms
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -139,6 +140,8 @@ class PostListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page
 
 
 class PostDetailResponse(PostResponse):
@@ -158,3 +161,4 @@ class PostSortBy(str, Enum):
     POPULAR = "popular"  # By like_count
     TRENDING = "trending"  # By recent activity
     COMMENTED = "commented"  # By comment_count
+    HOT = "hot"  # By time-decayed hot_score
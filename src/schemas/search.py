@@ -1,6 +1,6 @@
 """Search API schemas"""
 
-from typing import List, Union
+from typing import List, Optional, Union
 from pydantic import BaseModel
 from src.schemas.post import PostResponse
 from src.schemas.user import UserResponse
@@ -23,3 +23,12 @@ class SearchResponse(BaseModel):
     total: int
     page: int
     page_size: int
+
+
+class Suggestion(BaseModel):
+    """Typeahead completion"""
+
+    type: str  # "post", "tag", "channel" or "user"
+    id: int
+    text: str
+    url: Optional[str] = None
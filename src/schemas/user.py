@@ -153,6 +153,7 @@ class UserListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    has_more: bool = False
 
 
 # Statistics schema
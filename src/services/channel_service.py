@@ -8,6 +8,7 @@ import re
 
 from src.models.organization import Channel
 from src.schemas.channel import ChannelCreate, ChannelUpdate
+from src.core import suggest
 from src.core.exceptions import ChannelNotFoundError, ValidationError
 
 
@@ -49,6 +50,7 @@ class ChannelService:
         self.db.add(channel)
         await self.db.commit()
         await self.db.refresh(channel)
+        await suggest.sync_channel(channel)
         return channel
 
     async def get_channel_by_id(self, channel_id: int) -> Channel:
@@ -87,6 +89,7 @@ class ChannelService:
 
         await self.db.commit()
         await self.db.refresh(channel)
+        await suggest.sync_channel(channel)
         return channel
 
     async def delete_channel(self, channel_id: int) -> None:
@@ -94,6 +97,7 @@ class ChannelService:
         channel = await self.get_channel_by_id(channel_id)
         await self.db.delete(channel)
         await self.db.commit()
+        await suggest.remove_item(suggest.CHANNEL, channel_id)
 
     async def list_channels(self) -> List[Channel]:
         """List all channels (sorted by sort_order)"""
@@ -5,8 +5,9 @@ from typing import Optional, List
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.models.content import Comment, ContentStatus, Post, Like
+from src.models.content import Comment, ContentStatus, Post
 from src.schemas.comment import CommentCreate, CommentUpdate, CommentModerationUpdate
 from src.core.exceptions import (
     CommentNotFoundError,
@@ -14,6 +15,17 @@ from src.core.exceptions import (
     PermissionDeniedError,
     ValidationError,
 )
+from src.core.ranking import hot_score
+from src.core.like_counter import pending_like_counts
+from src.core.contributions import counts_as_contribution, record_contribution
+from src.core import search_cache, search_index
+from src.core.counting import (
+    CountStrategy,
+    count_rows,
+    finish_page,
+    invalidate_counts,
+    page_limit,
+)
 
 
 class CommentService:
@@ -66,12 +78,17 @@ class CommentService:
         )
 
         self.db.add(new_comment)
+        await record_contribution(self.db, author_id, comments=1)
 
         # Update post comment count and last_activity_at
         post.comment_count += 1
         post.last_activity_at = datetime.utcnow()
+        post.hot_score = hot_score(post.like_count, post.comment_count, post.created_at)
 
         await self.db.commit()
+        await invalidate_counts("comments")
+        await search_cache.invalidate_search(search_cache.COMMENTS)
+        search_index.sync_comment(new_comment)
         await self.db.refresh(new_comment, ["author", "post"])
 
         return new_comment
@@ -104,6 +121,8 @@ class CommentService:
         comment.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await search_cache.invalidate_search(search_cache.COMMENTS)
+        search_index.sync_comment(comment)
         await self.db.refresh(comment, ["author"])
 
         return comment
@@ -119,6 +138,8 @@ class CommentService:
             raise PermissionDeniedError("You can only delete your own comments")
 
         # Soft delete
+        if counts_as_contribution(comment.status):
+            await record_contribution(self.db, comment.user_id, comments=-1)
         comment.status = ContentStatus.DELETED
         comment.updated_at = datetime.utcnow()
 
@@ -127,8 +148,12 @@ class CommentService:
         post = post_result.scalar_one_or_none()
         if post and post.comment_count > 0:
             post.comment_count -= 1
+            post.hot_score = hot_score(post.like_count, post.comment_count, post.created_at)
 
         await self.db.commit()
+        await invalidate_counts("comments")
+        await search_cache.invalidate_search(search_cache.COMMENTS)
+        search_index.sync_comment(comment)
 
     async def moderate_comment(
         self, comment_id: int, moderation_data: CommentModerationUpdate
@@ -137,10 +162,17 @@ class CommentService:
         comment = await self.get_comment_by_id(comment_id)
 
         # Update status
+        change = counts_as_contribution(moderation_data.status) - counts_as_contribution(
+            comment.status
+        )
+        await record_contribution(self.db, comment.user_id, comments=change)
         comment.status = moderation_data.status
         comment.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await invalidate_counts("comments")
+        await search_cache.invalidate_search(search_cache.COMMENTS)
+        search_index.sync_comment(comment)
         await self.db.refresh(comment, ["author"])
 
         return comment
@@ -152,6 +184,7 @@ class CommentService:
         page_size: int = 50,
         parent_id: Optional[int] = None,
         status: Optional[ContentStatus] = ContentStatus.ACTIVE,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> tuple[List[Comment], int]:
         """List comments for a post with pagination"""
         query = select(Comment).options(selectinload(Comment.author))
@@ -181,21 +214,21 @@ class CommentService:
         if status:
             count_query = count_query.where(Comment.status == status)
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
+        total = await count_rows(self.db, count_query, count_strategy, scope="comments")
 
         # Sort by created_at (oldest first for better thread reading)
         query = query.order_by(Comment.created_at.asc())
 
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_limit(page_size, count_strategy))
 
-        # Execute query
-        result = await self.db.execute(query)
+        # Execute query; reload like counts so unfolded likes are added once
+        result = await self.db.execute(query.execution_options(populate_existing=True))
         comments = result.scalars().all()
+        await self._add_pending_likes(comments)
 
-        return list(comments), total
+        return finish_page(comments, total, page, page_size)
 
     async def get_comment_tree(self, post_id: int, max_depth: int = 5) -> List[Comment]:
         """Get nested comment tree for a post (up to max_depth levels)"""
@@ -205,8 +238,10 @@ class CommentService:
             .options(selectinload(Comment.author))
             .where(and_(Comment.post_id == post_id, Comment.status == ContentStatus.ACTIVE))
             .order_by(Comment.created_at.asc())
+            .execution_options(populate_existing=True)
         )
         all_comments = result.scalars().all()
+        await self._add_pending_likes(all_comments)
 
         # Build comment tree structure
         comment_dict = {comment.id: comment for comment in all_comments}
@@ -230,12 +265,12 @@ class CommentService:
 
         return root_comments
 
-    async def check_user_liked_comment(self, comment_id: int, user_id: int) -> bool:
-        """Check if user has liked a comment"""
-        result = await self.db.execute(
-            select(Like).where(and_(Like.comment_id == comment_id, Like.user_id == user_id))
-        )
-        return result.scalar_one_or_none() is not None
+    async def _add_pending_likes(self, comments: List[Comment]) -> None:
+        """Show likes still held in counter slots without marking rows dirty"""
+        pending = await pending_like_counts(self.db, "comment", [c.id for c in comments])
+        for comment in comments:
+            if comment.id in pending:
+                set_committed_value(comment, "like_count", comment.like_count + pending[comment.id])
 
     async def get_replies_count(self, comment_id: int) -> int:
         """Get count of direct replies to a comment"""
@@ -1,8 +1,9 @@
 """Like service - Business logic for like operations"""
 
+import logging
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy import select, func, and_
+from typing import Dict, Iterable, Optional, List, Set, Tuple
+from sqlalchemy import select, update, delete, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -15,6 +16,66 @@ from src.core.exceptions import (
     SelfLikeError,
     ValidationError,
 )
+from src.core.config import config
+from src.core.database import dialect_insert
+from src.core.ranking import hot_score
+from src.core.like_counter import add_like_delta, pending_like_counts, record_like_rate
+from src.core.counting import (
+    CountStrategy,
+    count_rows,
+    finish_page,
+    invalidate_counts,
+    page_limit,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Per-user like state in Redis: hash like_state:{user_id} with fields
+# "p:{post_id}" / "c:{comment_id}" -> "1" (liked) or "0" (not liked).
+# Lookups fill missing fields with HSETNX so they never overwrite a newer
+# value written by a like or unlike.
+def _like_state_key(user_id: int) -> str:
+    return f"like_state:{user_id}"
+
+
+async def _read_like_state(user_id: int, fields: List[str]) -> Dict[str, bool]:
+    """Cached like state for the fields present in Redis"""
+    from src.core import session as session_store
+
+    if not (config.cache.like_state_enabled and session_store.redis_client):
+        return {}
+
+    try:
+        values = await session_store.redis_client.hmget(_like_state_key(user_id), fields)
+    except Exception:
+        logger.warning("Failed to read like state from Redis", exc_info=True)
+        return {}
+
+    return {
+        field: value in ("1", b"1") for field, value in zip(fields, values) if value is not None
+    }
+
+
+async def _write_like_state(user_id: int, state: Dict[str, bool], overwrite: bool) -> None:
+    """Store like state; lookups pass overwrite=False to lose races with writes"""
+    from src.core import session as session_store
+
+    if not (config.cache.like_state_enabled and session_store.redis_client) or not state:
+        return
+
+    key = _like_state_key(user_id)
+    try:
+        pipe = session_store.redis_client.pipeline(transaction=False)
+        for field, liked in state.items():
+            if overwrite:
+                pipe.hset(key, field, "1" if liked else "0")
+            else:
+                pipe.hsetnx(key, field, "1" if liked else "0")
+        pipe.expire(key, config.cache.like_state_ttl_seconds)
+        await pipe.execute()
+    except Exception:
+        logger.warning("Failed to write like state to Redis", exc_info=True)
 
 
 class LikeService:
@@ -24,13 +85,30 @@ class LikeService:
         self.db = db
 
     async def like_post(self, post_id: int, user_id: int) -> Like:
-        """Like a post"""
+        """Like a post
+
+        The like row, the like_count increment and both ledger entries
+        (liker's cost, author's reward) commit in one transaction. The
+        unique (user_id, post_id) index arbitrates concurrent duplicates via
+        ON CONFLICT DO NOTHING, and like_count is incremented in SQL so
+        concurrent likes never lose updates.
+        """
         from src.services.point_service import PointService
         from src.models.user import User
 
-        # Verify post exists
-        post_result = await self.db.execute(select(Post).where(Post.id == post_id))
-        post = post_result.scalar_one_or_none()
+        # Post, author and author balance in one round trip
+        post_result = await self.db.execute(
+            select(
+                Post.user_id,
+                Post.like_count,
+                Post.comment_count,
+                Post.created_at,
+                User.points.label("author_points"),
+            )
+            .join(User, User.id == Post.user_id)
+            .where(Post.id == post_id)
+        )
+        post = post_result.one_or_none()
         if not post:
             raise PostNotFoundError(f"Post with ID {post_id} not found")
 
@@ -38,192 +116,295 @@ class LikeService:
         if post.user_id == user_id:
             raise SelfLikeError("You cannot like your own post")
 
-        # Check if already liked
-        existing_like = await self.db.execute(
-            select(Like).where(and_(Like.post_id == post_id, Like.user_id == user_id))
-        )
-        if existing_like.scalar_one_or_none():
-            raise DuplicateLikeError("You have already liked this post")
-
-        # Get point service and economy config
         point_service = PointService(self.db)
         config = await point_service.get_economy_config()
 
-        # Deduct like cost from liker
         try:
-            await point_service.create_transaction(
-                user_id=user_id,
-                amount=config.like_cost,  # -1 point
-                transaction_type=TransactionType.LIKE_CONTENT,
-                description=f"Liked post {post_id}",
+            new_like = await self.db.scalar(
+                dialect_insert(self.db, Like)
+                .values(
+                    user_id=user_id, post_id=post_id, comment_id=None, created_at=datetime.utcnow()
+                )
+                .on_conflict_do_nothing()
+                .returning(Like)
+            )
+            if new_like is None:
+                raise DuplicateLikeError("You have already liked this post")
+
+            if await record_like_rate("post", post_id):
+                # Hot post: count the like in a random slot instead of taking
+                # the post row lock; the folder updates like_count and hot_score
+                await add_like_delta(self.db, "post", post_id, 1)
+                pending = await pending_like_counts(self.db, "post", [post_id])
+                like_count = post.like_count + pending.get(post_id, 0)
+            else:
+                # Increment post like count; hot_score uses the pre-read counts
+                # and is corrected by the periodic refresh if likes raced
+                like_count = await self.db.scalar(
+                    update(Post)
+                    .where(Post.id == post_id)
+                    .values(
+                        like_count=Post.like_count + 1,
+                        hot_score=hot_score(
+                            post.like_count + 1, post.comment_count, post.created_at
+                        ),
+                        updated_at=Post.updated_at,
+                    )
+                    .returning(Post.like_count)
+                )
+
+            # Deduct like cost from liker
+            try:
+                liker_tx = await point_service.add_transaction(
+                    user_id=user_id,
+                    amount=config.like_cost,  # -1 point
+                    transaction_type=TransactionType.LIKE_CONTENT,
+                    description=f"Liked post {post_id}",
+                    reference_type="post",
+                    reference_id=post_id,
+                )
+            except Exception as e:
+                raise ValidationError(f"Failed to process like transaction: {str(e)}")
+
+            # Calculate reward based on like count tiers
+            reward_amount = config.receive_like_tier1  # Default: +3 points
+            if post.author_points >= 1000:
+                reward_amount = config.receive_like_tier2  # +30 points for high reputation
+            elif like_count >= 100:
+                reward_amount = config.receive_like_tier3  # +350 points for viral post
+
+            # Award like reward to post author
+            author_tx = await point_service.add_transaction(
+                user_id=post.user_id,
+                amount=reward_amount,
+                transaction_type=TransactionType.RECEIVE_LIKE,
+                description=f"Received like on post {post_id}",
                 reference_type="post",
                 reference_id=post_id,
             )
-        except Exception as e:
-            raise ValidationError(f"Failed to process like transaction: {str(e)}")
-
-        # Award like reward to post author (get updated author with new points)
-        post_author_result = await self.db.execute(select(User).where(User.id == post.user_id))
-        post_author = post_author_result.scalar_one()
-
-        # Calculate reward based on like count tiers
-        reward_amount = config.receive_like_tier1  # Default: +3 points
-        if post_author.points >= 1000:
-            reward_amount = config.receive_like_tier2  # +30 points for high reputation
-        elif post.like_count + 1 >= 100:
-            reward_amount = config.receive_like_tier3  # +350 points for viral post
-
-        await point_service.create_transaction(
-            user_id=post.user_id,
-            amount=reward_amount,
-            transaction_type=TransactionType.RECEIVE_LIKE,
-            description=f"Received like on post {post_id}",
-            reference_type="post",
-            reference_id=post_id,
-        )
-
-        # Create like
-        new_like = Like(
-            user_id=user_id, post_id=post_id, comment_id=None, created_at=datetime.utcnow()
-        )
 
-        self.db.add(new_like)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
 
-        # Increment post like count
-        post.like_count += 1
-
-        await self.db.commit()
+        await point_service.publish_balance_changes(liker_tx, author_tx)
+        await invalidate_counts("likes")
+        await _write_like_state(user_id, {f"p:{post_id}": True}, overwrite=True)
         await self.db.refresh(new_like, ["user"])
 
         return new_like
 
     async def unlike_post(self, post_id: int, user_id: int) -> None:
         """Unlike a post"""
-        # Find the like
-        like_result = await self.db.execute(
-            select(Like).where(and_(Like.post_id == post_id, Like.user_id == user_id))
+        # Delete the like
+        deleted = await self.db.scalar(
+            delete(Like)
+            .where(and_(Like.post_id == post_id, Like.user_id == user_id))
+            .returning(Like.id)
         )
-        like = like_result.scalar_one_or_none()
-
-        if not like:
+        if deleted is None:
             raise ValidationError("You have not liked this post")
 
-        # Get post and decrement like count
-        post_result = await self.db.execute(select(Post).where(Post.id == post_id))
-        post = post_result.scalar_one_or_none()
-        if post and post.like_count > 0:
-            post.like_count -= 1
+        # Decrement post like count
+        post = (
+            await self.db.execute(
+                update(Post)
+                .where(Post.id == post_id, Post.like_count > 0)
+                .values(like_count=Post.like_count - 1, updated_at=Post.updated_at)
+                .returning(Post.like_count, Post.comment_count, Post.created_at)
+            )
+        ).one_or_none()
+        if post:
+            await self.db.execute(
+                update(Post)
+                .where(Post.id == post_id)
+                .values(
+                    hot_score=hot_score(post.like_count, post.comment_count, post.created_at),
+                    updated_at=Post.updated_at,
+                )
+            )
+        else:
+            # The like was counted in a slot that has not been folded yet
+            await add_like_delta(self.db, "post", post_id, -1)
 
-        # Delete the like
-        await self.db.delete(like)
         await self.db.commit()
+        await invalidate_counts("likes")
+        await _write_like_state(user_id, {f"p:{post_id}": False}, overwrite=True)
 
     async def like_comment(self, comment_id: int, user_id: int) -> Like:
         """Like a comment"""
         # Verify comment exists
-        comment_result = await self.db.execute(select(Comment).where(Comment.id == comment_id))
-        comment = comment_result.scalar_one_or_none()
-        if not comment:
+        comment_result = await self.db.execute(
+            select(Comment.user_id).where(Comment.id == comment_id)
+        )
+        author_id = comment_result.scalar_one_or_none()
+        if author_id is None:
             raise CommentNotFoundError(f"Comment with ID {comment_id} not found")
 
         # Check if user is trying to like their own comment
-        if comment.user_id == user_id:
+        if author_id == user_id:
             raise SelfLikeError("You cannot like your own comment")
 
-        # Check if already liked
-        existing_like = await self.db.execute(
-            select(Like).where(and_(Like.comment_id == comment_id, Like.user_id == user_id))
+        # Create like; the unique (user_id, comment_id) index rejects duplicates
+        new_like = await self.db.scalar(
+            dialect_insert(self.db, Like)
+            .values(
+                user_id=user_id, post_id=None, comment_id=comment_id, created_at=datetime.utcnow()
+            )
+            .on_conflict_do_nothing()
+            .returning(Like)
         )
-        if existing_like.scalar_one_or_none():
+        if new_like is None:
             raise DuplicateLikeError("You have already liked this comment")
 
-        # Create like
-        new_like = Like(
-            user_id=user_id, post_id=None, comment_id=comment_id, created_at=datetime.utcnow()
-        )
-
-        self.db.add(new_like)
-
-        # Increment comment like count
-        comment.like_count += 1
+        # Increment comment like count, via a counter slot if the comment is hot
+        if await record_like_rate("comment", comment_id):
+            await add_like_delta(self.db, "comment", comment_id, 1)
+        else:
+            await self.db.execute(
+                update(Comment)
+                .where(Comment.id == comment_id)
+                .values(like_count=Comment.like_count + 1, updated_at=Comment.updated_at)
+            )
 
         await self.db.commit()
+        await invalidate_counts("likes")
+        await _write_like_state(user_id, {f"c:{comment_id}": True}, overwrite=True)
         await self.db.refresh(new_like, ["user"])
 
         return new_like
 
     async def unlike_comment(self, comment_id: int, user_id: int) -> None:
         """Unlike a comment"""
-        # Find the like
-        like_result = await self.db.execute(
-            select(Like).where(and_(Like.comment_id == comment_id, Like.user_id == user_id))
+        # Delete the like
+        deleted = await self.db.scalar(
+            delete(Like)
+            .where(and_(Like.comment_id == comment_id, Like.user_id == user_id))
+            .returning(Like.id)
         )
-        like = like_result.scalar_one_or_none()
-
-        if not like:
+        if deleted is None:
             raise ValidationError("You have not liked this comment")
 
-        # Get comment and decrement like count
-        comment_result = await self.db.execute(select(Comment).where(Comment.id == comment_id))
-        comment = comment_result.scalar_one_or_none()
-        if comment and comment.like_count > 0:
-            comment.like_count -= 1
+        # Decrement comment like count
+        decremented = await self.db.scalar(
+            update(Comment)
+            .where(Comment.id == comment_id, Comment.like_count > 0)
+            .values(like_count=Comment.like_count - 1, updated_at=Comment.updated_at)
+            .returning(Comment.id)
+        )
+        if decremented is None:
+            # The like was counted in a slot that has not been folded yet
+            await add_like_delta(self.db, "comment", comment_id, -1)
 
-        # Delete the like
-        await self.db.delete(like)
         await self.db.commit()
+        await invalidate_counts("likes")
+        await _write_like_state(user_id, {f"c:{comment_id}": False}, overwrite=True)
+
+    async def get_like_state(
+        self,
+        user_id: int,
+        post_ids: Iterable[int] = (),
+        comment_ids: Iterable[int] = (),
+    ) -> Tuple[Set[int], Set[int]]:
+        """Which of a page of posts and comments a user has liked
+
+        Served from the user's Redis like state where cached; the rest is
+        resolved in one query on the (user_id, post_id) and
+        (user_id, comment_id) indexes and cached for next time.
+
+        Returns:
+            (liked post IDs, liked comment IDs)
+        """
+        post_ids = list(dict.fromkeys(post_ids))
+        comment_ids = list(dict.fromkeys(comment_ids))
+        fields = [f"p:{i}" for i in post_ids] + [f"c:{i}" for i in comment_ids]
+        if not fields:
+            return set(), set()
+
+        state = await _read_like_state(user_id, fields)
+
+        missing_posts = [i for i in post_ids if f"p:{i}" not in state]
+        missing_comments = [i for i in comment_ids if f"c:{i}" not in state]
+        if missing_posts or missing_comments:
+            conditions = []
+            if missing_posts:
+                conditions.append(Like.post_id.in_(missing_posts))
+            if missing_comments:
+                conditions.append(Like.comment_id.in_(missing_comments))
+
+            result = await self.db.execute(
+                select(Like.post_id, Like.comment_id).where(
+                    Like.user_id == user_id, or_(*conditions)
+                )
+            )
+            found = {f"p:{p}" if p is not None else f"c:{c}" for p, c in result.all()}
+
+            loaded = {f"p:{i}": f"p:{i}" in found for i in missing_posts}
+            loaded.update({f"c:{i}": f"c:{i}" in found for i in missing_comments})
+            state.update(loaded)
+            await _write_like_state(user_id, loaded, overwrite=False)
+
+        return (
+            {i for i in post_ids if state[f"p:{i}"]},
+            {i for i in comment_ids if state[f"c:{i}"]},
+        )
 
     async def get_post_likes(
-        self, post_id: int, page: int = 1, page_size: int = 50
+        self,
+        post_id: int,
+        page: int = 1,
+        page_size: int = 50,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> tuple[List[Like], int]:
         """Get users who liked a post"""
         query = select(Like).options(selectinload(Like.user))
         query = query.where(Like.post_id == post_id)
 
         # Get total count
-        count_result = await self.db.execute(
-            select(func.count()).select_from(Like).where(Like.post_id == post_id)
-        )
-        total = count_result.scalar()
+        count_query = select(func.count()).select_from(Like).where(Like.post_id == post_id)
+        total = await count_rows(self.db, count_query, count_strategy, scope="likes")
 
         # Sort by created_at desc (most recent first)
         query = query.order_by(Like.created_at.desc())
 
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_limit(page_size, count_strategy))
 
         # Execute query
         result = await self.db.execute(query)
         likes = result.scalars().all()
 
-        return list(likes), total
+        return finish_page(likes, total, page, page_size)
 
     async def get_comment_likes(
-        self, comment_id: int, page: int = 1, page_size: int = 50
+        self,
+        comment_id: int,
+        page: int = 1,
+        page_size: int = 50,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> tuple[List[Like], int]:
         """Get users who liked a comment"""
         query = select(Like).options(selectinload(Like.user))
         query = query.where(Like.comment_id == comment_id)
 
         # Get total count
-        count_result = await self.db.execute(
-            select(func.count()).select_from(Like).where(Like.comment_id == comment_id)
-        )
-        total = count_result.scalar()
+        count_query = select(func.count()).select_from(Like).where(Like.comment_id == comment_id)
+        total = await count_rows(self.db, count_query, count_strategy, scope="likes")
 
         # Sort by created_at desc (most recent first)
         query = query.order_by(Like.created_at.desc())
 
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_limit(page_size, count_strategy))
 
         # Execute query
         result = await self.db.execute(query)
         likes = result.scalars().all()
 
-        return list(likes), total
+        return finish_page(likes, total, page, page_size)
 
     async def get_user_likes(
         self,
@@ -231,6 +412,7 @@ class LikeService:
         page: int = 1,
         page_size: int = 50,
         content_type: Optional[str] = None,  # "post" or "comment"
+        count_strategy: Optional[CountStrategy] = None,
     ) -> tuple[List[Like], int]:
         """Get all likes by a user"""
         query = select(Like).options(
@@ -251,18 +433,17 @@ class LikeService:
         elif content_type == "comment":
             count_query = count_query.where(Like.comment_id.isnot(None))
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+        total = await count_rows(self.db, count_query, count_strategy, scope="likes")
 
         # Sort by created_at desc
         query = query.order_by(Like.created_at.desc())
 
         # Apply pagination
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_limit(page_size, count_strategy))
 
         # Execute query
         result = await self.db.execute(query)
         likes = result.scalars().all()
 
-        return list(likes), total
+        return finish_page(likes, total, page, page_size)
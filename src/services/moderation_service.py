@@ -9,6 +9,16 @@ from src.models.moderation import Report, ReportStatus, ReportReason
 from src.models.user import User
 from src.schemas.moderation import ReportCreate, ReportResolve
 from src.core.exceptions import ValidationError
+from src.core import suggest
+from src.core.leaderboard import remove_user
+from src.core.principal import invalidate_user_principal
+from src.core.counting import (
+    CountStrategy,
+    count_rows,
+    finish_page,
+    invalidate_counts,
+    page_limit,
+)
 
 
 class ModerationService:
@@ -38,6 +48,7 @@ class ModerationService:
 
         self.db.add(report)
         await self.db.commit()
+        await invalidate_counts("reports")
         await self.db.refresh(report)
 
         return report
@@ -56,6 +67,7 @@ class ModerationService:
         page_size: int = 50,
         status: Optional[ReportStatus] = None,
         reason: Optional[ReportReason] = None,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> Tuple[List[Report], int]:
         """List reports with filters"""
         query = select(Report)
@@ -72,20 +84,25 @@ class ModerationService:
         if reason:
             count_query = count_query.where(Report.reason == reason)
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
+        total = await count_rows(
+            self.db,
+            count_query,
+            count_strategy,
+            scope="reports",
+            table=None if status or reason else "reports",
+        )
 
         # Sort by created_at desc
         query = query.order_by(desc(Report.created_at))
 
         # Pagination
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = query.offset(offset).limit(page_limit(page_size, count_strategy))
 
         result = await self.db.execute(query)
         reports = result.scalars().all()
 
-        return list(reports), total
+        return finish_page(reports, total, page, page_size)
 
     async def resolve_report(
         self, report_id: int, resolve_data: ReportResolve, moderator_id: int
@@ -100,6 +117,7 @@ class ModerationService:
         report.reviewed_at = datetime.utcnow()
 
         await self.db.commit()
+        await invalidate_counts("reports")
         await self.db.refresh(report)
 
         return report
@@ -119,4 +137,9 @@ class ModerationService:
         user.is_active = False
         await self.db.commit()
 
+        # Drop cached principals so the ban applies on the next request
+        await invalidate_user_principal(user_id)
+        await remove_user(user_id)
+        await suggest.remove_item(suggest.USER, user_id)
+
         return user
@@ -19,7 +19,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import config
 from src.core.exceptions import OAuthError, OAuthProviderError
-from src.models.user import User, UserLevelEnum
+from src.core import suggest
+from src.core.leaderboard import update_scores
+from src.core.levels import get_level_thresholds, level_for_points
+from src.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -376,7 +379,9 @@ class OAuth2Service:
             username=username,
             email=user_info.get("email") or f"{provider}_{provider_id}@oauth.local",
             password_hash=None,  # OAuth users don't have passwords
-            level=UserLevelEnum.NEW_USER,
+            level=level_for_points(
+                config.point_economy.registration_bonus, await get_level_thresholds(db)
+            ),
             points=config.point_economy.registration_bonus,
             is_active=True,
         )
@@ -398,6 +403,8 @@ class OAuth2Service:
 
         await db.commit()
         await db.refresh(new_user)
+        await update_scores({new_user.id: new_user.points})
+        await suggest.sync_user(new_user)
 
         logger.info(f"Created new OAuth user: {new_user.username} (provider: {provider})")
 
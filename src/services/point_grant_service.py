@@ -0,0 +1,264 @@
+"""Point grant service - Bulk point adjustments (event rewards, airdrops)"""
+
+import codecs
+import csv
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import UploadFile
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import dialect_insert
+from src.core.exceptions import GrantBatchConflictError, GrantBatchNotFoundError
+from src.core.levels import get_level_thresholds, level_expression
+from src.models.points import PointGrantBatch, Transaction, TransactionType
+from src.models.user import User
+
+
+@dataclass
+class GrantRow:
+    """One parsed grant, or a row that could not be applied (``error`` set)"""
+
+    line: int
+    user_id: Optional[int]
+    amount: Optional[int]
+    reason: Optional[str] = None
+    error: Optional[str] = None
+
+
+async def iter_upload_lines(file: UploadFile, chunk_size: int = 64 * 1024) -> AsyncIterator[str]:
+    """Stream text lines from an uploaded file without reading it into memory"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    while chunk := await file.read(chunk_size):
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+async def parse_grant_rows(lines: AsyncIterable[str], fmt: str) -> AsyncIterator[GrantRow]:
+    """Parse (user_id, amount, reason) rows from CSV or JSONL lines
+
+    CSV may start with a ``user_id,amount,reason`` header. Blank lines are
+    skipped; malformed rows are yielded with ``error`` set so they are
+    counted and reported rather than aborting the batch.
+    """
+    line_number = 0
+    async for raw in lines:
+        line_number += 1
+        line = raw.strip()
+        if not line:
+            continue
+
+        try:
+            if fmt == "jsonl":
+                data = json.loads(line)
+                user_id, amount, reason = data["user_id"], data["amount"], data.get("reason")
+            else:
+                fields = next(csv.reader([line]))
+                if line_number == 1 and fields[0].strip().lower() == "user_id":
+                    continue
+                user_id, amount = fields[0], fields[1]
+                reason = fields[2] if len(fields) > 2 else None
+            row = GrantRow(line_number, int(user_id), int(amount), reason or None)
+        except (ValueError, KeyError, IndexError, TypeError):
+            yield GrantRow(line_number, None, None, error="Malformed row")
+            continue
+
+        if row.amount == 0:
+            row.error = "Amount must be non-zero"
+        yield row
+
+
+class PointGrantService:
+    """Service for bulk point adjustments"""
+
+    DEFAULT_CHUNK_SIZE = 1000
+    MAX_REPORTED_REJECTIONS = 100
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_batch(self, batch_key: str) -> PointGrantBatch:
+        """Get a grant batch by its batch ID"""
+        result = await self.db.execute(
+            select(PointGrantBatch).where(PointGrantBatch.batch_key == batch_key)
+        )
+        batch = result.scalar_one_or_none()
+        if not batch:
+            raise GrantBatchNotFoundError(f"Grant batch {batch_key} not found")
+        return batch
+
+    async def apply_grants(
+        self,
+        batch_key: str,
+        rows: AsyncIterable[GrantRow],
+        admin_id: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Callable[[PointGrantBatch], None]] = None,
+    ) -> Tuple[PointGrantBatch, List[GrantRow]]:
+        """Apply a stream of grants in chunks, idempotently by batch ID
+
+        Each chunk is one transaction: a single set-based UPDATE of the
+        balance, lifetime totals and level of every user in the chunk, a
+        multi-row ledger insert and the batch's progress. Re-submitting the
+        same batch ID skips rows already applied (the input must be the same
+        file), and a completed batch applies nothing.
+
+        A user whose chunk total would take their balance below zero, or who
+        does not exist, is rejected for that chunk.
+
+        Returns:
+            Tuple of (batch, rejected rows from this run, capped)
+        """
+        chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+
+        await self.db.execute(
+            dialect_insert(self.db, PointGrantBatch)
+            .values(batch_key=batch_key, created_by=admin_id, created_at=datetime.utcnow())
+            .on_conflict_do_nothing()
+        )
+        await self.db.commit()
+        batch = await self.get_batch(batch_key)
+
+        rejections: List[GrantRow] = []
+        if batch.status == "completed":
+            return batch, rejections
+
+        skip = batch.rows_processed
+        chunk: List[GrantRow] = []
+        async for row in rows:
+            if skip:
+                skip -= 1
+                continue
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                await self._apply_chunk(batch, chunk, rejections)
+                chunk = []
+                if on_progress:
+                    on_progress(batch)
+
+        await self._apply_chunk(batch, chunk, rejections, final=True)
+        if on_progress:
+            on_progress(batch)
+
+        return batch, rejections
+
+    async def _apply_chunk(
+        self,
+        batch: PointGrantBatch,
+        chunk: List[GrantRow],
+        rejections: List[GrantRow],
+        final: bool = False,
+    ) -> None:
+        """Apply one chunk and advance the batch in the same transaction"""
+        from src.services.point_service import PointService
+
+        try:
+            # Claim the chunk; fails if another run has advanced the batch
+            claimed = await self.db.scalar(
+                update(PointGrantBatch)
+                .where(
+                    PointGrantBatch.id == batch.id,
+                    PointGrantBatch.status == "running",
+                    PointGrantBatch.rows_processed == batch.rows_processed,
+                )
+                .values(rows_processed=PointGrantBatch.rows_processed + len(chunk))
+                .returning(PointGrantBatch.id)
+            )
+            if claimed is None:
+                raise GrantBatchConflictError(
+                    f"Grant batch {batch.batch_key} is being applied by another run"
+                )
+
+            valid = [row for row in chunk if row.error is None]
+            totals: Dict[int, int] = defaultdict(int)
+            earned: Dict[int, int] = defaultdict(int)
+            spent: Dict[int, int] = defaultdict(int)
+            counts: Dict[int, int] = defaultdict(int)
+            for row in valid:
+                totals[row.user_id] += row.amount
+                earned[row.user_id] += max(row.amount, 0)
+                spent[row.user_id] += max(-row.amount, 0)
+                counts[row.user_id] += 1
+
+            balances: Dict[int, int] = {}
+            if totals:
+                delta = case(totals, value=User.id)
+                thresholds = await get_level_thresholds(self.db)
+                result = await self.db.execute(
+                    update(User)
+                    .where(User.id.in_(list(totals)), User.points + delta >= 0)
+                    .values(
+                        points=User.points + delta,
+                        level=level_expression(User.points + delta, thresholds),
+                        total_earned=User.total_earned + case(earned, value=User.id),
+                        total_spent=User.total_spent + case(spent, value=User.id),
+                        tx_count=User.tx_count + case(counts, value=User.id),
+                    )
+                    .returning(User.id, User.points)
+                    .execution_options(synchronize_session=False)
+                )
+                balances = dict(result.all())
+
+            missing = set(totals) - set(balances)
+            existing = set()
+            if missing:
+                existing = set(
+                    (await self.db.scalars(select(User.id).where(User.id.in_(missing)))).all()
+                )
+
+            # Ledger rows in input order, with balance_after running up to
+            # the balance returned by the UPDATE
+            running = {user_id: balances[user_id] - totals[user_id] for user_id in balances}
+            ledger: List[Transaction] = []
+            applied_amount = 0
+            for row in valid:
+                if row.user_id not in balances:
+                    row.error = (
+                        "Insufficient balance" if row.user_id in existing else "User not found"
+                    )
+                    continue
+                running[row.user_id] += row.amount
+                applied_amount += row.amount
+                transaction = Transaction(
+                    user_id=row.user_id,
+                    amount=row.amount,
+                    transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                    description=(row.reason or f"Bulk grant {batch.batch_key}")[:500],
+                    reference_type="point_grant",
+                    reference_id=batch.id,
+                    balance_after=running[row.user_id],
+                    created_at=datetime.utcnow(),
+                )
+                self.db.add(transaction)
+                ledger.append(transaction)
+
+            rejected = [row for row in chunk if row.error is not None]
+            values = {
+                "applied_count": PointGrantBatch.applied_count + len(chunk) - len(rejected),
+                "rejected_count": PointGrantBatch.rejected_count + len(rejected),
+                "total_amount": PointGrantBatch.total_amount + applied_amount,
+            }
+            if final:
+                values.update(status="completed", completed_at=datetime.utcnow())
+            await self.db.execute(
+                update(PointGrantBatch).where(PointGrantBatch.id == batch.id).values(**values)
+            )
+
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+
+        await self.db.refresh(batch)
+        await PointService(self.db).publish_balance_changes(*ledger)
+        rejections.extend(rejected[: max(self.MAX_REPORTED_REJECTIONS - len(rejections), 0)])
@@ -1,34 +1,65 @@
 """Point service - Business logic for point operations"""
 
 from datetime import datetime
-from typing import Optional, List, Tuple
-from sqlalchemy import select, func, desc
+from typing import Dict, Optional, List, Tuple
+from sqlalchemy import case, select, update, func, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.points import Transaction, PointEconomy, TransactionType
+from src.models.points import ArchivedPointTotal, Transaction, PointEconomy, TransactionType
 from src.models.user import User
-from src.schemas.points import AdminAdjustment, LeaderboardEntry
+from src.schemas.points import (
+    AdminAdjustment,
+    LeaderboardEntry,
+    LeaderboardRankResponse,
+    PointEconomyUpdate,
+)
 from src.core.exceptions import (
     UserNotFoundError,
     InsufficientBalanceError,
     InvalidWalletAddressError,
 )
+from src.core import leaderboard
+from src.core.levels import get_level_thresholds, level_expression, level_for_points
+from src.core.principal import invalidate_user_principal, refresh_principal_points
+from src.core.economy import (
+    EconomyConfig,
+    cache_economy,
+    get_cached_economy,
+    publish_economy_change,
+)
+from src.core.counting import (
+    CountStrategy,
+    count_rows,
+    finish_page,
+    invalidate_counts,
+    page_limit,
+)
 
 
 class PointService:
     """Service for point-related business logic"""
 
+    RECONCILE_BATCH_SIZE = 1000
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_economy_config(self) -> PointEconomy:
-        """Get point economy configuration"""
+    async def get_economy_config(self) -> EconomyConfig:
+        """Get point economy configuration
+
+        Served from this worker's cached snapshot; the row is only read
+        after an update or when the snapshot expires.
+        """
+        cached = get_cached_economy()
+        if cached is not None:
+            return cached
+
         result = await self.db.execute(select(PointEconomy).where(PointEconomy.id == 1))
-        config = result.scalar_one_or_none()
+        economy = result.scalar_one_or_none()
 
         # Create default config if doesn't exist
-        if not config:
-            config = PointEconomy(
+        if not economy:
+            economy = PointEconomy(
                 id=1,
                 create_post_cost=-5,
                 create_comment_cost=-2,
@@ -41,11 +72,28 @@ class PointService:
                 crypto_reward_bnb_amount="0.01",
                 updated_at=datetime.utcnow(),
             )
-            self.db.add(config)
+            self.db.add(economy)
             await self.db.commit()
-            await self.db.refresh(config)
+            await self.db.refresh(economy)
+
+        return cache_economy(economy)
+
+    async def update_economy_config(self, updates: PointEconomyUpdate) -> EconomyConfig:
+        """Admin-only: Change point costs and rewards in every worker"""
+        await self.get_economy_config()  # Ensure the row exists
+
+        result = await self.db.execute(select(PointEconomy).where(PointEconomy.id == 1))
+        economy = result.scalar_one()
 
-        return config
+        # Null fields are left unchanged; every column is NOT NULL
+        for field, value in updates.model_dump(exclude_none=True).items():
+            setattr(economy, field, value)
+        economy.updated_at = datetime.utcnow()
+
+        await self.db.commit()
+        await self.db.refresh(economy)
+
+        return await publish_economy_change(economy)
 
     async def create_transaction(
         self,
@@ -59,21 +107,76 @@ class PointService:
         bnb_amount: Optional[str] = None,
     ) -> Transaction:
         """Create a point transaction and update user balance"""
-        # Get user
-        user_result = await self.db.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one_or_none()
-        if not user:
-            raise UserNotFoundError(f"User with ID {user_id} not found")
+        transaction = await self.add_transaction(
+            user_id=user_id,
+            amount=amount,
+            transaction_type=transaction_type,
+            description=description,
+            reference_type=reference_type,
+            reference_id=reference_id,
+            blockchain_tx_hash=blockchain_tx_hash,
+            bnb_amount=bnb_amount,
+        )
 
-        # Check if user has sufficient balance for negative transactions
-        if amount < 0 and user.points + amount < 0:
-            raise InsufficientBalanceError(
-                f"Insufficient points. Current: {user.points}, Required: {abs(amount)}"
+        try:
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        await self.publish_balance_changes(transaction)
+
+        return transaction
+
+    async def add_transaction(
+        self,
+        user_id: int,
+        amount: int,
+        transaction_type: TransactionType,
+        description: str,
+        reference_type: Optional[str] = None,
+        reference_id: Optional[int] = None,
+        blockchain_tx_hash: Optional[str] = None,
+        bnb_amount: Optional[str] = None,
+    ) -> Transaction:
+        """Apply a point transaction inside the caller's database transaction
+
+        The balance check and update are a single conditional
+        ``UPDATE users SET points = points + :amount ... RETURNING points``,
+        so concurrent writers never lose updates or overdraw and no row is
+        read first. The same statement maintains the user's lifetime
+        ``total_earned``/``total_spent``/``tx_count`` and promotes or demotes
+        their level when the new balance crosses a level threshold. The
+        ledger row is inserted when the caller commits.
+
+        Does not commit, so several ledger entries can be written atomically
+        with other changes. After committing, pass the returned transactions
+        to ``publish_balance_changes``.
+
+        Returns:
+            Pending transaction carrying the new balance in ``balance_after``
+        """
+        thresholds = await get_level_thresholds(self.db)
+        balance_after = await self.db.scalar(
+            update(User)
+            .where(User.id == user_id, User.points + amount >= 0)
+            .values(
+                points=User.points + amount,
+                level=level_expression(User.points + amount, thresholds),
+                total_earned=User.total_earned + max(amount, 0),
+                total_spent=User.total_spent + max(-amount, 0),
+                tx_count=User.tx_count + 1,
             )
+            .returning(User.points)
+        )
 
-        # Update user points
-        user.points += amount
-        balance_after = user.points
+        if balance_after is None:
+            # Only the failure path pays for a read to explain itself
+            points = await self.db.scalar(select(User.points).where(User.id == user_id))
+            if points is None:
+                raise UserNotFoundError(f"User with ID {user_id} not found")
+            raise InsufficientBalanceError(
+                f"Insufficient points. Current: {points}, Required: {abs(amount)}"
+            )
 
         # Create transaction
         transaction = Transaction(
@@ -90,78 +193,105 @@ class PointService:
         )
 
         self.db.add(transaction)
-        await self.db.commit()
-        await self.db.refresh(transaction)
 
         return transaction
 
+    async def publish_balance_changes(self, *transactions: Transaction) -> None:
+        """Refresh caches derived from user balances after a commit
+
+        Pass every transaction that was committed, in order; each user is
+        refreshed once with their final balance.
+        """
+        before: Dict[int, int] = {}
+        scores: Dict[int, int] = {}
+        for transaction in transactions:
+            before.setdefault(transaction.user_id, transaction.balance_after - transaction.amount)
+            scores[transaction.user_id] = transaction.balance_after
+
+        thresholds = await get_level_thresholds(self.db)
+        for user_id, points in scores.items():
+            if level_for_points(before[user_id], thresholds) != level_for_points(
+                points, thresholds
+            ):
+                # Crossed a level threshold; level gates permissions
+                await invalidate_user_principal(user_id)
+            else:
+                # Keep the cached principal's balance in step with the ledger
+                await refresh_principal_points(user_id, points)
+            await invalidate_counts(f"transactions:{user_id}")
+        await leaderboard.update_scores(scores)
+
     async def get_user_transactions(
         self,
         user_id: int,
         page: int = 1,
         page_size: int = 50,
         transaction_type: Optional[TransactionType] = None,
+        count_strategy: Optional[CountStrategy] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> Tuple[List[Transaction], int]:
-        """Get user's transaction history"""
-        query = select(Transaction).where(Transaction.user_id == user_id)
-
+        """Get user's transaction history
+
+        The ledger is partitioned by month on ``created_at``. Every query is
+        bounded below by the user's registration time (or ``since``, if
+        later) and above by ``until``, so PostgreSQL only visits the
+        partitions that can hold the user's rows.
+        """
+        registered_at = await self.db.scalar(select(User.created_at).where(User.id == user_id))
+        lower = max(filter(None, (registered_at, since)), default=None)
+
+        filters = [Transaction.user_id == user_id]
+        if lower:
+            filters.append(Transaction.created_at >= lower)
+        if until:
+            filters.append(Transaction.created_at < until)
         # Filter by type if provided
         if transaction_type:
-            query = query.where(Transaction.transaction_type == transaction_type)
+            filters.append(Transaction.transaction_type == transaction_type)
 
         # Get total count
-        count_query = (
-            select(func.count()).select_from(Transaction).where(Transaction.user_id == user_id)
+        count_query = select(func.count()).select_from(Transaction).where(*filters)
+        total = await count_rows(
+            self.db, count_query, count_strategy, scope=f"transactions:{user_id}"
         )
-        if transaction_type:
-            count_query = count_query.where(Transaction.transaction_type == transaction_type)
 
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar()
-
-        # Sort by created_at desc (most recent first)
-        query = query.order_by(desc(Transaction.created_at))
-
-        # Apply pagination
+        # Most recent first
         offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        query = (
+            select(Transaction)
+            .where(*filters)
+            .order_by(desc(Transaction.created_at), desc(Transaction.id))
+            .offset(offset)
+            .limit(page_limit(page_size, count_strategy))
+        )
 
         # Execute query
         result = await self.db.execute(query)
         transactions = result.scalars().all()
 
-        return list(transactions), total
+        return finish_page(transactions, total, page, page_size)
 
     async def get_user_points_summary(self, user_id: int) -> dict:
-        """Get user's points summary with statistics"""
-        # Get user
-        user_result = await self.db.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one_or_none()
+        """Get user's points summary with statistics
+
+        Lifetime totals are maintained on the user row by every ledger
+        write, so this is one primary-key read.
+        """
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.username,
+                User.points,
+                User.total_earned,
+                User.total_spent,
+                User.tx_count,
+            ).where(User.id == user_id)
+        )
+        user = result.one_or_none()
         if not user:
             raise UserNotFoundError(f"User with ID {user_id} not found")
 
-        # Get total earned (sum of positive transactions)
-        earned_result = await self.db.execute(
-            select(func.sum(Transaction.amount))
-            .where(Transaction.user_id == user_id)
-            .where(Transaction.amount > 0)
-        )
-        total_earned = earned_result.scalar() or 0
-
-        # Get total spent (sum of negative transactions)
-        spent_result = await self.db.execute(
-            select(func.sum(Transaction.amount))
-            .where(Transaction.user_id == user_id)
-            .where(Transaction.amount < 0)
-        )
-        total_spent = abs(spent_result.scalar() or 0)
-
-        # Get transaction count
-        count_result = await self.db.execute(
-            select(func.count()).select_from(Transaction).where(Transaction.user_id == user_id)
-        )
-        transactions_count = count_result.scalar()
-
         # Get crypto reward cost
         config = await self.get_economy_config()
         can_claim_crypto = user.points >= config.crypto_reward_cost
@@ -170,13 +300,93 @@ class PointService:
             "user_id": user.id,
             "username": user.username,
             "current_points": user.points,
-            "total_earned": total_earned,
-            "total_spent": total_spent,
-            "transactions_count": transactions_count,
+            "total_earned": user.total_earned,
+            "total_spent": user.total_spent,
+            "transactions_count": user.tx_count,
             "can_claim_crypto": can_claim_crypto,
             "crypto_reward_cost": config.crypto_reward_cost,
         }
 
+    async def reconcile_point_totals(self, batch_size: Optional[int] = None) -> int:
+        """Recompute users' lifetime ledger totals from ``transactions``
+
+        Walks users in primary-key batches. Each batch locks its user rows,
+        which waits out in-flight ledger writes for those users, aggregates
+        their transactions in one grouped scan (plus any archived totals)
+        and rewrites only the rows that disagree.
+
+        Returns:
+            Number of users whose totals were corrected
+        """
+        batch_size = batch_size or self.RECONCILE_BATCH_SIZE
+        corrected = 0
+        last_id = 0
+
+        while True:
+            try:
+                result = await self.db.execute(
+                    select(User.id, User.total_earned, User.total_spent, User.tx_count)
+                    .where(User.id > last_id)
+                    .order_by(User.id)
+                    .limit(batch_size)
+                    .with_for_update()
+                )
+                stored = {row.id: tuple(row[1:]) for row in result.all()}
+                if not stored:
+                    await self.db.rollback()
+                    break
+                last_id = max(stored)
+
+                result = await self.db.execute(
+                    select(
+                        Transaction.user_id,
+                        func.coalesce(
+                            func.sum(case((Transaction.amount > 0, Transaction.amount))), 0
+                        ),
+                        func.coalesce(
+                            func.sum(case((Transaction.amount < 0, -Transaction.amount))), 0
+                        ),
+                        func.count(),
+                    )
+                    .where(Transaction.user_id.in_(list(stored)))
+                    .group_by(Transaction.user_id)
+                )
+                actual = {row[0]: tuple(row[1:]) for row in result.all()}
+
+                # Months archived out of the ledger still count
+                result = await self.db.execute(
+                    select(
+                        ArchivedPointTotal.user_id,
+                        ArchivedPointTotal.total_earned,
+                        ArchivedPointTotal.total_spent,
+                        ArchivedPointTotal.tx_count,
+                    ).where(ArchivedPointTotal.user_id.in_(list(stored)))
+                )
+                for row in result.all():
+                    live = actual.get(row[0], (0, 0, 0))
+                    actual[row[0]] = tuple(a + b for a, b in zip(live, row[1:]))
+
+                updates = [
+                    {
+                        "id": user_id,
+                        "total_earned": totals[0],
+                        "total_spent": totals[1],
+                        "tx_count": totals[2],
+                    }
+                    for user_id in stored
+                    if (totals := actual.get(user_id, (0, 0, 0))) != stored[user_id]
+                ]
+                if updates:
+                    await self.db.execute(update(User), updates)
+                await self.db.commit()
+            except Exception:
+                await self.db.rollback()
+                raise
+
+            corrected += len(updates)
+
+        return corrected
+
     async def admin_adjust_points(self, adjustment: AdminAdjustment, admin_id: int) -> Transaction:
         """Admin-only: Adjust user points"""
         transaction = await self.create_transaction(
@@ -190,7 +400,44 @@ class PointService:
     async def get_leaderboard(
         self, page: int = 1, page_size: int = 50
     ) -> Tuple[List[LeaderboardEntry], int]:
-        """Get points leaderboard"""
+        """Get points leaderboard
+
+        Served from the Redis leaderboard when it has been built, otherwise
+        from a COUNT plus an ORDER BY points scan over active users.
+        """
+        offset = (page - 1) * page_size
+
+        if await leaderboard.is_available():
+            scores, total = await leaderboard.get_page(offset, page_size)
+            result = await self.db.execute(
+                select(
+                    User.id,
+                    User.username,
+                    User.display_name,
+                    User.avatar_url,
+                    User.level,
+                ).where(User.id.in_([user_id for user_id, _ in scores]))
+            )
+            users = {row.id: row for row in result.all()}
+
+            entries = []
+            for idx, (user_id, points) in enumerate(scores, start=offset + 1):
+                user = users.get(user_id)
+                if user is None:
+                    continue
+                entries.append(
+                    LeaderboardEntry(
+                        rank=idx,
+                        user_id=user.id,
+                        username=user.username,
+                        display_name=user.display_name,
+                        avatar_url=user.avatar_url,
+                        points=points,
+                        level=user.level.value,
+                    )
+                )
+            return entries, total
+
         # Get total user count
         count_result = await self.db.execute(
             select(func.count()).select_from(User).where(User.is_active)
@@ -202,14 +449,13 @@ class PointService:
         query = query.order_by(desc(User.points))
 
         # Apply pagination
-        offset = (page - 1) * page_size
         query = query.offset(offset).limit(page_size)
 
         result = await self.db.execute(query)
         users = result.scalars().all()
 
         # Create leaderboard entries with ranks
-        leaderboard = []
+        entries = []
         for idx, user in enumerate(users, start=offset + 1):
             entry = LeaderboardEntry(
                 rank=idx,
@@ -220,9 +466,44 @@ class PointService:
                 points=user.points,
                 level=user.level.value,
             )
-            leaderboard.append(entry)
+            entries.append(entry)
+
+        return entries, total
+
+    async def get_leaderboard_rank(self, user_id: int) -> LeaderboardRankResponse:
+        """Get a user's leaderboard rank
+
+        Rank is 1 + the number of active users with more points. Without
+        the Redis leaderboard this is a COUNT over active users.
+        """
+        if await leaderboard.is_available():
+            ranked = await leaderboard.get_rank(user_id)
+            if ranked is not None:
+                rank, points, total = ranked
+                return LeaderboardRankResponse(
+                    user_id=user_id, rank=rank, points=points, total_users=total
+                )
+
+        result = await self.db.execute(
+            select(User.points, User.is_active).where(User.id == user_id)
+        )
+        user = result.one_or_none()
+        if user is None:
+            raise UserNotFoundError(f"User with ID {user_id} not found")
+
+        total = await self.db.scalar(select(func.count()).select_from(User).where(User.is_active))
+        rank = None
+        if user.is_active:
+            ahead = await self.db.scalar(
+                select(func.count())
+                .select_from(User)
+                .where(User.is_active, User.points > user.points)
+            )
+            rank = ahead + 1
 
-        return leaderboard, total
+        return LeaderboardRankResponse(
+            user_id=user_id, rank=rank, points=user.points, total_users=total
+        )
 
     async def claim_crypto_reward(self, user_id: int, wallet_address: str) -> Transaction:
         """Claim crypto reward (placeholder - needs blockchain integration)"""
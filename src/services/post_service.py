@@ -1,15 +1,41 @@
 """Post service - Business logic for post operations"""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List
-from sqlalchemy import select, func, and_, or_, desc, asc
+from sqlalchemy import bindparam, select, update, func, or_, desc, asc, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from src.models.content import Post, ContentStatus, Like
+from src.models.content import Post, ContentStatus
 from src.models.organization import Channel, PostTag
 from src.schemas.post import PostCreate, PostUpdate, PostModerationUpdate, PostSortBy
 from src.core.exceptions import PostNotFoundError, ChannelNotFoundError, PermissionDeniedError
+from src.core.config import config
+from src.core.pagination import encode_cursor, decode_cursor
+from src.core.ranking import hot_score
+from src.core.view_counter import record_view
+from src.core.like_counter import pending_like_counts
+from src.core.contributions import counts_as_contribution, record_contribution
+from src.core import search_cache, search_index, suggest
+from src.core.counting import (
+    CountStrategy,
+    count_rows,
+    finish_page,
+    invalidate_counts,
+    page_limit,
+)
+
+# Sort column and direction for each sort order; Post.id breaks ties so the
+# ordering is total and keyset cursors never skip or repeat rows.
+POST_SORT_KEYS = {
+    PostSortBy.CREATED_DESC: (Post.created_at, True),
+    PostSortBy.CREATED_ASC: (Post.created_at, False),
+    PostSortBy.POPULAR: (Post.like_count, True),
+    PostSortBy.TRENDING: (Post.last_activity_at, True),
+    PostSortBy.COMMENTED: (Post.comment_count, True),
+    PostSortBy.HOT: (Post.hot_score, True),
+}
 
 
 class PostService:
@@ -48,10 +74,16 @@ class PostService:
             updated_at=datetime.utcnow(),
             last_activity_at=datetime.utcnow(),
         )
+        new_post.hot_score = hot_score(0, 0, new_post.created_at)
 
         self.db.add(new_post)
+        await record_contribution(self.db, author_id, posts=1)
         await self.db.commit()
         await self.db.refresh(new_post)
+        await invalidate_counts("posts")
+        await search_cache.invalidate_search(search_cache.POSTS)
+        search_index.sync_post(new_post)
+        await suggest.sync_post(new_post)
 
         # Add tags if provided
         if post_data.tag_ids:
@@ -76,16 +108,23 @@ class PostService:
                 selectinload(Post.media),
             )
             .where(Post.id == post_id)
+            # The displayed counts include buffered views and likes; reload the
+            # stored values rather than adding to already-adjusted ones
+            .execution_options(populate_existing=increment_view)
         )
         post = result.scalar_one_or_none()
 
         if not post:
             raise PostNotFoundError(f"Post with ID {post_id} not found")
 
-        # Increment view count
+        # Buffer the view; show it (and other unflushed views and likes)
+        # without marking the row dirty
         if increment_view:
-            post.view_count += 1
-            await self.db.commit()
+            pending = await record_view(post_id)
+            set_committed_value(post, "view_count", post.view_count + pending)
+            pending_likes = await pending_like_counts(self.db, "post", [post_id])
+            if pending_likes:
+                set_committed_value(post, "like_count", post.like_count + pending_likes[post_id])
 
         return post
 
@@ -120,6 +159,10 @@ class PostService:
         post.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await invalidate_counts("posts")
+        await search_cache.invalidate_search(search_cache.POSTS)
+        search_index.sync_post(post)
+        await suggest.sync_post(post)
         await self.db.refresh(post, ["author", "channel", "tags"])
 
         return post
@@ -133,10 +176,16 @@ class PostService:
             raise PermissionDeniedError("You can only delete your own posts")
 
         # Soft delete
+        if counts_as_contribution(post.status):
+            await record_contribution(self.db, post.user_id, posts=-1)
         post.status = ContentStatus.DELETED
         post.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await invalidate_counts("posts")
+        await search_cache.invalidate_search(search_cache.POSTS)
+        search_index.sync_post(post)
+        await suggest.sync_post(post)
 
     async def moderate_post(self, post_id: int, moderation_data: PostModerationUpdate) -> Post:
         """Moderate a post (moderator only)"""
@@ -144,6 +193,10 @@ class PostService:
 
         # Update moderation fields
         if moderation_data.status is not None:
+            change = counts_as_contribution(moderation_data.status) - counts_as_contribution(
+                post.status
+            )
+            await record_contribution(self.db, post.user_id, posts=change)
             post.status = moderation_data.status
         if moderation_data.is_pinned is not None:
             post.is_pinned = moderation_data.is_pinned
@@ -153,6 +206,10 @@ class PostService:
         post.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await invalidate_counts("posts")
+        await search_cache.invalidate_search(search_cache.POSTS)
+        search_index.sync_post(post)
+        await suggest.sync_post(post)
         await self.db.refresh(post, ["author", "channel", "tags"])
 
         return post
@@ -167,8 +224,16 @@ class PostService:
         sort_by: PostSortBy = PostSortBy.CREATED_DESC,
         search: Optional[str] = None,
         tag_ids: Optional[List[int]] = None,
+        cursor: Optional[str] = None,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> tuple[List[Post], int]:
-        """List posts with pagination and filters"""
+        """List posts with pagination and filters
+
+        When ``cursor`` is given, ``page`` is ignored and the page starts
+        after the row the cursor was issued for (see ``next_cursor``).
+        ``count_strategy`` controls how the total is computed (see
+        ``src.core.counting``).
+        """
         query = select(Post).options(
             selectinload(Post.author),
             selectinload(Post.channel),
@@ -204,37 +269,47 @@ class PostService:
         if tag_ids:
             count_query = count_query.join(PostTag).where(PostTag.tag_id.in_(tag_ids))
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
+        unfiltered = not (channel_id or author_id or status or search or tag_ids)
+        total = await count_rows(
+            self.db,
+            count_query,
+            count_strategy,
+            scope="posts",
+            table="posts" if unfiltered else None,
+        )
 
         # Apply sorting
-        if sort_by == PostSortBy.CREATED_DESC:
-            query = query.order_by(desc(Post.created_at))
-        elif sort_by == PostSortBy.CREATED_ASC:
-            query = query.order_by(asc(Post.created_at))
-        elif sort_by == PostSortBy.POPULAR:
-            query = query.order_by(desc(Post.like_count))
-        elif sort_by == PostSortBy.TRENDING:
-            query = query.order_by(desc(Post.last_activity_at))
-        elif sort_by == PostSortBy.COMMENTED:
-            query = query.order_by(desc(Post.comment_count))
-
-        # Apply pagination
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size)
+        sort_column, descending = POST_SORT_KEYS[sort_by]
+        if descending:
+            query = query.order_by(desc(sort_column), desc(Post.id))
+        else:
+            query = query.order_by(asc(sort_column), asc(Post.id))
+
+        # Apply pagination: seek past the cursor row, or fall back to OFFSET
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_by.value)
+            key = tuple_(sort_column, Post.id)
+            query = query.where(key < (value, last_id) if descending else key > (value, last_id))
+            page = 1
+        else:
+            query = query.offset((page - 1) * page_size)
+        query = query.limit(page_limit(page_size, count_strategy))
 
         # Execute query
         result = await self.db.execute(query)
         posts = result.scalars().unique().all()
 
-        return list(posts), total
+        return finish_page(posts, total, page, page_size)
 
-    async def check_user_liked_post(self, post_id: int, user_id: int) -> bool:
-        """Check if user has liked a post"""
-        result = await self.db.execute(
-            select(Like).where(and_(Like.post_id == post_id, Like.user_id == user_id))
-        )
-        return result.scalar_one_or_none() is not None
+    @staticmethod
+    def next_cursor(posts: List[Post], page_size: int, sort_by: PostSortBy) -> Optional[str]:
+        """Cursor for the page after ``posts``, or None if this was the last page"""
+        if not posts or len(posts) < page_size:
+            return None
+
+        sort_column, _ = POST_SORT_KEYS[sort_by]
+        last = posts[-1]
+        return encode_cursor(sort_by.value, getattr(last, sort_column.key), last.id)
 
     def _sanitize_html(self, body: str) -> str:
         """Sanitize HTML content - supports both Markdown and raw HTML"""
@@ -260,6 +335,55 @@ class PostService:
             html_content = escaped.replace("\n", "<br>")
             return html_content
 
+    async def refresh_hot_scores(self, now: Optional[datetime] = None) -> int:
+        """Re-decay hot scores for posts inside the refresh window
+
+        Runs in batches of ``ranking.hot_refresh_batch_size`` keyed on id so
+        each batch is a short transaction.
+
+        Returns:
+            Number of posts updated
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - timedelta(days=config.ranking.hot_refresh_window_days)
+        batch_size = config.ranking.hot_refresh_batch_size
+        last_id = 0
+        updated = 0
+
+        while True:
+            result = await self.db.execute(
+                select(Post.id, Post.like_count, Post.comment_count, Post.created_at)
+                .where(
+                    Post.created_at >= cutoff,
+                    Post.status == ContentStatus.ACTIVE,
+                    Post.id > last_id,
+                )
+                .order_by(Post.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                return updated
+
+            # Score-only change: keep updated_at as the last edit time
+            posts = Post.__table__
+            await self.db.execute(
+                update(posts)
+                .where(posts.c.id == bindparam("post_id"))
+                .values(hot_score=bindparam("score"), updated_at=posts.c.updated_at),
+                [
+                    {
+                        "post_id": row.id,
+                        "score": hot_score(row.like_count, row.comment_count, row.created_at, now),
+                    }
+                    for row in rows
+                ],
+            )
+            await self.db.commit()
+
+            updated += len(rows)
+            last_id = rows[-1].id
+
     async def update_last_activity(self, post_id: int) -> None:
         """Update post's last activity timestamp (called when new comment added)"""
         post = await self.get_post_by_id(post_id)
@@ -1,12 +1,22 @@
 """Search service"""
 
-from typing import List, Tuple
+import asyncio
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
 from sqlalchemy import select, or_, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import selectinload
 
 from src.models.content import Post, Comment, ContentStatus
+from src.models.organization import Channel, Tag
 from src.models.user import User
+from src.core import fulltext, search_index, suggest
+from src.core.counting import CountStrategy, count_rows, finish_page, page_limit
+
+logger = logging.getLogger(__name__)
+
+# Unified search sources and the SearchService method behind each
+UNIFIED_SOURCES = {"posts": "search_posts", "comments": "search_comments"}
 
 
 class SearchService:
@@ -15,16 +25,52 @@ class SearchService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def _search_index(self, model, kind: str, query: str, page: int, page_size: int, options):
+        """Page of active ``model`` rows from the embedded index, best match first
+
+        The index counts its matches, so the total is always exact.
+        """
+        ids, total = search_index.search(kind, query, (page - 1) * page_size, page_size)
+        if not ids:
+            return [], total
+
+        result = await self.db.execute(
+            select(model)
+            .options(*options)
+            .where(model.id.in_(ids), model.status == ContentStatus.ACTIVE)
+        )
+        rows = {row.id: row for row in result.scalars().unique().all()}
+        return [rows[doc_id] for doc_id in ids if doc_id in rows], total
+
     async def search_posts(
-        self, query: str, page: int = 1, page_size: int = 20
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> Tuple[List[Post], int]:
-        """Search posts by title and body"""
-        search_filter = or_(Post.title.ilike(f"%{query}%"), Post.body.ilike(f"%{query}%"))
+        """Search posts by title and body
+
+        With the embedded engine, BM25-ranked hits from the search index.
+        Otherwise on PostgreSQL matches the full-text index and orders by
+        relevance, with title matches ranked above body matches; elsewhere
+        falls back to a substring match ordered by date.
+        """
+        options = (selectinload(Post.author), selectinload(Post.channel), selectinload(Post.tags))
+        if search_index.is_enabled():
+            return await self._search_index(
+                Post, search_index.POSTS, query, page, page_size, options
+            )
+
+        if fulltext.is_supported(self.db):
+            search_filter = fulltext.matches(Post, query)
+            ordering = (fulltext.rank(Post, query).desc(), Post.created_at.desc(), Post.id.desc())
+        else:
+            search_filter = or_(Post.title.ilike(f"%{query}%"), Post.body.ilike(f"%{query}%"))
+            ordering = (Post.created_at.desc(),)
 
         stmt = (
-            select(Post)
-            .options(selectinload(Post.author), selectinload(Post.channel), selectinload(Post.tags))
-            .where(search_filter, Post.status == ContentStatus.ACTIVE)
+            select(Post).options(*options).where(search_filter, Post.status == ContentStatus.ACTIVE)
         )
 
         # Get total count
@@ -33,53 +79,93 @@ class SearchService:
             .select_from(Post)
             .where(search_filter, Post.status == ContentStatus.ACTIVE)
         )
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar()
+        total = await count_rows(self.db, count_stmt, count_strategy, scope="posts")
 
-        # Sort by relevance (title matches first) then by created_at
-        stmt = stmt.order_by(Post.created_at.desc())
+        stmt = stmt.order_by(*ordering)
 
         # Pagination
         offset = (page - 1) * page_size
-        stmt = stmt.offset(offset).limit(page_size)
+        stmt = stmt.offset(offset).limit(page_limit(page_size, count_strategy))
 
         result = await self.db.execute(stmt)
         posts = result.scalars().unique().all()
 
-        return list(posts), total
+        return finish_page(posts, total, page, page_size)
 
     async def search_users(
-        self, query: str, page: int = 1, page_size: int = 20
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> Tuple[List[User], int]:
-        """Search users by username and display name"""
+        """Search users by username and display name
+
+        On PostgreSQL the substring match is served by trigram indexes and
+        results are ranked by name similarity, then points; elsewhere by
+        points alone.
+        """
         search_filter = or_(
             User.username.ilike(f"%{query}%"), User.display_name.ilike(f"%{query}%")
         )
+        if fulltext.is_supported(self.db):
+            ordering = (
+                fulltext.similarity(query, User.username, User.display_name).desc(),
+                User.points.desc(),
+                User.id,
+            )
+        else:
+            ordering = (User.points.desc(),)
 
         stmt = select(User).where(search_filter, User.is_active)
 
         # Get total count
         count_stmt = select(func.count()).select_from(User).where(search_filter, User.is_active)
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar()
+        total = await count_rows(self.db, count_stmt, count_strategy, scope="users")
 
-        # Sort by points (most popular first)
-        stmt = stmt.order_by(User.points.desc())
+        stmt = stmt.order_by(*ordering)
 
         # Pagination
         offset = (page - 1) * page_size
-        stmt = stmt.offset(offset).limit(page_size)
+        stmt = stmt.offset(offset).limit(page_limit(page_size, count_strategy))
 
         result = await self.db.execute(stmt)
         users = result.scalars().all()
 
-        return list(users), total
+        return finish_page(users, total, page, page_size)
 
     async def search_comments(
-        self, query: str, page: int = 1, page_size: int = 20
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 20,
+        count_strategy: Optional[CountStrategy] = None,
     ) -> Tuple[List[Comment], int]:
-        """Search comments by body"""
-        search_filter = Comment.body.ilike(f"%{query}%")
+        """Search comments by body
+
+        Ranked by relevance with the embedded engine or on PostgreSQL, like
+        ``search_posts``.
+        """
+        if search_index.is_enabled():
+            return await self._search_index(
+                Comment,
+                search_index.COMMENTS,
+                query,
+                page,
+                page_size,
+                (selectinload(Comment.author),),
+            )
+
+        if fulltext.is_supported(self.db):
+            search_filter = fulltext.matches(Comment, query)
+            ordering = (
+                fulltext.rank(Comment, query).desc(),
+                Comment.created_at.desc(),
+                Comment.id.desc(),
+            )
+        else:
+            search_filter = Comment.body.ilike(f"%{query}%")
+            ordering = (Comment.created_at.desc(),)
 
         stmt = (
             select(Comment)
@@ -93,17 +179,97 @@ class SearchService:
             .select_from(Comment)
             .where(search_filter, Comment.status == ContentStatus.ACTIVE)
         )
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar()
+        total = await count_rows(self.db, count_stmt, count_strategy, scope="comments")
 
-        # Sort by created_at desc
-        stmt = stmt.order_by(Comment.created_at.desc())
+        stmt = stmt.order_by(*ordering)
 
         # Pagination
         offset = (page - 1) * page_size
-        stmt = stmt.offset(offset).limit(page_size)
+        stmt = stmt.offset(offset).limit(page_limit(page_size, count_strategy))
 
         result = await self.db.execute(stmt)
         comments = result.scalars().all()
 
-        return list(comments), total
+        return finish_page(comments, total, page, page_size)
+
+    async def suggest(self, query: str, limit: int) -> List[dict]:
+        """Typeahead completions of post titles, tag and channel names and usernames
+
+        Served from the Redis prefix index; until it is built, each table's
+        most popular labels starting with the query (or with a word starting
+        with it) are merged by popularity.
+        """
+        suggestions = await suggest.lookup(query, limit)
+        if suggestions is not None:
+            return suggestions
+
+        query = suggest.normalize(query)
+        if not query:
+            return []
+
+        def starts(column):
+            return or_(column.ilike(f"{query}%"), column.ilike(f"% {query}%"))
+
+        sources = (
+            (Post, starts(Post.title), Post.like_count, suggest.post_entry),
+            (Tag, starts(Tag.name), Tag.post_count, suggest.tag_entry),
+            (Channel, starts(Channel.name), Channel.post_count, suggest.channel_entry),
+            (User, starts(User.username), User.points, suggest.user_entry),
+        )
+        entries = []
+        for model, search_filter, popularity, build in sources:
+            stmt = select(model).where(search_filter)
+            if model is Post:
+                stmt = stmt.where(Post.status == ContentStatus.ACTIVE)
+            elif model is User:
+                stmt = stmt.where(User.is_active, ~User.is_banned)
+            result = await self.db.execute(stmt.order_by(popularity.desc(), model.id).limit(limit))
+            entries.extend(build(row) for row in result.scalars().all())
+
+        return suggest.rank_entries(entries, limit)
+
+
+async def unified_search(
+    session_factory: async_sessionmaker,
+    query: str,
+    sources: Sequence[str],
+    limit: int,
+    deadline_seconds: float,
+) -> Tuple[Dict[str, list], List[str]]:
+    """Search several sources at once, returning what finishes in time
+
+    Each source runs concurrently on its own session without a count.
+    Sources still running at the deadline are cancelled, and sources
+    that fail are logged; both are left out of the results.
+
+    Returns:
+        (results by source, sources left out)
+    """
+
+    async def run(source: str) -> list:
+        async with session_factory() as db:
+            search = getattr(SearchService(db), UNIFIED_SOURCES[source])
+            rows, _ = await search(query, 1, limit, count_strategy=CountStrategy.NONE)
+            return rows[:limit]
+
+    tasks = {source: asyncio.create_task(run(source)) for source in sources}
+    if not tasks:
+        return {}, []
+    done, pending = await asyncio.wait(tasks.values(), timeout=deadline_seconds)
+
+    # Don't wait for cancelled queries to unwind
+    for task in pending:
+        task.cancel()
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    results: Dict[str, list] = {}
+    missing: List[str] = []
+    for source, task in tasks.items():
+        if task not in done:
+            missing.append(source)
+        elif task.exception() is not None:
+            logger.warning("Unified search source %s failed", source, exc_info=task.exception())
+            missing.append(source)
+        else:
+            results[source] = task.result()
+    return results, missing
@@ -8,6 +8,7 @@ import re
 
 from src.models.organization import Tag
 from src.schemas.tag import TagCreate, TagUpdate
+from src.core import suggest
 from src.core.exceptions import TagNotFoundError, ValidationError
 
 
@@ -45,6 +46,7 @@ class TagService:
         self.db.add(tag)
         await self.db.commit()
         await self.db.refresh(tag)
+        await suggest.sync_tag(tag)
         return tag
 
     async def get_tag_by_id(self, tag_id: int) -> Tag:
@@ -77,6 +79,7 @@ class TagService:
 
         await self.db.commit()
         await self.db.refresh(tag)
+        await suggest.sync_tag(tag)
         return tag
 
     async def delete_tag(self, tag_id: int) -> None:
@@ -84,6 +87,7 @@ class TagService:
         tag = await self.get_tag_by_id(tag_id)
         await self.db.delete(tag)
         await self.db.commit()
+        await suggest.remove_item(suggest.TAG, tag_id)
 
     async def list_tags(self) -> List[Tag]:
         """List all tags (sorted by post_count desc)"""
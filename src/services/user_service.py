@@ -14,6 +14,10 @@ from src.schemas.user import (
     UserEmailChange,
     UserStatsResponse,
 )
+from src.core import fulltext, suggest
+from src.core.leaderboard import remove_user
+from src.core.principal import invalidate_user_principal
+from src.core.counting import invalidate_counts
 from src.core.security import hash_password, verify_password
 from src.core.exceptions import UserAlreadyExistsError, UserNotFoundError, InvalidCredentialsError
 
@@ -60,6 +64,7 @@ class UserService:
         self.db.add(new_user)
         await self.db.commit()
         await self.db.refresh(new_user)
+        await invalidate_counts("users")
 
         return new_user
 
@@ -120,6 +125,8 @@ class UserService:
 
         await self.db.commit()
         await self.db.refresh(user)
+        await invalidate_user_principal(user_id)
+        await invalidate_counts("users")
 
         return user
 
@@ -170,6 +177,10 @@ class UserService:
         user.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await invalidate_user_principal(user_id)
+        await invalidate_counts("users")
+        await remove_user(user_id)
+        await suggest.remove_item(suggest.USER, user_id)
 
     async def list_users(
         self,
@@ -179,8 +190,12 @@ class UserService:
         level: Optional[UserLevelEnum] = None,
         is_active: Optional[bool] = None,
     ) -> tuple[list[User], int]:
-        """List users with pagination and filters"""
+        """List users with pagination and filters
+
+        Newest first; with ``search`` on PostgreSQL, closest name match first.
+        """
         query = select(User)
+        ordering = (User.created_at.desc(),)
 
         # Apply filters
         if search:
@@ -188,6 +203,11 @@ class UserService:
                 User.username.ilike(f"%{search}%"), User.display_name.ilike(f"%{search}%")
             )
             query = query.where(search_filter)
+            if fulltext.is_supported(self.db):
+                ordering = (
+                    fulltext.similarity(search, User.username, User.display_name).desc(),
+                    User.created_at.desc(),
+                )
 
         if level:
             query = query.where(User.level == level)
@@ -210,7 +230,7 @@ class UserService:
         # Apply pagination
         offset = (page - 1) * page_size
         query = query.offset(offset).limit(page_size)
-        query = query.order_by(User.created_at.desc())
+        query = query.order_by(*ordering)
 
         # Execute query
         result = await self.db.execute(query)
@@ -14,6 +14,10 @@ from faker import Faker
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
+from src.core.counting import count_cache
+from src.core.economy import economy_cache
+from src.core.levels import levels_cache
+from src.core.search_cache import search_cache
 from src.core.database import Base, get_db
 from src.core.security import hash_password, create_access_token
 from src.main import app
@@ -56,6 +60,13 @@ async def test_engine():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # Cached list totals, economy config and level thresholds belong to the previous
+    # test's database
+    count_cache.clear()
+    economy_cache.clear()
+    levels_cache.clear()
+    search_cache.clear()
+
     yield engine
 
     async with engine.begin() as conn:
@@ -0,0 +1,146 @@
+"""Unit tests for in-process caching and session principal resolution"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.principal import (
+    Principal,
+    get_principal,
+    get_session_principal,
+    invalidate_user_principal,
+    session_principal_cache,
+)
+from src.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def clear_session_cache():
+    """Isolate tests from each other's cached principals"""
+    session_principal_cache.clear()
+    yield
+    session_principal_cache.clear()
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test suite for TTLCache"""
+
+    def test_get_and_set(self):
+        """Test values round-trip until they expire"""
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entries_are_dropped(self):
+        """Test an entry with zero TTL is never returned"""
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("a", 1, ttl_seconds=0)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_delete_where(self):
+        """Test predicate-based eviction"""
+        cache = TTLCache(maxsize=10, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 1)
+
+        assert cache.delete_where(lambda _, value: value == 1) == 2
+        assert cache.get("b") == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSessionPrincipal:
+    """Test suite for cached session -> principal resolution"""
+
+    async def test_cache_hit_skips_redis_and_db(self, test_db: AsyncSession, test_user: User):
+        """Test a second lookup is served from the in-process cache"""
+        with patch("src.core.session.get_session", AsyncMock(return_value=test_user.id)) as get:
+            first = await get_session_principal("sid", test_db)
+            second = await get_session_principal("sid", test_db)
+
+        assert isinstance(first, Principal)
+        assert first == second
+        assert first.username == test_user.username
+        get.assert_awaited_once()
+
+    async def test_banned_user_not_cached(self, test_db: AsyncSession, test_user: User):
+        """Test banned users do not resolve to a principal"""
+        test_user.is_banned = True
+        await test_db.commit()
+
+        with patch("src.core.session.get_session", AsyncMock(return_value=test_user.id)):
+            assert await get_session_principal("sid", test_db) is None
+
+        assert session_principal_cache.get("sid") is None
+
+    async def test_user_invalidation_evicts_sessions(self, test_db: AsyncSession, test_user: User):
+        """Test invalidating a user drops all of their cached sessions"""
+        with patch("src.core.session.get_session", AsyncMock(return_value=test_user.id)):
+            await get_session_principal("sid-1", test_db)
+            await get_session_principal("sid-2", test_db)
+
+        with patch("src.core.session.redis_client", None):
+            await invalidate_user_principal(test_user.id)
+
+        assert len(session_principal_cache) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPrincipalSnapshot:
+    """Test suite for the Redis principal snapshot"""
+
+    async def test_json_round_trip(self, test_user: User):
+        """Test a snapshot survives serialization unchanged"""
+        principal = Principal.from_user(test_user)
+
+        assert Principal.from_json(principal.to_json()) == principal
+
+    async def test_cache_hit_skips_db(self, test_user: User):
+        """Test a cached snapshot is returned without touching the database"""
+        principal = Principal.from_user(test_user)
+        redis = AsyncMock()
+        redis.get.return_value = principal.to_json()
+        db = AsyncMock()
+
+        with patch("src.core.session.redis_client", redis):
+            assert await get_principal(test_user.id, db) == principal
+
+        db.get.assert_not_awaited()
+
+    async def test_cache_miss_loads_and_stores(self, test_db: AsyncSession, test_user: User):
+        """Test a miss falls back to the database and populates Redis"""
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        with patch("src.core.session.redis_client", redis):
+            principal = await get_principal(test_user.id, test_db)
+
+        assert principal.id == test_user.id
+        redis.set.assert_awaited_once()
+        assert redis.set.await_args.args[0] == f"principal:{test_user.id}"
+
+    async def test_unknown_user(self, test_db: AsyncSession):
+        """Test a missing user resolves to None"""
+        with patch("src.core.session.redis_client", None):
+            assert await get_principal(999999, test_db) is None
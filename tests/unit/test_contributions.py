@@ -0,0 +1,107 @@
+"""Unit tests for the contribution leaderboard"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.contributions import get_top_contributors, refresh_contribution_stats
+from src.models.content import Comment, ContentStatus, Post, UserContributionStats
+from src.models.user import User
+from src.schemas.comment import CommentCreate, CommentModerationUpdate
+from src.schemas.post import PostCreate
+from src.services.comment_service import CommentService
+from src.services.post_service import PostService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+async def _stats(db: AsyncSession, user_id: int) -> tuple:
+    row = (
+        await db.execute(
+            select(
+                UserContributionStats.post_count,
+                UserContributionStats.comment_count,
+                UserContributionStats.contribution_score,
+            )
+            .where(UserContributionStats.user_id == user_id)
+            .execution_options(populate_existing=True)
+        )
+    ).one_or_none()
+    return tuple(row) if row else None
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestContributionStats:
+    """Test suite for incrementally maintained contribution stats"""
+
+    async def test_writes_update_stats(self, test_db: AsyncSession, test_user: User):
+        """Test creating, moderating and deleting content adjusts the author's stats"""
+        posts = PostService(test_db)
+        comments = CommentService(test_db)
+
+        post = await posts.create_post(
+            PostCreate(title="First post", body="Body of the first post"), test_user.id
+        )
+        comment = await comments.create_comment(
+            post.id, CommentCreate(body="A comment"), test_user.id
+        )
+        await comments.create_comment(post.id, CommentCreate(body="Another"), test_user.id)
+        assert await _stats(test_db, test_user.id) == (1, 2, 3)
+
+        # Hidden content still counts; deleted content does not, once
+        await comments.moderate_comment(
+            comment.id, CommentModerationUpdate(status=ContentStatus.HIDDEN)
+        )
+        assert await _stats(test_db, test_user.id) == (1, 2, 3)
+        await comments.delete_comment(comment.id, test_user.id)
+        await comments.delete_comment(comment.id, test_user.id)
+        await posts.delete_post(post.id, test_user.id)
+        assert await _stats(test_db, test_user.id) == (0, 1, 1)
+
+    async def test_refresh_recomputes_from_content(
+        self, test_db: AsyncSession, test_user: User, test_comment: Comment
+    ):
+        """Test the refresh corrects rows written outside the services"""
+        test_db.add(
+            UserContributionStats(
+                user_id=test_user.id, post_count=9, comment_count=9, contribution_score=18
+            )
+        )
+        await test_db.commit()
+
+        assert await refresh_contribution_stats(test_db) == 1
+        assert await _stats(test_db, test_user.id) == (1, 1, 2)
+
+        test_comment.status = ContentStatus.DELETED
+        await test_db.execute(update(Post).values(status=ContentStatus.DELETED))
+        await test_db.commit()
+        assert await refresh_contribution_stats(test_db) == 0
+        assert await _stats(test_db, test_user.id) == (0, 0, 0)
+
+    async def test_top_contributors(self, test_db: AsyncSession, multiple_users: list[User]):
+        """Test the leaderboard orders by score and skips inactive or banned users"""
+        for score, user in enumerate(multiple_users, start=1):
+            test_db.add(
+                UserContributionStats(
+                    user_id=user.id, post_count=score, comment_count=0, contribution_score=score
+                )
+            )
+        multiple_users[4].is_active = False
+        multiple_users[3].is_banned = True
+        await test_db.commit()
+
+        top = await get_top_contributors(test_db, limit=2)
+
+        assert [row["username"] for row in top] == [
+            multiple_users[2].username,
+            multiple_users[1].username,
+        ]
+        assert top[0]["contribution_score"] == 3
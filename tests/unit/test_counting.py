@@ -0,0 +1,73 @@
+"""Unit tests for list total count strategies"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.counting import CountStrategy, count_cache, count_rows, has_more
+from src.models.content import Post
+from src.models.user import User
+from src.schemas.post import PostCreate
+from src.services.post_service import PostService
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestCountStrategies:
+    """Test suite for count_rows and paginated totals"""
+
+    async def test_cached_count_reused_until_invalidated(
+        self, test_db: AsyncSession, test_user: User, multiple_posts: list[Post]
+    ):
+        """Test cached totals survive direct inserts but not service writes"""
+        service = PostService(test_db)
+        _, total = await service.list_posts(count_strategy=CountStrategy.CACHED)
+        assert total == len(multiple_posts)
+
+        # A row added behind the service's back is not seen until invalidation
+        test_db.add(Post(title="Hidden", body="x" * 10, body_html="x", user_id=test_user.id))
+        await test_db.commit()
+        _, total = await service.list_posts(count_strategy=CountStrategy.CACHED)
+        assert total == len(multiple_posts)
+
+        with patch("src.core.session.redis_client", None):
+            await service.create_post(
+                PostCreate(title="Visible post", body="Body of a visible post"), test_user.id
+            )
+        _, total = await service.list_posts(count_strategy=CountStrategy.CACHED)
+        assert total == len(multiple_posts) + 2
+
+    async def test_none_strategy_reports_has_more(
+        self, test_db: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test skipped totals still answer whether another page exists"""
+        service = PostService(test_db)
+
+        posts, total = await service.list_posts(
+            page=1, page_size=4, count_strategy=CountStrategy.NONE
+        )
+        assert len(posts) == 4
+        assert has_more(total, 1, 4)
+
+        posts, total = await service.list_posts(
+            page=3, page_size=4, count_strategy=CountStrategy.NONE
+        )
+        assert len(posts) == 2
+        assert not has_more(total, 3, 4)
+
+    async def test_estimate_falls_back_off_postgres(
+        self, test_db: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test estimates degrade to a real (cached) count on other databases"""
+        total = await count_rows(
+            test_db,
+            select(func.count()).select_from(Post),
+            CountStrategy.ESTIMATE,
+            scope="posts",
+            table="posts",
+        )
+
+        assert total == len(multiple_posts)
+        assert len(count_cache) == 1
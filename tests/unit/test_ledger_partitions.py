@@ -0,0 +1,116 @@
+"""Unit tests for ledger partitioning helpers and partition-aware history"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.ledger_partitions import (
+    add_months,
+    archive_cold_partitions,
+    cold_partitions,
+    ensure_partitions,
+    partition_month,
+    partition_name,
+)
+from src.models.points import ArchivedPointTotal, Transaction, TransactionType
+from src.models.user import User
+from src.services.point_service import PointService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.mark.unit
+class TestPartitionNames:
+    """Test suite for monthly partition arithmetic"""
+
+    def test_month_arithmetic_and_names(self):
+        """Test months roll over years and names round-trip"""
+        december = datetime(2025, 12, 1)
+
+        assert add_months(december, 1) == datetime(2026, 1, 1)
+        assert add_months(december, -12) == datetime(2024, 12, 1)
+        assert partition_name(december) == "transactions_y2025m12"
+        assert partition_month("transactions_y2025m12") == december
+        assert partition_month("transactions_default") is None
+
+    def test_cold_partitions(self):
+        """Test only whole months before the retention window are cold"""
+        names = [
+            "transactions_default",
+            "transactions_y2026m10",
+            "transactions_y2025m09",
+            "transactions_y2025m10",
+            "transactions_y2025m08",
+        ]
+
+        cold = cold_partitions(names, now=datetime(2026, 10, 16), keep_months=12)
+
+        assert cold == ["transactions_y2025m08", "transactions_y2025m09"]
+
+    @pytest.mark.asyncio
+    async def test_unpartitioned_database_is_left_alone(self, test_db: AsyncSession):
+        """Test maintenance is a no-op outside PostgreSQL"""
+        assert await ensure_partitions(test_db) == []
+        assert await archive_cold_partitions(test_db) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPartitionAwareHistory:
+    """Test suite for time-bounded transaction history"""
+
+    async def _add(self, db: AsyncSession, user: User, created_at: datetime, amount: int):
+        db.add(
+            Transaction(
+                user_id=user.id,
+                amount=amount,
+                transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                description="History",
+                balance_after=100,
+                created_at=created_at,
+            )
+        )
+
+    async def test_history_is_bounded_by_registration_and_range(
+        self, test_db: AsyncSession, test_user: User
+    ):
+        """Test rows before registration and outside since/until are excluded"""
+        registered = test_user.created_at
+        await self._add(test_db, test_user, registered - timedelta(days=1), 1)
+        await self._add(test_db, test_user, registered + timedelta(days=1), 2)
+        await self._add(test_db, test_user, registered + timedelta(days=40), 3)
+        await test_db.commit()
+        service = PointService(test_db)
+
+        transactions, total = await service.get_user_transactions(test_user.id)
+        assert [t.amount for t in transactions] == [3, 2]
+        assert total == 2
+
+        transactions, total = await service.get_user_transactions(
+            test_user.id, until=registered + timedelta(days=30)
+        )
+        assert [t.amount for t in transactions] == [2]
+        assert total == 1
+
+    async def test_reconcile_counts_archived_totals(self, test_db: AsyncSession, test_user: User):
+        """Test archived months still count towards lifetime totals"""
+        user_id = test_user.id
+        await self._add(test_db, test_user, datetime.utcnow(), -10)
+        test_db.add(
+            ArchivedPointTotal(user_id=user_id, total_earned=150, total_spent=40, tx_count=6)
+        )
+        await test_db.commit()
+        service = PointService(test_db)
+
+        assert await service.reconcile_point_totals() == 1
+
+        summary = await service.get_user_points_summary(user_id)
+        assert (summary["total_earned"], summary["total_spent"]) == (150, 50)
+        assert summary["transactions_count"] == 7
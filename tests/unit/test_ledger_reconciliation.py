@@ -0,0 +1,120 @@
+"""Unit tests for balance reconciliation against the ledger"""
+
+import csv
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.ledger_reconciliation import (
+    RECONCILIATION_REFERENCE_TYPE,
+    BalanceMismatch,
+    find_balance_mismatches,
+    repair_balance_mismatches,
+    write_mismatch_report,
+)
+from src.models.points import ArchivedPointTotal, Transaction, TransactionType
+from src.models.user import User
+from src.services.point_service import PointService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLedgerReconciliation:
+    """Test suite for ledger reconciliation"""
+
+    async def test_finds_balances_without_ledger(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test fixture balances with no ledger rows are reported"""
+        ids = [user.id for user in multiple_users]
+
+        mismatches = await find_balance_mismatches(test_db, chunk_size=2)
+
+        assert mismatches == [
+            BalanceMismatch(user_id, 100 * (i + 1), 0) for i, user_id in enumerate(ids)
+        ]
+
+    async def test_ledger_writes_and_archives_balance(self, test_db: AsyncSession, test_user: User):
+        """Test live and archived ledger rows together match the balance"""
+        user_id = test_user.id
+        service = PointService(test_db)
+        # 100 fixture points: 60 archived, 40 still in the ledger
+        test_db.add(
+            ArchivedPointTotal(user_id=user_id, total_earned=70, total_spent=10, tx_count=3)
+        )
+        test_db.add(
+            Transaction(
+                user_id=user_id,
+                amount=40,
+                transaction_type=TransactionType.REGISTRATION_BONUS,
+                description="Welcome",
+                balance_after=100,
+            )
+        )
+        await test_db.commit()
+
+        assert await find_balance_mismatches(test_db, chunk_size=1) == []
+
+        await service.create_transaction(user_id, 5, TransactionType.REFUND, "Refund")
+        await test_db.execute(Transaction.__table__.delete().where(Transaction.amount == 5))
+        await test_db.commit()
+
+        assert await find_balance_mismatches(test_db) == [BalanceMismatch(user_id, 105, 100)]
+
+    async def test_repair_writes_corrective_entries(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test repair makes every ledger agree without moving balances"""
+        ids = [user.id for user in multiple_users]
+        mismatches = await find_balance_mismatches(test_db)
+
+        repaired = await repair_balance_mismatches(
+            test_db, [mismatch.user_id for mismatch in mismatches], batch_size=2
+        )
+
+        assert len(repaired) == len(ids)
+        assert await find_balance_mismatches(test_db) == []
+
+        result = await test_db.execute(
+            select(Transaction.amount, Transaction.reference_type).order_by(Transaction.user_id)
+        )
+        assert result.all() == [
+            (100 * (i + 1), RECONCILIATION_REFERENCE_TYPE) for i in range(len(ids))
+        ]
+        result = await test_db.execute(
+            select(User.points, User.total_earned, User.tx_count).where(User.id == ids[0])
+        )
+        assert result.one() == (100, 100, 1)
+
+        # Nothing left to repair
+        assert await repair_balance_mismatches(test_db, ids) == []
+
+
+@pytest.mark.unit
+class TestMismatchReport:
+    """Test suite for the mismatch report"""
+
+    def test_report_orders_largest_first(self, tmp_path):
+        """Test the CSV report lists the largest discrepancies first"""
+        path = write_mismatch_report(
+            [BalanceMismatch(1, 10, 9), BalanceMismatch(2, 0, 50), BalanceMismatch(3, 8, 0)],
+            tmp_path / "reports" / "mismatches.csv",
+        )
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows == [
+            ["user_id", "points", "ledger_balance", "difference"],
+            ["2", "0", "50", "-50"],
+            ["3", "8", "0", "8"],
+            ["1", "10", "9", "1"],
+        ]
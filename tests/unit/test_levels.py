@@ -0,0 +1,106 @@
+"""Unit tests for user level promotion"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.levels import default_thresholds, level_for_points, recompute_levels
+from src.models.points import TransactionType
+from src.models.user import Level, User, UserLevelEnum
+from src.services.point_service import PointService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+async def _level(db: AsyncSession, user_id: int) -> UserLevelEnum:
+    return await db.scalar(
+        select(User.level).where(User.id == user_id).execution_options(populate_existing=True)
+    )
+
+
+@pytest.mark.unit
+class TestLevels:
+    """Test suite for threshold-driven levels"""
+
+    def test_level_for_points(self):
+        """Test the highest reached threshold wins"""
+        thresholds = default_thresholds()
+
+        assert level_for_points(0, thresholds) == UserLevelEnum.NEW_USER
+        assert level_for_points(99, thresholds) == UserLevelEnum.NEW_USER
+        assert level_for_points(100, thresholds) == UserLevelEnum.ACTIVE_USER
+        assert level_for_points(2000, thresholds) == UserLevelEnum.MODERATOR
+        assert level_for_points(10**6, thresholds) == UserLevelEnum.SENIOR_MODERATOR
+
+    @pytest.mark.asyncio
+    async def test_ledger_write_promotes_and_demotes(self, test_db: AsyncSession, test_user: User):
+        """Test crossing a threshold changes the level in the same update"""
+        user_id = test_user.id
+        service = PointService(test_db)
+        invalidate = AsyncMock()
+
+        with patch("src.services.point_service.invalidate_user_principal", invalidate):
+            await service.create_transaction(
+                user_id, 400, TransactionType.ADMIN_ADJUSTMENT, "Promotion"
+            )
+            assert await _level(test_db, user_id) == UserLevelEnum.TRUSTED_USER
+
+            await service.create_transaction(user_id, -1, TransactionType.LIKE_CONTENT, "Like")
+            assert await _level(test_db, user_id) == UserLevelEnum.ACTIVE_USER
+
+            await service.create_transaction(user_id, 1, TransactionType.REFUND, "Refund")
+            await service.create_transaction(user_id, 1, TransactionType.REFUND, "Refund")
+
+        # Only the three threshold crossings drop the cached principal
+        assert invalidate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_levels_table_overrides_config(self, test_db: AsyncSession, test_user: User):
+        """Test thresholds in the levels table take precedence"""
+        user_id = test_user.id
+        test_db.add(
+            Level(
+                name=UserLevelEnum.TRUSTED_USER,
+                min_points=120,
+                display_name="Trusted",
+                color="#00aa00",
+            )
+        )
+        await test_db.commit()
+
+        await PointService(test_db).create_transaction(
+            user_id, 20, TransactionType.ADMIN_ADJUSTMENT, "Bonus"
+        )
+
+        assert await _level(test_db, user_id) == UserLevelEnum.TRUSTED_USER
+
+    @pytest.mark.asyncio
+    async def test_recompute_levels_in_chunks(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test the backfill fixes every wrong level across chunks"""
+        ids = [user.id for user in multiple_users]
+        await test_db.execute(update(User).values(level=UserLevelEnum.SENIOR_MODERATOR))
+        await test_db.execute(
+            update(User).where(User.id == ids[0]).values(level=UserLevelEnum.ACTIVE_USER)
+        )
+        await test_db.commit()
+
+        changed = await recompute_levels(test_db, batch_size=2)
+
+        # Points are 100..500: the first user's level was already right
+        assert sorted(changed) == ids[1:]
+        assert [await _level(test_db, user_id) for user_id in ids] == [
+            UserLevelEnum.ACTIVE_USER,
+            UserLevelEnum.ACTIVE_USER,
+            UserLevelEnum.ACTIVE_USER,
+            UserLevelEnum.ACTIVE_USER,
+            UserLevelEnum.TRUSTED_USER,
+        ]
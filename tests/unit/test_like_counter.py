@@ -0,0 +1,120 @@
+"""Unit tests for sharded like counters"""
+
+from collections import defaultdict
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import like_counter
+from src.core.config import config
+from src.models.content import Comment, LikeCounterShard, Post
+from src.models.points import PointEconomy
+from src.models.user import User
+from src.services.comment_service import CommentService
+from src.services.like_service import LikeService
+from src.services.post_service import PostService
+
+
+@pytest.fixture(autouse=True)
+def local_rates():
+    """Track like rates in-process, starting each test with an empty window"""
+    like_counter._local_window.update(window=None, counts=defaultdict(int))
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.fixture
+def always_hot():
+    """Treat every post and comment as hot"""
+    with patch.object(config.counters, "like_shard_rate_threshold", 0):
+        yield
+
+
+async def _stored_like_count(db: AsyncSession, model, target_id: int) -> int:
+    return await db.scalar(
+        select(model.like_count)
+        .where(model.id == target_id)
+        .execution_options(populate_existing=True)
+    )
+
+
+@pytest.mark.unit
+class TestLikeCounterShards:
+    """Test suite for sharded like counting"""
+
+    @pytest.mark.asyncio
+    async def test_rate_switches_to_shards_above_threshold(self):
+        """Test likes go to shards only once the window's threshold is crossed"""
+        with patch.object(config.counters, "like_shard_rate_threshold", 2):
+            hot = [await like_counter.record_like_rate("post", 1) for _ in range(3)]
+            other = await like_counter.record_like_rate("post", 2)
+
+        assert hot == [False, False, True]
+        assert other is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_never_shards(self, always_hot):
+        """Test the feature flag keeps every like on the row"""
+        with patch.object(config.counters, "like_shards_enabled", False):
+            assert await like_counter.record_like_rate("post", 1) is False
+
+    @pytest.mark.asyncio
+    async def test_hot_post_like_is_summed_on_read_and_folded(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+        always_hot,
+    ):
+        """Test a sharded like leaves the row alone until folded"""
+        service = LikeService(test_db)
+        for liker in multiple_users[:3]:
+            await service.like_post(test_post.id, liker.id)
+
+        assert await _stored_like_count(test_db, Post, test_post.id) == 0
+        post = await PostService(test_db).get_post_by_id(test_post.id, increment_view=True)
+        assert post.like_count == 3
+
+        assert await like_counter.fold_like_shards(test_db) == 1
+        assert await _stored_like_count(test_db, Post, test_post.id) == 3
+        assert await test_db.scalar(select(func.count()).select_from(LikeCounterShard)) == 0
+
+    @pytest.mark.asyncio
+    async def test_unlike_before_fold_cancels_out(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+        always_hot,
+    ):
+        """Test unliking a like still held in a slot nets to zero"""
+        service = LikeService(test_db)
+        liker = multiple_users[0]
+        await service.like_post(test_post.id, liker.id)
+        await service.unlike_post(test_post.id, liker.id)
+
+        assert await like_counter.pending_like_counts(test_db, "post", [test_post.id]) == {}
+        await like_counter.fold_like_shards(test_db)
+        assert await _stored_like_count(test_db, Post, test_post.id) == 0
+
+    @pytest.mark.asyncio
+    async def test_hot_comment_like_is_summed_on_list(
+        self,
+        test_db: AsyncSession,
+        test_comment: Comment,
+        multiple_users: list[User],
+        always_hot,
+    ):
+        """Test comment listings include likes held in slots"""
+        await LikeService(test_db).like_comment(test_comment.id, multiple_users[0].id)
+
+        comments, _ = await CommentService(test_db).list_comments(test_comment.post_id)
+        assert comments[0].like_count == 1
+        assert await _stored_like_count(test_db, Comment, test_comment.id) == 0
+
+        await like_counter.fold_like_shards(test_db)
+        assert await _stored_like_count(test_db, Comment, test_comment.id) == 1
@@ -0,0 +1,176 @@
+"""Unit tests for LikeService"""
+
+from collections import defaultdict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import like_counter
+from src.core.exceptions import DuplicateLikeError, SelfLikeError, ValidationError
+from src.models.content import Comment, Like, Post
+from src.models.points import PointEconomy, Transaction, TransactionType
+from src.models.user import User
+from src.services.like_service import LikeService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches, starting with no hot posts"""
+    like_counter._local_window.update(window=None, counts=defaultdict(int))
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+async def _count(db: AsyncSession, stmt) -> int:
+    return await db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLikePost:
+    """Test suite for the atomic like path"""
+
+    async def test_like_post_writes_like_count_and_ledger(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        test_user: User,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+    ):
+        """Test a like commits the row, the counter and both ledger entries"""
+        liker = multiple_users[0]
+        like = await LikeService(test_db).like_post(test_post.id, liker.id)
+
+        assert like.user.id == liker.id
+        await test_db.refresh(test_post)
+        await test_db.refresh(liker)
+        await test_db.refresh(test_user)
+        assert test_post.like_count == 1
+        assert liker.points == 99
+        assert test_user.points == 103
+
+        types = (await test_db.scalars(select(Transaction.transaction_type))).all()
+        assert sorted(types) == sorted([TransactionType.LIKE_CONTENT, TransactionType.RECEIVE_LIKE])
+
+    async def test_duplicate_like_changes_nothing(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+    ):
+        """Test a repeated like is rejected without charging points again"""
+        service = LikeService(test_db)
+        liker = multiple_users[0]
+        await service.like_post(test_post.id, liker.id)
+
+        with pytest.raises(DuplicateLikeError):
+            await service.like_post(test_post.id, liker.id)
+
+        await test_db.refresh(test_post)
+        assert test_post.like_count == 1
+        assert await _count(test_db, select(Transaction)) == 2
+
+    async def test_insufficient_balance_rolls_back(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+    ):
+        """Test a failed ledger write leaves no like and no counter change"""
+        liker = multiple_users[0]
+        liker.points = 0
+        await test_db.commit()
+
+        with pytest.raises(ValidationError):
+            await LikeService(test_db).like_post(test_post.id, liker.id)
+
+        await test_db.refresh(test_post)
+        assert test_post.like_count == 0
+        assert await _count(test_db, select(Like)) == 0
+
+    async def test_cannot_like_own_post(
+        self, test_db: AsyncSession, test_post: Post, test_user: User, test_economy: PointEconomy
+    ):
+        """Test self-likes are rejected"""
+        with pytest.raises(SelfLikeError):
+            await LikeService(test_db).like_post(test_post.id, test_user.id)
+
+    async def test_unlike_post(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+    ):
+        """Test unliking removes the row and decrements the counter"""
+        service = LikeService(test_db)
+        liker = multiple_users[0]
+        await service.like_post(test_post.id, liker.id)
+
+        await service.unlike_post(test_post.id, liker.id)
+
+        await test_db.refresh(test_post)
+        assert test_post.like_count == 0
+        with pytest.raises(ValidationError):
+            await service.unlike_post(test_post.id, liker.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLikeState:
+    """Test suite for batched like state lookups"""
+
+    async def test_resolves_posts_and_comments_in_one_call(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        test_comment: Comment,
+        multiple_users: list[User],
+        test_economy: PointEconomy,
+    ):
+        """Test liked and unliked IDs are split correctly"""
+        service = LikeService(test_db)
+        liker = multiple_users[0]
+        await service.like_post(test_post.id, liker.id)
+        await service.like_comment(test_comment.id, liker.id)
+
+        liked_posts, liked_comments = await service.get_like_state(
+            liker.id, post_ids=[test_post.id, 999], comment_ids=[test_comment.id, 998]
+        )
+
+        assert liked_posts == {test_post.id}
+        assert liked_comments == {test_comment.id}
+        assert await service.get_like_state(multiple_users[1].id, [test_post.id]) == (set(), set())
+
+    async def test_cached_state_skips_database(self, test_db: AsyncSession):
+        """Test fields cached in Redis are answered without a query"""
+        redis = MagicMock()
+        redis.hmget = AsyncMock(return_value=["1", "0"])
+
+        with patch("src.core.session.redis_client", redis):
+            state = await LikeService(test_db).get_like_state(7, post_ids=[1], comment_ids=[2])
+
+        assert state == ({1}, set())
+        redis.hmget.assert_awaited_once_with("like_state:7", ["p:1", "c:2"])
+        redis.pipeline.assert_not_called()
+
+    async def test_lookup_fills_cache_without_overwriting(
+        self, test_db: AsyncSession, test_post: Post, test_user: User
+    ):
+        """Test misses are cached with HSETNX so concurrent likes win"""
+        redis = MagicMock()
+        redis.hmget = AsyncMock(return_value=[None])
+        pipe = redis.pipeline.return_value
+        pipe.execute = AsyncMock()
+
+        with patch("src.core.session.redis_client", redis):
+            state = await LikeService(test_db).get_like_state(test_user.id, [test_post.id])
+
+        assert state == (set(), set())
+        pipe.hsetnx.assert_called_once_with(f"like_state:{test_user.id}", f"p:{test_post.id}", "0")
+        pipe.hset.assert_not_called()
@@ -10,6 +10,7 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.exceptions import OAuthError, OAuthProviderError
+from src.core.levels import default_thresholds
 from src.models.user import OAuthAccount, User
 from src.services.oauth_service import OAuth2Service
 
@@ -69,7 +70,12 @@ def mock_oauth_config():
         # Mock point economy
         mock_config.point_economy.registration_bonus = 100
 
-        yield mock_config
+        # Level thresholds come from config rather than the levels table
+        with patch(
+            "src.services.oauth_service.get_level_thresholds",
+            AsyncMock(return_value=default_thresholds()),
+        ):
+            yield mock_config
 
 
 class TestProviderConfiguration:
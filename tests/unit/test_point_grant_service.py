@@ -0,0 +1,146 @@
+"""Unit tests for bulk point grants"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import GrantBatchNotFoundError
+from src.models.points import Transaction
+from src.models.user import User
+from src.services.point_grant_service import PointGrantService, parse_grant_rows
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+async def _lines(*lines: str):
+    for line in lines:
+        yield line
+
+
+async def _points(db: AsyncSession, user_id: int) -> int:
+    return await db.scalar(
+        select(User.points).where(User.id == user_id).execution_options(populate_existing=True)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPointGrants:
+    """Test suite for chunked, idempotent bulk grants"""
+
+    async def test_parses_csv_and_jsonl(self):
+        """Test both formats, the optional header and malformed rows"""
+        csv_rows = [
+            row
+            async for row in parse_grant_rows(
+                _lines("user_id,amount,reason", "1,50,Event reward", "", "x,1", "2,0"), "csv"
+            )
+        ]
+        jsonl_rows = [
+            row
+            async for row in parse_grant_rows(
+                _lines('{"user_id": 3, "amount": -5}', "{oops"), "jsonl"
+            )
+        ]
+
+        assert [(r.user_id, r.amount, r.reason, r.error) for r in csv_rows] == [
+            (1, 50, "Event reward", None),
+            (None, None, None, "Malformed row"),
+            (2, 0, None, "Amount must be non-zero"),
+        ]
+        assert [(r.user_id, r.amount, r.error) for r in jsonl_rows] == [
+            (3, -5, None),
+            (None, None, "Malformed row"),
+        ]
+
+    async def test_applies_chunks_and_rejects_bad_rows(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test balances, ledger rows and rejections across several chunks"""
+        a, b, c = (user.id for user in multiple_users[:3])
+        rows = parse_grant_rows(
+            _lines(f"{a},50,Reward", f"{b},-500,Penalty", f"{a},25,Bonus", "999,10", f"{c},1"),
+            "csv",
+        )
+
+        batch, rejections = await PointGrantService(test_db).apply_grants(
+            "event-1", rows, chunk_size=2
+        )
+
+        assert batch.status == "completed"
+        assert (batch.rows_processed, batch.applied_count, batch.rejected_count) == (5, 3, 2)
+        assert batch.total_amount == 76
+        assert [(r.user_id, r.error) for r in rejections] == [
+            (b, "Insufficient balance"),
+            (999, "User not found"),
+        ]
+        assert await _points(test_db, a) == 175
+        assert await _points(test_db, b) == 200
+
+        balances = (
+            await test_db.scalars(
+                select(Transaction.balance_after)
+                .where(Transaction.user_id == a)
+                .order_by(Transaction.id)
+            )
+        ).all()
+        assert balances == [150, 175]
+        totals = (
+            await test_db.execute(
+                select(User.total_earned, User.total_spent, User.tx_count).where(User.id == a)
+            )
+        ).one()
+        assert tuple(totals) == (75, 0, 2)
+
+    async def test_same_batch_id_is_applied_once(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test re-submitting a completed batch changes nothing"""
+        user_id = multiple_users[0].id
+        service = PointGrantService(test_db)
+
+        await service.apply_grants("event-2", parse_grant_rows(_lines(f"{user_id},10"), "csv"))
+        batch, _ = await service.apply_grants(
+            "event-2", parse_grant_rows(_lines(f"{user_id},10"), "csv")
+        )
+
+        assert batch.applied_count == 1
+        assert await _points(test_db, user_id) == 110
+        assert await test_db.scalar(select(func.count()).select_from(Transaction)) == 1
+
+    async def test_interrupted_batch_resumes_after_last_chunk(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test a re-run skips rows committed before a failure"""
+        a, b = multiple_users[0].id, multiple_users[1].id
+        lines = (f"{a},10", f"{b},20", f"{a},30")
+        service = PointGrantService(test_db)
+
+        async def failing_after_first_chunk():
+            async for row in parse_grant_rows(_lines(*lines), "csv"):
+                if row.line == 3:
+                    raise RuntimeError("Connection lost")
+                yield row
+
+        with pytest.raises(RuntimeError):
+            await service.apply_grants("event-3", failing_after_first_chunk(), chunk_size=2)
+
+        batch, _ = await service.apply_grants(
+            "event-3", parse_grant_rows(_lines(*lines), "csv"), chunk_size=2
+        )
+
+        assert batch.rows_processed == 3
+        assert await _points(test_db, a) == 140
+        assert await _points(test_db, b) == 220
+
+    async def test_unknown_batch(self, test_db: AsyncSession):
+        """Test looking up a batch that was never submitted"""
+        with pytest.raises(GrantBatchNotFoundError):
+            await PointGrantService(test_db).get_batch("missing")
@@ -0,0 +1,282 @@
+"""Unit tests for PointService"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import _apply_invalidation
+from src.core.leaderboard import rebuild_leaderboard
+from src.core.exceptions import InsufficientBalanceError, UserNotFoundError
+from src.models.points import PointEconomy, Transaction, TransactionType
+from src.models.user import User
+from src.schemas.points import PointEconomyUpdate
+from src.services.point_service import PointService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestEconomyConfig:
+    """Test suite for the cached point economy configuration"""
+
+    async def test_config_is_cached_after_first_read(
+        self, test_db: AsyncSession, test_economy: PointEconomy
+    ):
+        """Test later reads skip the database"""
+        service = PointService(test_db)
+        first = await service.get_economy_config()
+
+        await test_db.execute(update(PointEconomy).values(like_cost=-7))
+        await test_db.commit()
+
+        assert (await service.get_economy_config()) is first
+        assert first.like_cost != -7
+
+    async def test_default_config_is_created(self, test_db: AsyncSession):
+        """Test a missing row is created with defaults"""
+        economy = await PointService(test_db).get_economy_config()
+
+        assert economy.like_cost == -1
+        assert economy.crypto_reward_bnb_amount.startswith("0.01")
+
+    async def test_update_replaces_cached_config(
+        self, test_db: AsyncSession, test_economy: PointEconomy
+    ):
+        """Test an admin update is visible immediately and bumps the version"""
+        service = PointService(test_db)
+        before = await service.get_economy_config()
+
+        updated = await service.update_economy_config(PointEconomyUpdate(like_cost=-2))
+
+        assert updated.like_cost == -2
+        assert updated.version != before.version
+        assert (await service.get_economy_config()) is updated
+
+    async def test_update_ignores_null_fields(
+        self, test_db: AsyncSession, test_economy: PointEconomy
+    ):
+        """Test explicit nulls leave their settings unchanged"""
+        service = PointService(test_db)
+        before = await service.get_economy_config()
+
+        updated = await service.update_economy_config(
+            PointEconomyUpdate.model_validate({"like_cost": None, "registration_bonus": 150})
+        )
+
+        assert updated.like_cost == before.like_cost
+        assert updated.registration_bonus == 150
+
+    async def test_other_worker_version_evicts_snapshot(
+        self, test_db: AsyncSession, test_economy: PointEconomy
+    ):
+        """Test an invalidation for a different version forces a reload"""
+        service = PointService(test_db)
+        cached = await service.get_economy_config()
+
+        _apply_invalidation(f"economy:{cached.version}")
+        assert (await service.get_economy_config()) is cached
+
+        _apply_invalidation("economy:2099-01-01T00:00:00")
+        assert (await service.get_economy_config()) is not cached
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLedgerWrites:
+    """Test suite for conditional atomic balance updates"""
+
+    async def test_transaction_updates_balance_and_ledger(
+        self, test_db: AsyncSession, test_user: User
+    ):
+        """Test the ledger row records the balance returned by the update"""
+        transaction = await PointService(test_db).create_transaction(
+            user_id=test_user.id,
+            amount=-40,
+            transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+            description="Test deduction",
+        )
+
+        assert transaction.id is not None
+        assert transaction.balance_after == 60
+        # The loaded user is kept in step without a refresh
+        assert test_user.points == 60
+
+    async def test_overdraft_is_rejected_without_changes(
+        self, test_db: AsyncSession, test_user: User
+    ):
+        """Test the conditional update refuses to go below zero"""
+        user_id = test_user.id
+        with pytest.raises(InsufficientBalanceError):
+            await PointService(test_db).create_transaction(
+                user_id=user_id,
+                amount=-101,
+                transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                description="Too much",
+            )
+
+        await test_db.rollback()
+        points = await test_db.scalar(select(User.points).where(User.id == user_id))
+        assert points == 100
+        assert await test_db.scalar(select(func.count()).select_from(Transaction)) == 0
+
+    async def test_unknown_user(self, test_db: AsyncSession):
+        """Test a missing user is reported as such"""
+        with pytest.raises(UserNotFoundError):
+            await PointService(test_db).add_transaction(
+                user_id=999,
+                amount=5,
+                transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                description="Nobody",
+            )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestLeaderboard:
+    """Test suite for the Redis points leaderboard and its SQL fallback"""
+
+    @staticmethod
+    def _redis(*results):
+        redis = MagicMock()
+        redis.exists = AsyncMock(return_value=1)
+        redis.eval = AsyncMock()
+        redis.pipeline.return_value.execute = AsyncMock(side_effect=list(results))
+        return redis
+
+    async def test_sql_fallback(self, test_db: AsyncSession, multiple_users: list[User]):
+        """Test pages and ranks are computed in SQL without Redis"""
+        service = PointService(test_db)
+
+        entries, total = await service.get_leaderboard(page=1, page_size=2)
+        assert total == 5
+        assert [(e.rank, e.points) for e in entries] == [(1, 500), (2, 400)]
+
+        rank = await service.get_leaderboard_rank(multiple_users[1].id)
+        assert (rank.rank, rank.points, rank.total_users) == (4, 200, 5)
+
+    async def test_page_from_sorted_set(self, test_db: AsyncSession, multiple_users: list[User]):
+        """Test pages come from the sorted set and only hydrate user details"""
+        top, second = multiple_users[4], multiple_users[2]
+        redis = self._redis(([(str(top.id), 900.0), (str(second.id), 300.0)], 5))
+
+        with patch("src.core.session.redis_client", redis):
+            entries, total = await PointService(test_db).get_leaderboard(page=2, page_size=2)
+
+        assert total == 5
+        assert [(e.rank, e.user_id, e.points) for e in entries] == [
+            (3, top.id, 900),
+            (4, second.id, 300),
+        ]
+        assert entries[0].username == top.username
+        redis.pipeline.return_value.zrevrange.assert_called_once_with(
+            "leaderboard:points", 2, 3, withscores=True
+        )
+
+    async def test_rank_from_sorted_set(self, test_db: AsyncSession, test_user: User):
+        """Test "my rank" is a ZREVRANK lookup"""
+        redis = self._redis([0, 100.0, 12])
+
+        with patch("src.core.session.redis_client", redis):
+            rank = await PointService(test_db).get_leaderboard_rank(test_user.id)
+
+        assert (rank.rank, rank.points, rank.total_users) == (1, 100, 12)
+
+    async def test_transaction_updates_score(self, test_db: AsyncSession, test_user: User):
+        """Test committed balance changes are written to the sorted set"""
+        redis = self._redis()
+
+        with (
+            patch("src.core.session.redis_client", redis),
+            patch("src.services.point_service.refresh_principal_points", AsyncMock()),
+        ):
+            await PointService(test_db).create_transaction(
+                user_id=test_user.id,
+                amount=25,
+                transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                description="Bonus",
+            )
+
+        args = redis.eval.await_args.args
+        assert args[1:4] == (2, "leaderboard:points", "leaderboard:points:rebuild")
+        assert args[4:] == (test_user.id, 125)
+
+    async def test_rebuild_streams_active_users(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test the rebuild batches active users into a staging key and swaps it in"""
+        multiple_users[0].is_active = False
+        await test_db.commit()
+        redis = MagicMock()
+        for name in ("delete", "zadd", "zrem", "rename"):
+            setattr(redis, name, AsyncMock())
+
+        with patch("src.core.session.redis_client", redis):
+            count = await rebuild_leaderboard(test_db, batch_size=3)
+
+        assert count == 4
+        batches = [call.args[1] for call in redis.zadd.await_args_list[1:]]
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert str(multiple_users[0].id) not in {k for batch in batches for k in batch}
+        redis.rename.assert_awaited_once_with("leaderboard:points:rebuild", "leaderboard:points")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPointTotals:
+    """Test suite for lifetime totals maintained by ledger writes"""
+
+    async def test_summary_reads_maintained_totals(self, test_db: AsyncSession, test_user: User):
+        """Test each ledger write updates the totals the summary reports"""
+        service = PointService(test_db)
+        for amount in (30, -10, -5):
+            await service.create_transaction(
+                user_id=test_user.id,
+                amount=amount,
+                transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                description="Adjustment",
+            )
+
+        summary = await service.get_user_points_summary(test_user.id)
+
+        assert summary["current_points"] == 115
+        assert (summary["total_earned"], summary["total_spent"]) == (30, 15)
+        assert summary["transactions_count"] == 3
+
+    async def test_reconcile_corrects_drift(
+        self, test_db: AsyncSession, multiple_users: list[User]
+    ):
+        """Test reconciliation rewrites only totals that disagree with the ledger"""
+        service = PointService(test_db)
+        first, second = multiple_users[0].id, multiple_users[1].id
+        await service.create_transaction(
+            user_id=first,
+            amount=-40,
+            transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+            description="Penalty",
+        )
+        # Ledger row written without going through the service
+        test_db.add(
+            Transaction(
+                user_id=second,
+                amount=25,
+                transaction_type=TransactionType.ADMIN_ADJUSTMENT,
+                description="Manual fix",
+                balance_after=225,
+            )
+        )
+        await test_db.commit()
+
+        assert await service.reconcile_point_totals(batch_size=2) == 1
+        assert await service.reconcile_point_totals() == 0
+
+        summary = await service.get_user_points_summary(second)
+        assert (summary["total_earned"], summary["total_spent"]) == (25, 0)
+        assert summary["transactions_count"] == 1
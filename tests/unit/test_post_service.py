@@ -0,0 +1,124 @@
+"""Unit tests for PostService"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import InvalidCursorError
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.ranking import hot_score
+from src.models.content import Post
+from src.schemas.post import PostSortBy
+from src.services.post_service import PostService
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestPostKeysetPagination:
+    """Test suite for cursor-based post listing"""
+
+    async def _walk(self, service: PostService, sort_by: PostSortBy, page_size: int) -> list[int]:
+        """Follow next_cursor until exhausted, returning post IDs in order"""
+        seen = []
+        cursor = None
+        while True:
+            posts, _ = await service.list_posts(page_size=page_size, sort_by=sort_by, cursor=cursor)
+            seen.extend(post.id for post in posts)
+            cursor = PostService.next_cursor(posts, page_size, sort_by)
+            if cursor is None:
+                return seen
+
+    @pytest.mark.parametrize("sort_by", list(PostSortBy))
+    async def test_cursor_walk_matches_offset(
+        self, test_db: AsyncSession, multiple_posts: list[Post], sort_by: PostSortBy
+    ):
+        """Test walking cursors yields the same order as one unpaginated query"""
+        service = PostService(test_db)
+        expected, total = await service.list_posts(page_size=100, sort_by=sort_by)
+
+        assert total == len(multiple_posts)
+        assert await self._walk(service, sort_by, page_size=3) == [post.id for post in expected]
+
+    async def test_ties_are_broken_by_id(self, test_db: AsyncSession, multiple_posts: list[Post]):
+        """Test rows sharing a sort value are neither skipped nor repeated"""
+        service = PostService(test_db)
+        ids = await self._walk(service, PostSortBy.POPULAR, page_size=4)
+
+        assert ids == sorted((post.id for post in multiple_posts), reverse=True)
+
+    async def test_cursor_rejected_for_other_sort(
+        self, test_db: AsyncSession, multiple_posts: list[Post]
+    ):
+        """Test a cursor cannot be replayed against a different sort order"""
+        service = PostService(test_db)
+        posts, _ = await service.list_posts(page_size=2, sort_by=PostSortBy.CREATED_DESC)
+        cursor = PostService.next_cursor(posts, 2, PostSortBy.CREATED_DESC)
+
+        with pytest.raises(InvalidCursorError):
+            await service.list_posts(page_size=2, sort_by=PostSortBy.POPULAR, cursor=cursor)
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Test suite for opaque cursor encoding"""
+
+    def test_round_trip(self):
+        """Test integer sort values survive encoding"""
+        cursor = encode_cursor("popular", 42, 7)
+
+        assert decode_cursor(cursor, "popular") == (42, 7)
+
+    def test_garbage_rejected(self):
+        """Test malformed cursors raise InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor", "popular")
+
+
+@pytest.mark.unit
+class TestHotScore:
+    """Test suite for hot score ranking"""
+
+    def test_score_decays_with_age(self):
+        """Test equal engagement ranks newer posts higher"""
+        now = datetime.utcnow()
+
+        fresh = hot_score(10, 2, now, now)
+        stale = hot_score(10, 2, now - timedelta(days=1), now)
+
+        assert fresh > stale > 0
+
+    def test_engagement_raises_score(self):
+        """Test likes and comments both raise the score"""
+        now = datetime.utcnow()
+
+        assert hot_score(5, 0, now, now) > hot_score(0, 0, now, now)
+        assert hot_score(0, 5, now, now) > hot_score(5, 0, now, now)
+
+    @pytest.mark.asyncio
+    async def test_refresh_orders_hot_sort(self, test_db: AsyncSession, multiple_posts: list[Post]):
+        """Test refreshed scores drive PostSortBy.HOT in SQL"""
+        # Give the oldest post enough engagement to outrank the rest
+        oldest = multiple_posts[-1]
+        oldest.like_count = 500
+        await test_db.commit()
+
+        service = PostService(test_db)
+        assert await service.refresh_hot_scores() == len(multiple_posts)
+
+        posts, _ = await service.list_posts(page_size=3, sort_by=PostSortBy.HOT)
+        assert posts[0].id == oldest.id
+        assert posts[1].id == multiple_posts[0].id
+
+    @pytest.mark.asyncio
+    async def test_refresh_keeps_updated_at(self, test_db: AsyncSession, test_post: Post):
+        """Test a score refresh is not recorded as an edit"""
+        edited_at = datetime.utcnow() - timedelta(hours=3)
+        test_post.updated_at = edited_at
+        await test_db.commit()
+
+        assert await PostService(test_db).refresh_hot_scores() == 1
+
+        await test_db.refresh(test_post)
+        assert test_post.updated_at == edited_at
+        assert test_post.hot_score > 0
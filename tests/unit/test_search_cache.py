@@ -0,0 +1,148 @@
+"""Unit tests for the search result cache"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import search_cache
+from src.core.config import config
+from src.core.search_cache import cached_search, invalidate_search, normalize_query
+from src.models.content import Post
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def empty_search_cache():
+    """Start and end each test with no cached, in-flight or bumped searches"""
+
+    def reset():
+        search_cache.search_cache.clear()
+        search_cache._generations.clear()
+        search_cache._in_flight.clear()
+
+    reset()
+    yield
+    reset()
+
+
+@pytest.mark.unit
+class TestNormalizeQuery:
+    """Test suite for cache key normalization"""
+
+    def test_case_and_whitespace_insensitive(self):
+        """Test equivalent queries share a key"""
+        assert normalize_query("  Proof   of\tSTAKE ") == "proof of stake"
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestCachedSearch:
+    """Test suite for cached, single-flighted searches"""
+
+    async def test_hit_until_scope_invalidated(self):
+        """Test results are reused until a write to a table they read"""
+        search = AsyncMock(side_effect=[["first"], ["second"], ["third"]])
+
+        assert await cached_search([search_cache.POSTS], "k", search) == ["first"]
+        assert await cached_search([search_cache.POSTS], "k", search) == ["first"]
+
+        await invalidate_search(search_cache.COMMENTS)
+        assert await cached_search([search_cache.POSTS], "k", search) == ["first"]
+
+        await invalidate_search(search_cache.POSTS)
+        assert await cached_search([search_cache.POSTS], "k", search) == ["second"]
+        assert search.await_count == 2
+
+    async def test_concurrent_misses_run_once(self):
+        """Test a burst of identical searches shares one run"""
+        release = asyncio.Event()
+        calls = 0
+
+        async def search():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return ["result"]
+
+        burst = [
+            asyncio.create_task(cached_search([search_cache.POSTS], "k", search)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*burst) == [["result"]] * 5
+        assert calls == 1
+
+    async def test_result_read_before_write_not_stored(self):
+        """Test a search overlapping a write is not served afterwards"""
+        search = AsyncMock(return_value=["fresh"])
+
+        async def racing_search():
+            await invalidate_search(search_cache.POSTS)
+            return ["stale"]
+
+        assert await cached_search([search_cache.POSTS], "k", racing_search) == ["stale"]
+        assert await cached_search([search_cache.POSTS], "k", search) == ["fresh"]
+
+    async def test_waiter_takes_over_from_cancelled_search(self):
+        """Test waiters rerun the search when the request running it is cancelled"""
+        started = asyncio.Event()
+
+        async def slow_search():
+            started.set()
+            await asyncio.sleep(60)
+
+        leader = asyncio.create_task(cached_search([search_cache.POSTS], "k", slow_search))
+        await started.wait()
+        waiter = asyncio.create_task(
+            cached_search([search_cache.POSTS], "k", AsyncMock(return_value=["retried"]))
+        )
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.wait_for(waiter, timeout=5) == ["retried"]
+
+    async def test_uncacheable_result_not_stored(self):
+        """Test results rejected by the predicate are searched again"""
+        search = AsyncMock(side_effect=[["partial"], ["full"]])
+
+        def complete(result):
+            return result != ["partial"]
+
+        assert await cached_search([search_cache.POSTS], "k", search, complete) == ["partial"]
+        assert await cached_search([search_cache.POSTS], "k", search, complete) == ["full"]
+
+    async def test_disabled(self):
+        """Test every search runs when the cache is off"""
+        search = AsyncMock(return_value=["result"])
+
+        with patch.object(config.cache, "search_enabled", False):
+            await cached_search([search_cache.POSTS], "k", search)
+            await cached_search([search_cache.POSTS], "k", search)
+
+        assert search.await_count == 2
+
+    async def test_route_serves_cached_page(
+        self, async_client, test_db: AsyncSession, test_post: Post
+    ):
+        """Test equivalent queries hit the cache until posts are written"""
+        first = await async_client.get("/api/v1/search/posts", params={"q": "Test Post"})
+
+        test_post.title = "Renamed"
+        await test_db.commit()
+        cached = await async_client.get("/api/v1/search/posts", params={"q": "  test   POST"})
+
+        await invalidate_search(search_cache.POSTS)
+        fresh = await async_client.get("/api/v1/search/posts", params={"q": "test post"})
+
+        assert first.json()["posts"][0]["title"] == "Test Post"
+        assert cached.json() == first.json()
+        assert [post["title"] for post in fresh.json()["posts"]] == ["Renamed"]
@@ -0,0 +1,199 @@
+"""Unit tests for the embedded BM25 search index"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import search_index
+from src.core.config import config
+from src.core.search_index import InvertedIndex, highlight, tokenize
+from src.models.user import User
+from src.schemas.comment import CommentCreate
+from src.schemas.post import PostCreate, PostUpdate
+from src.services.comment_service import CommentService
+from src.services.post_service import PostService
+from src.services.search_service import SearchService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.fixture
+def embedded_search(tmp_path):
+    """Use the embedded engine with a fresh index directory"""
+    with (
+        patch.object(config.search, "engine", "embedded"),
+        patch.object(config.search, "index_dir", str(tmp_path)),
+    ):
+        yield tmp_path
+    for index in search_index._indexes.values():
+        index.close()
+    search_index._indexes.clear()
+
+
+def _ids(hits):
+    return [doc_id for doc_id, _ in hits]
+
+
+@pytest.mark.unit
+class TestTokenize:
+    """Test suite for tokenization and highlighting"""
+
+    def test_tokenize(self):
+        """Test tokens are lowercased words without stopwords"""
+        assert tokenize("The Quick, brown FOX of 2024!") == ["quick", "brown", "fox", "2024"]
+        assert tokenize(None) == []
+
+    def test_highlight_marks_terms_and_escapes(self):
+        """Test matched words are marked and the rest is escaped"""
+        assert highlight("Fox <b>and</b> foxes", "fox") == (
+            "<mark>Fox</mark> &lt;b&gt;and&lt;/b&gt; foxes"
+        )
+
+    def test_highlight_windows_long_text(self):
+        """Test long text is cut around the first match"""
+        text = "filler " * 50 + "the rare word " + "tail " * 50
+
+        snippet = highlight(text, "rare", length=60)
+
+        assert snippet.startswith("…") and snippet.endswith("…")
+        assert "<mark>rare</mark>" in snippet
+        assert len(snippet.replace("<mark>", "").replace("</mark>", "")) <= 62
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestInvertedIndex:
+    """Test suite for the segment + delta index"""
+
+    async def test_bm25_ranking(self, tmp_path):
+        """Test rarer and more frequent terms rank higher"""
+        index = InvertedIndex(tmp_path / "posts.idx")
+        index.update(1, tokenize("ethereum gas fees are high"))
+        index.update(2, tokenize("ethereum ethereum staking rewards"))
+        index.update(3, tokenize("bitcoin fees"))
+
+        hits, total = index.search("ethereum staking")
+
+        assert total == 2
+        assert _ids(hits) == [2, 1]
+        assert index.search("solana") == ([], 0)
+
+    async def test_flush_persists_and_masks_changes(self, tmp_path):
+        """Test changes after a flush mask the mapped segment"""
+        path = tmp_path / "posts.idx"
+        index = InvertedIndex(path)
+        index.update(1, tokenize("alpha beta"))
+        index.update(2, tokenize("beta gamma"))
+        assert await index.flush()
+        assert index.segment.doc_count == 2 and not index.dirty
+
+        index.update(1, tokenize("delta"))
+        index.remove(2)
+        index.update(3, tokenize("beta"))
+
+        assert _ids(index.search("beta")[0]) == [3]
+        assert _ids(index.search("delta")[0]) == [1]
+        assert index.doc_count == 2
+
+        await index.flush()
+        reopened = InvertedIndex(path)
+        # Equal scores: the newer document first
+        assert _ids(reopened.search("beta delta")[0]) == [3, 1]
+        assert reopened.search("alpha") == ([], 0)
+        assert reopened.doc_count == 2
+        index.close()
+        reopened.close()
+
+    async def test_changes_during_flush_stay_pending(self, tmp_path):
+        """Test writes made while a merge is written survive the swap"""
+        index = InvertedIndex(tmp_path / "posts.idx")
+        index.update(1, tokenize("first version"))
+
+        async def write_with_concurrent_update(func, *args):
+            index.update(1, tokenize("second version"))
+            index.update(2, tokenize("brand new"))
+            func(*args)
+
+        with patch("src.core.search_index.asyncio.to_thread", write_with_concurrent_update):
+            await index.flush()
+
+        assert index.segment.doc_count == 1
+        assert index.search("first") == ([], 0)
+        assert _ids(index.search("second new")[0]) == [2, 1]
+        assert index.doc_count == 2
+        index.close()
+
+    async def test_adopts_rebuilt_file(self, tmp_path):
+        """Test a file replaced on disk is picked up on the next flush"""
+        path = tmp_path / "posts.idx"
+        index = InvertedIndex(path)
+        index.update(1, tokenize("old"))
+        await index.flush()
+
+        rebuilt = InvertedIndex(path)
+        rebuilt.remove(1)
+        rebuilt.update(2, tokenize("fresh"))
+        await rebuilt.flush()
+        rebuilt.close()
+
+        assert index.is_stale()
+        await index.flush()
+        assert index.search("old") == ([], 0)
+        assert _ids(index.search("fresh")[0]) == [2]
+        index.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestEmbeddedSearch:
+    """Test suite for SearchService on the embedded engine"""
+
+    async def test_post_writes_update_index(
+        self, test_db: AsyncSession, test_user: User, embedded_search
+    ):
+        """Test create, update and delete are reflected in search"""
+        user_id = test_user.id
+        posts = PostService(test_db)
+        search = SearchService(test_db)
+
+        post = await posts.create_post(
+            PostCreate(title="Staking guide", body="How validators earn staking rewards"), user_id
+        )
+        other = await posts.create_post(
+            PostCreate(title="Gas fees", body="Why fees spike during staking launches"), user_id
+        )
+
+        found, total = await search.search_posts("staking")
+        assert total == 2
+        assert [p.id for p in found] == [post.id, other.id]
+
+        await posts.update_post(post.id, PostUpdate(title="Validator guide"), user_id)
+        found, _ = await search.search_posts("validator")
+        assert [p.id for p in found] == [post.id]
+
+        await posts.delete_post(other.id, user_id)
+        found, total = await search.search_posts("fees")
+        assert (found, total) == ([], 0)
+
+    async def test_comments_and_rebuild(
+        self, test_db: AsyncSession, test_post, test_user: User, embedded_search
+    ):
+        """Test comment search and a rebuild from the database"""
+        post_id, user_id = test_post.id, test_user.id
+        comment = await CommentService(test_db).create_comment(
+            post_id, CommentCreate(body="Great write-up on zero knowledge proofs"), user_id
+        )
+
+        found, total = await SearchService(test_db).search_comments("knowledge")
+        assert total == 1 and [c.id for c in found] == [comment.id]
+
+        assert await search_index.rebuild_search_index(test_db, search_index.POSTS) == 1
+        assert (embedded_search / "posts.idx").exists()
+        found, _ = await SearchService(test_db).search_posts("test")
+        assert [p.id for p in found] == [post_id]
@@ -0,0 +1,201 @@
+"""Unit tests for SearchService"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.schema import CreateIndex
+
+from src.core import fulltext
+from src.core.counting import CountStrategy
+from src.core.database import get_session_factory
+from src.main import app
+from src.models.content import Comment, Post
+from src.models.user import User
+from src.services.search_service import SearchService, unified_search
+
+
+@pytest.mark.unit
+class TestFullText:
+    """Test suite for the PostgreSQL full-text expressions"""
+
+    def test_match_and_rank_use_search_vector(self):
+        """Test queries filter and rank on the generated search vector"""
+        stmt = (
+            select(Post.id)
+            .where(fulltext.matches(Post, '"proof of stake" -bitcoin'))
+            .order_by(fulltext.rank(Post, '"proof of stake" -bitcoin').desc())
+        )
+
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert "posts.search_vector @@ websearch_to_tsquery(" in sql
+        assert "ts_rank(posts.search_vector, websearch_to_tsquery(" in sql
+        assert "::REGCONFIG" in sql
+
+    def test_user_similarity_ranks_best_name(self):
+        """Test users rank by the closer of username and display name"""
+        expression = fulltext.similarity("alice", User.username, User.display_name)
+
+        sql = str(expression.compile(dialect=postgresql.dialect()))
+
+        assert sql.startswith("greatest(similarity(users.username, ")
+        assert "similarity(users.display_name, " in sql
+
+    def test_user_trigram_indexes_created_with_table(self):
+        """Test create_all adds pg_trgm GIN indexes on both name columns"""
+        statements = [
+            str(getattr(listener, "statement", ""))
+            for listener in User.__table__.dispatch.after_create
+        ]
+
+        assert "CREATE EXTENSION IF NOT EXISTS pg_trgm" in statements
+        for column in ("username", "display_name"):
+            assert (
+                f"CREATE INDEX IF NOT EXISTS idx_users_{column}_trgm "
+                f"ON users USING GIN ({column} gin_trgm_ops)"
+            ) in statements
+
+    def test_search_vector_created_with_tables(self):
+        """Test create_all adds the vector column and GIN index"""
+        for table in (Post.__table__, Comment.__table__):
+            ddl = [
+                listener
+                for listener in table.dispatch.after_create
+                if "search_vector" in str(getattr(listener, "statement", ""))
+            ]
+            assert len(ddl) == 2
+
+        # Gated to PostgreSQL: SQLite schemas (these tests) never get it
+        assert "search_vector" not in {column.name for column in Post.__table__.columns}
+        assert not any(
+            "search_vector" in str(CreateIndex(index)) for index in Post.__table__.indexes
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSearchFallback:
+    """Test suite for substring search on databases without full-text"""
+
+    async def test_search_posts(self, test_db: AsyncSession, test_post: Post):
+        """Test posts match on title or body"""
+        post_id = test_post.id
+        service = SearchService(test_db)
+
+        posts, total = await service.search_posts("test post", count_strategy=CountStrategy.EXACT)
+        missing, _ = await service.search_posts("nothing like it")
+
+        assert total == 1
+        assert [post.id for post in posts] == [post_id]
+        assert missing == []
+
+    async def test_search_comments(self, test_db: AsyncSession, test_comment: Comment):
+        """Test comments match on body"""
+        comment_id = test_comment.id
+
+        comments, total = await SearchService(test_db).search_comments(
+            "test comment", count_strategy=CountStrategy.EXACT
+        )
+
+        assert total == 1
+        assert [comment.id for comment in comments] == [comment_id]
+
+    async def test_search_users(self, test_db: AsyncSession, multiple_users: list[User]):
+        """Test users match on name and rank by points without trigrams"""
+        ids = [user.id for user in multiple_users]
+
+        users, total = await SearchService(test_db).search_users(
+            "user", count_strategy=CountStrategy.EXACT
+        )
+
+        assert total == len(ids)
+        assert [user.id for user in users] == ids[::-1]
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestUnifiedSearch:
+    """Test suite for concurrent unified search"""
+
+    @pytest.fixture
+    def sessions(self, test_engine):
+        """Session factory counting the sessions it opens"""
+        factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+        opened = []
+
+        def open_session():
+            opened.append(True)
+            return factory()
+
+        open_session.opened = opened
+        return open_session
+
+    async def test_runs_only_requested_sources(self, sessions, test_comment: Comment):
+        """Test each requested source gets its own session and no count"""
+        post_id = test_comment.post_id
+        strategies = []
+        search_posts = SearchService.search_posts
+
+        async def spy(self, query, page, page_size, count_strategy=None):
+            strategies.append(count_strategy)
+            return await search_posts(self, query, page, page_size, count_strategy)
+
+        with (
+            patch.object(SearchService, "search_posts", spy),
+            patch.object(SearchService, "search_comments", AsyncMock()) as search_comments,
+        ):
+            results, missing = await unified_search(sessions, "test", ["posts"], 3, 1.0)
+
+        assert [post.id for post in results["posts"]] == [post_id]
+        assert missing == []
+        assert strategies == [CountStrategy.NONE]
+        search_comments.assert_not_awaited()
+        assert len(sessions.opened) == 1
+
+    async def test_deadline_returns_partial_results(self, sessions, test_comment: Comment):
+        """Test a slow source is cancelled and left out"""
+        comment_id = test_comment.id
+        cancelled = asyncio.Event()
+
+        async def slow(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with patch.object(SearchService, "search_posts", slow):
+            results, missing = await unified_search(sessions, "test", ["posts", "comments"], 3, 0.2)
+
+        assert missing == ["posts"]
+        assert [comment.id for comment in results["comments"]] == [comment_id]
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    async def test_failed_source_is_left_out(self, sessions, test_post: Post):
+        """Test an error in one source does not fail the search"""
+        with patch.object(SearchService, "search_comments", AsyncMock(side_effect=RuntimeError)):
+            results, missing = await unified_search(sessions, "test", ["posts", "comments"], 3, 1.0)
+
+        assert missing == ["comments"]
+        assert len(results["posts"]) == 1
+
+    async def test_route_marks_partial_results(self, async_client, sessions, test_post: Post):
+        """Test the endpoint reports left-out sources in a header"""
+        app.dependency_overrides[get_session_factory] = lambda: sessions
+
+        with patch.object(SearchService, "search_comments", AsyncMock(side_effect=RuntimeError)):
+            response = await async_client.get(
+                "/api/v1/search", params={"q": "test", "types": "posts,comments"}
+            )
+        invalid = await async_client.get("/api/v1/search", params={"q": "test", "types": "users"})
+
+        assert response.status_code == 200
+        assert response.headers["X-Search-Partial"] == "comments"
+        body = response.json()
+        assert [result["type"] for result in body] == ["post"]
+        assert "<mark>test</mark>" in body[0]["excerpt"]
+        assert invalid.status_code == 422
@@ -0,0 +1,82 @@
+"""Unit tests for Redis session management
+
+Redis is mocked; these tests check which keys the session store touches.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core import session
+
+
+def make_pipeline(results):
+    """Create a mock Redis pipeline usable as an async context manager"""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=results)
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    return pipe
+
+
+@pytest.fixture
+def mock_redis():
+    """Patch the module-level Redis client"""
+    with patch("src.core.session.redis_client") as client:
+        yield client
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSessionIndex:
+    """Test suite for the per-user session index"""
+
+    async def test_create_session_indexes_user(self, mock_redis):
+        """Test new sessions are added to the user's index in one pipeline"""
+        pipe = make_pipeline([True, 0, 1, True])
+        mock_redis.pipeline.return_value = pipe
+
+        session_id = await session.create_session(42)
+
+        pipe.setex.assert_called_once()
+        assert pipe.setex.call_args.args[0] == f"session:{session_id}"
+        pipe.zadd.assert_called_once()
+        assert pipe.zadd.call_args.args[0] == "user_sessions:42"
+        assert session_id in pipe.zadd.call_args.args[1]
+        pipe.execute.assert_awaited_once()
+
+    async def test_get_session_count_reads_index_only(self, mock_redis):
+        """Test session count prunes expired entries and uses ZCARD"""
+        pipe = make_pipeline([2, 3])
+        mock_redis.pipeline.return_value = pipe
+
+        count = await session.get_session_count(42)
+
+        assert count == 3
+        pipe.zremrangebyscore.assert_called_once()
+        pipe.zcard.assert_called_once_with("user_sessions:42")
+        mock_redis.scan.assert_not_called()
+
+    async def test_invalidate_user_sessions_single_round_trip(self, mock_redis):
+        """Test logout-everywhere runs one script against the user's index"""
+        mock_redis.eval = AsyncMock(return_value=4)
+
+        deleted = await session.invalidate_user_sessions(42)
+
+        assert deleted == 4
+        mock_redis.eval.assert_awaited_once()
+        assert "user_sessions:42" in mock_redis.eval.call_args.args
+        mock_redis.scan.assert_not_called()
+
+    async def test_delete_session_returns_false_when_missing(self, mock_redis):
+        """Test deleting an unknown session reports nothing was removed"""
+        mock_redis.eval = AsyncMock(return_value=0)
+
+        assert await session.delete_session("missing") is False
+
+    async def test_no_redis_client(self):
+        """Test session helpers degrade gracefully without Redis"""
+        with patch("src.core.session.redis_client", None):
+            assert await session.get_session("abc") is None
+            assert await session.get_session_count(1) == 0
+            assert await session.invalidate_user_sessions(1) == 0
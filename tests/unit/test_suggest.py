@@ -0,0 +1,163 @@
+"""Unit tests for typeahead suggestions"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import suggest
+from src.models.content import ContentStatus, Post
+from src.models.organization import Channel, Tag
+from src.models.user import User
+from src.services.search_service import SearchService
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    """Run without Redis-backed caches"""
+    with patch("src.core.session.redis_client", None):
+        yield
+
+
+@pytest.mark.unit
+class TestPrefixes:
+    """Test suite for the prefixes labels are indexed under"""
+
+    def test_label_and_word_prefixes(self):
+        """Test a label completes from its start and from each word"""
+        found = suggest.prefixes("Proof-of-Stake, explained!")
+
+        assert "proof of st" in found
+        assert "stake expl" in found
+        assert "e" in found
+        assert "roof" not in found
+        assert len(found) == len(set(found))
+
+    def test_prefixes_are_capped(self):
+        """Test prefixes stop at the configured length"""
+        found = suggest.prefixes("Decentralized governance", max_length=5)
+
+        assert max(map(len, found)) == 5
+        assert "decen" in found
+        assert "gover" in found
+
+    def test_completes_long_queries(self):
+        """Test labels are matched against queries longer than any prefix"""
+        assert suggest.completes("Proof of Stake explained", "of stake exp")
+        assert not suggest.completes("Proof of Stake explained", "roof of")
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestSuggest:
+    """Test suite for serving suggestions"""
+
+    async def test_lookup_reads_live_generation(self):
+        """Test completions come from the prefix set of the live generation"""
+        redis = AsyncMock()
+        redis.get.return_value = "7"
+        redis.zrevrange.return_value = ["user:3", "post:9"]
+        redis.hmget.return_value = [
+            json.dumps({"type": "user", "id": 3, "text": "testuser", "url": "/profile/testuser"}),
+            None,
+        ]
+
+        with patch("src.core.session.redis_client", redis):
+            suggestions = await suggest.lookup("  Test ", 5)
+
+        redis.zrevrange.assert_awaited_once_with("suggest:7:p:test", 0, 4)
+        redis.hmget.assert_awaited_once_with("suggest:7:items", ["user:3", "post:9"])
+        assert [s["id"] for s in suggestions] == [3]
+
+    async def test_lookup_without_index(self):
+        """Test callers are told to fall back until the index is built"""
+        redis = AsyncMock()
+        redis.get.return_value = None
+
+        with patch("src.core.session.redis_client", redis):
+            assert await suggest.lookup("test", 5) is None
+
+        assert await suggest.lookup("test", 5) is None
+
+    async def test_writes_register_their_keys(self):
+        """Test every key a write creates is listed under its generation"""
+        pipe = MagicMock()
+        entry = suggest._entry(suggest.TAG, 1, "Go", None, 2)
+
+        touched = suggest._queue_add(pipe, "7", [entry])
+
+        assert touched == {"suggest:7:p:g", "suggest:7:p:go"}
+        pipe.sadd.assert_any_call("suggest:7:keys", "suggest:7:items", *touched)
+        pipe.sadd.assert_any_call(suggest.SUGGEST_GENERATIONS_KEY, "7")
+
+    async def test_drop_generations_deletes_listed_keys(self):
+        """Test old generations are deleted from their key sets, not by scanning"""
+        key_sets = {
+            "suggest:3:keys": [["suggest:3:items", "suggest:3:p:a"], ["suggest:3:p:ab"], []],
+            "suggest:5:keys": [[]],
+        }
+        redis = AsyncMock()
+        redis.smembers.return_value = {"3", "5", "7"}
+        redis.spop.side_effect = lambda key, count: key_sets[key].pop(0)
+
+        await suggest._drop_generations(redis, keep="7", batch_size=2)
+
+        redis.scan_iter.assert_not_called()
+        assert sorted(c.args for c in redis.srem.call_args_list) == [
+            (suggest.SUGGEST_GENERATIONS_KEY, "3"),
+            (suggest.SUGGEST_GENERATIONS_KEY, "5"),
+        ]
+        assert [c.args for c in redis.unlink.call_args_list] == [
+            ("suggest:3:items", "suggest:3:p:a"),
+            ("suggest:3:p:ab",),
+        ]
+
+    async def test_database_fallback(
+        self,
+        test_db: AsyncSession,
+        test_post: Post,
+        test_tag: Tag,
+        test_channel: Channel,
+    ):
+        """Test each kind of label is suggested, most popular first"""
+        test_post.like_count = 3
+        test_tag.post_count = 5
+        await test_db.commit()
+
+        suggestions = await SearchService(test_db).suggest("tes", 10)
+
+        assert [(s["type"], s["text"]) for s in suggestions] == [
+            ("user", "testuser"),
+            ("tag", "Test Tag"),
+            ("post", "Test Post"),
+            ("channel", "Test Channel"),
+        ]
+        assert suggestions[2]["url"] == f"/posts/{test_post.id}"
+        assert suggestions[3]["url"] == "/channel/test-channel"
+
+    async def test_database_fallback_skips_hidden(
+        self, test_db: AsyncSession, test_post: Post, multiple_users: list[User]
+    ):
+        """Test inactive posts and users are not suggested"""
+        test_post.status = ContentStatus.DELETED
+        multiple_users[4].is_active = False
+        await test_db.commit()
+
+        suggestions = await SearchService(test_db).suggest("post", 10)
+        users = await SearchService(test_db).suggest("user", 10)
+
+        assert suggestions == []
+        assert [s["text"] for s in users] == ["user3", "user2", "user1", "user0"]
+
+    async def test_suggest_route(self, async_client, multiple_users: list[User]):
+        """Test the route returns the most popular completions"""
+        response = await async_client.get(
+            "/api/v1/search/suggest", params={"q": "User", "limit": 2}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"type": "user", "id": multiple_users[4].id, "text": "user4", "url": "/profile/user4"},
+            {"type": "user", "id": multiple_users[3].id, "text": "user3", "url": "/profile/user3"},
+        ]
@@ -0,0 +1,53 @@
+"""Unit tests for buffered post view counts"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import view_counter
+from src.models.content import Post
+from src.services.post_service import PostService
+
+
+@pytest.fixture(autouse=True)
+def local_buffer():
+    """Buffer views in-process and start each test with an empty buffer"""
+    view_counter._local_pending.clear()
+    with patch("src.core.session.redis_client", None):
+        yield
+    view_counter._local_pending.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.unit
+class TestViewCounter:
+    """Test suite for write-behind view counting"""
+
+    async def test_view_is_buffered_not_written(self, test_db: AsyncSession, test_post: Post):
+        """Test a view shows immediately but leaves the row untouched"""
+        service = PostService(test_db)
+
+        await service.get_post_by_id(test_post.id, increment_view=True)
+        post = await service.get_post_by_id(test_post.id, increment_view=True)
+
+        assert post.view_count == 2
+        assert post not in test_db.dirty
+        stored = await test_db.scalar(
+            select(Post.view_count)
+            .where(Post.id == test_post.id)
+            .execution_options(populate_existing=True)
+        )
+        assert stored == 0
+
+    async def test_flush_applies_buffered_views(self, test_db: AsyncSession, test_post: Post):
+        """Test a flush folds the buffer into view_count and empties it"""
+        for _ in range(3):
+            await view_counter.record_view(test_post.id)
+
+        assert await view_counter.flush_views(test_db) == 1
+
+        stored = await test_db.scalar(select(Post.view_count).where(Post.id == test_post.id))
+        assert stored == 3
+        assert await view_counter.flush_views(test_db) == 0